@@ -0,0 +1,135 @@
+import threading
+from collections import deque
+
+from activities_service.catalog import ACTIVITIES
+
+BOOKED = "booked"
+WAITLISTED = "waitlisted"
+ALREADY_BOOKED = "already_booked"
+ALREADY_WAITLISTED = "already_waitlisted"
+WAITLIST_FULL = "waitlist_full"
+
+
+class UnknownActivityError(KeyError):
+    pass
+
+
+class ActivitySlots:
+    __slots__ = ("lock", "capacity", "reserved", "participants", "waitlist", "waiting", "waitlist_limit")
+
+    def __init__(self, capacity, reserved=0, waitlist_limit=None):
+        self.lock = threading.Lock()
+        self.capacity = capacity
+        self.reserved = reserved        # peserta yang terdaftar di luar engine (data awal)
+        self.participants = {}          # user -> None, dict sebagai ordered set
+        self.waitlist = deque()
+        self.waiting = set()
+        self.waitlist_limit = waitlist_limit
+
+    def taken(self):
+        return self.reserved + len(self.participants)
+
+
+class BookingEngine:
+    # Satu lock per kegiatan: pemesanan kegiatan berbeda tidak saling menunggu, dan
+    # cek kapasitas + pencatatan peserta terjadi atomik sehingga tidak pernah overbooking.
+    def __init__(self, waitlist_limit=None):
+        self.waitlist_limit = waitlist_limit
+        self.activities = {}
+        self.user_bookings = {}     # user -> set id kegiatan
+        self.registry_lock = threading.Lock()
+        self.user_lock = threading.Lock()
+
+    def register(self, activity_id, capacity, reserved=0):
+        with self.registry_lock:
+            slots = self.activities.get(activity_id)
+            if slots is None:
+                slots = self.activities[activity_id] = ActivitySlots(capacity, reserved, self.waitlist_limit)
+            return slots
+
+    def _slots(self, activity_id):
+        slots = self.activities.get(activity_id)
+        if slots is None:
+            raise UnknownActivityError(activity_id)
+        return slots
+
+    def _remember(self, user, activity_id, booked):
+        # Dipanggil selagi slots.lock dipegang (urutan lock: slots.lock lalu user_lock), supaya
+        # user_bookings berubah atomik bersama daftar peserta. Di luar lock, pengguna yang baru
+        # dipromosikan bisa membatalkan sebelum promosinya tercatat dan tertinggal di user_bookings.
+        with self.user_lock:
+            bookings = self.user_bookings.setdefault(user, set())
+            if booked:
+                bookings.add(activity_id)
+            else:
+                bookings.discard(activity_id)
+
+    def book(self, activity_id, user):
+        slots = self._slots(activity_id)
+        with slots.lock:
+            if user in slots.participants:
+                return ALREADY_BOOKED
+            if user in slots.waiting:
+                return ALREADY_WAITLISTED
+            if slots.taken() < slots.capacity:
+                slots.participants[user] = None
+                self._remember(user, activity_id, True)
+                return BOOKED
+            if slots.waitlist_limit is not None and len(slots.waitlist) >= slots.waitlist_limit:
+                return WAITLIST_FULL
+            slots.waitlist.append(user)
+            slots.waiting.add(user)
+            return WAITLISTED
+
+    def cancel(self, activity_id, user):
+        # Mengembalikan (dibatalkan?, pengguna daftar tunggu yang dipromosikan atau None)
+        slots = self._slots(activity_id)
+        promoted = None
+        with slots.lock:
+            if user in slots.waiting:
+                slots.waiting.discard(user)
+                slots.waitlist.remove(user)
+                return True, None
+            if user not in slots.participants:
+                return False, None
+            del slots.participants[user]
+            if slots.waitlist and slots.taken() < slots.capacity:
+                promoted = slots.waitlist.popleft()
+                slots.waiting.discard(promoted)
+                slots.participants[promoted] = None
+            self._remember(user, activity_id, False)
+            if promoted is not None:
+                self._remember(promoted, activity_id, True)
+        return True, promoted
+
+    def count(self, activity_id):
+        return self._slots(activity_id).taken()
+
+    def capacity(self, activity_id):
+        return self._slots(activity_id).capacity
+
+    def is_booked(self, activity_id, user):
+        return user in self._slots(activity_id).participants
+
+    def waitlist_position(self, activity_id, user):
+        slots = self._slots(activity_id)
+        with slots.lock:
+            if user not in slots.waiting:
+                return None
+            return slots.waitlist.index(user) + 1
+
+    def bookings_for(self, user):
+        with self.user_lock:
+            return set(self.user_bookings.get(user, ()))
+
+
+_default_engine = None
+
+
+def default_booking_engine():
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = BookingEngine()
+        for activity in ACTIVITIES:
+            _default_engine.register(activity["id"], activity["capacity"], activity["participants"])
+    return _default_engine
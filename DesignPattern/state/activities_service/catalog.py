@@ -0,0 +1,83 @@
+from geo import GeoGrid
+from activities_service.schedule import ScheduleIndex, parse_schedule, format_schedule
+
+# Tahun jadwal katalog. Teks jadwal tidak menulis tahun, dan menebaknya dari tanggal hari ini membuat
+# jadwal bergeser tiap tahun (bahkan bisa ke tahun mendatang), jadi katalog selalu dibaca dengan tahun ini.
+CATALOG_YEAR = 2024
+
+ACTIVITIES = [
+    {
+        "id": 1,
+        "name": "Yoga Pagi",
+        "time": "Senin, 3 Juni (07:00 - 09:00) WIB",
+        "location": "Taman Komunitas",
+        "lat": -6.1766,
+        "lon": 106.8283,
+        "photo": "🧘",
+        "description": "Sesi yoga lembut untuk memulai hari.",
+        "participants": 10,
+        "capacity": 20
+    },
+    {
+        "id": 2,
+        "name": "Kelas Memasak",
+        "time": "Selasa, 4 Juni (11:00 - 13.00 WIB)",
+        "location": "Dapur Pusat Lansia",
+        "lat": -6.2088,
+        "lon": 106.8456,
+        "photo": "👩‍🍳",
+        "description": "Belajar memasak makanan sehat bersama.",
+        "participants": 8,
+        "capacity": 12
+    },
+    {
+        "id": 3,
+        "name": "Terapi Seni",
+        "time": "Rabu, 5 Juni (14:00 - 15:00 WIB)",
+        "location": "Aula Seni",
+        "lat": -6.1890,
+        "lon": 106.8375,
+        "photo": "🎨",
+        "description": "Ekspresikan emosi melalui lukisan.",
+        "participants": 12,
+        "capacity": 15
+    }
+]
+
+
+# Jadwal teks bebas diubah sekali menjadi datetime (WIB) dan ditampilkan dengan format seragam
+for _activity in ACTIVITIES:
+    _activity["start"], _activity["end"] = parse_schedule(_activity["time"], CATALOG_YEAR)
+    _activity["time"] = format_schedule(_activity["start"], _activity["end"])
+
+
+def list_activities():
+    return [dict(activity) for activity in ACTIVITIES]
+
+
+def get_activity(activity_id):
+    for activity in ACTIVITIES:
+        if activity["id"] == activity_id:
+            return dict(activity)
+    return None
+
+
+_default_schedule = None
+_default_places = None
+
+
+def default_schedule():
+    global _default_schedule
+    if _default_schedule is None:
+        _default_schedule = ScheduleIndex(
+            (activity["id"], activity["start"], activity["end"]) for activity in ACTIVITIES
+        )
+    return _default_schedule
+
+
+def default_places():
+    global _default_places
+    if _default_places is None:
+        _default_places = GeoGrid()
+        _default_places.bulk_load((activity["id"], activity["lat"], activity["lon"]) for activity in ACTIVITIES)
+    return _default_places
@@ -1,19 +1,61 @@
-from activities_service.states import FindActivityState, BookActivityState
+from render import default_renderer
+from events import default_event_log
+from metrics import instrumented
+from console import default_input
+from notifications_service.inbox import default_hub
+from activities_service.booking import default_booking_engine
+from activities_service.catalog import default_schedule, default_places
+from activities_service.reminders import default_reminders
+from dashboard_service.store import default_dashboard_store
+from search import default_search_index
+from services import LazyState
 
+@instrumented
 class ActivityContext:
-    def __init__(self, username=""):
+    find_activity_state = LazyState("activities_service.states:FindActivityState")
+    book_activity_state = LazyState("activities_service.states:BookActivityState")
+    cancel_booking_state = LazyState("activities_service.states:CancelBookingState")
+
+    __slots__ = ("username", "input_provider", "renderer", "booking_engine", "schedule", "location",
+                 "places", "notification_hub", "search_index", "activities", "selected_activity", "dashboards",
+                 "reminders", "events", "state")
+    SNAPSHOT_FIELDS = ("location", "selected_activity")
+    SERVICE = "activities"
+
+    def __init__(self, username="", notification_hub=None, booking_engine=None, schedule=None,
+                 location=None, places=None, search_index=None, input_provider=None, renderer=None, events=None,
+                 dashboards=None, reminders=None):
         self.username = username
+        self.input_provider = input_provider if input_provider is not None else default_input()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        self.booking_engine = booking_engine if booking_engine is not None else default_booking_engine()
+        self.schedule = schedule if schedule is not None else default_schedule()
+        self.location = location      # (lat, lon) pengguna, None = lokasi bawaan
+        self.places = places if places is not None else default_places()
+        self.notification_hub = notification_hub if notification_hub is not None else default_hub()
+        self.search_index = search_index if search_index is not None else default_search_index()
+        self.dashboards = dashboards if dashboards is not None else default_dashboard_store()
+        self.reminders = reminders if reminders is not None else default_reminders()
         self.activities = []
         self.selected_activity = None
-        self.booked = False
-
-        self.find_activity_state = FindActivityState(self)
-        self.book_activity_state = BookActivityState(self)
 
         self.state = self.find_activity_state
 
     def set_state(self, state):
+        self.events.transition(self, state)
         self.state = state
 
-    def request(self):
-        self.state.handle()
+    def show(self, view):
+        self.renderer.render(view)
+
+    def ask(self, prompt=""):
+        # Output yang tertunda harus tampil sebelum prompt
+        self.renderer.flush()
+        return self.input_provider.ask(prompt)
+
+    def request(self, **options):
+        view = self.state.handle(self, **options)
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
@@ -0,0 +1,473 @@
+import heapq
+import math
+import sqlite3
+import threading
+import time
+from array import array
+
+from storage import data_path
+from notifications_service.inbox import default_hub
+from activities_service.catalog import get_activity
+
+# Pengingat kegiatan: untuk setiap pesanan dijadwalkan pengingat REMINDER_OFFSETS detik sebelum
+# kegiatan dimulai. Pengingat yang menunggu disimpan di roda waktu bertingkat (sisip, batal dan picu
+# O(1)), disimpan ke SQLite secara bertahap agar selamat dari restart, dan yang sudah jatuh tempo
+# dikirim ke hub notifikasi per kelompok (kegiatan, offset) lewat push_many.
+
+REMINDER_OFFSETS = (24 * 3600, 3600)
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+LEVELS = 5                  # 64^5 detik ~ 34 tahun; lebih jauh dari itu masuk heap
+DELIVERY_BATCH = 1000       # penerima per push_many
+FLUSH_BATCH = 100_000       # pesanan berubah sebelum ditulis ke store
+COMPACT_MIN = 1_000_000     # id mati minimal sebelum array dipadatkan
+
+
+class TimerWheel:
+    # Roda waktu bertingkat (Varghese & Lauck): LEVELS tingkat x 64 slot, satu tick = satu detik.
+    # Slot tingkat L mencakup 64^L tick; timer masuk ke tingkat dari bit tertinggi yang berbeda
+    # antara jatuh temponya dan tick sekarang. Saat tick melewati batas putaran tingkat L, slot
+    # tingkat itu diturunkan (cascade) ke tingkat di bawahnya. Pembatalan hanya menandai id;
+    # id yang sudah mati dibuang saat slotnya diproses.
+    def __init__(self, tick=0):
+        self.tick = tick                # tick berikutnya yang akan diproses
+        # Slot berupa array id (8 byte per timer), bukan list objek int
+        self.levels = [[array("l") for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self.overflow = []              # heap (jatuh tempo, id) di luar jangkauan roda
+        self.late = []                  # jatuh tempo sebelum tick sekarang
+        self.dues = array("q")
+        self.live = bytearray()
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def insert(self, timer_id, due):
+        if timer_id == len(self.dues):
+            # Id baru berurutan (kasus umum dari ReminderScheduler)
+            self.dues.append(due)
+            self.live.append(1)
+        else:
+            missing = timer_id + 1 - len(self.dues)
+            if missing > 0:
+                self.dues.frombytes(bytes(8 * missing))
+                self.live.extend(bytes(missing))
+            self.dues[timer_id] = due
+            self.live[timer_id] = 1
+        self.count += 1
+        self._place(timer_id, due)
+
+    def _place(self, timer_id, due):
+        tick = self.tick
+        if due < tick:
+            self.late.append(timer_id)
+            return
+        level = ((due ^ tick).bit_length() - 1) // SLOT_BITS if due != tick else 0
+        if level >= LEVELS:
+            heapq.heappush(self.overflow, (due, timer_id))
+            return
+        self.levels[level][(due >> (SLOT_BITS * level)) & SLOT_MASK].append(timer_id)
+
+    def cancel(self, timer_id):
+        if timer_id < len(self.live) and self.live[timer_id]:
+            self.live[timer_id] = 0
+            self.count -= 1
+            return True
+        return False
+
+    def advance(self, until):
+        # Proses semua tick sampai dan termasuk `until`; kembalikan id yang jatuh tempo. Rentang
+        # tanpa timer dilompati, jadi biaya tidak bergantung pada lamanya jeda antar panggilan.
+        if not self.count:
+            # Hanya tersisa id yang sudah dibatalkan
+            self.tick = max(self.tick, until + 1)
+            return []
+        live, fired = self.live, []
+        if self.late:
+            late, self.late = self.late, []
+            for timer_id in late:
+                if live[timer_id]:
+                    live[timer_id] = 0
+                    fired.append(timer_id)
+        slots = self.levels[0]
+        tick = self._next(self.tick)
+        while tick <= until:
+            self.tick = tick
+            if not tick & SLOT_MASK:
+                self._cascade(tick)
+            slot = slots[tick & SLOT_MASK]
+            if slot:
+                slots[tick & SLOT_MASK] = array("l")
+                for timer_id in slot:
+                    if live[timer_id]:
+                        live[timer_id] = 0
+                        fired.append(timer_id)
+            tick = self._next(tick + 1)
+        self.tick = max(self.tick, until + 1)
+        self.count -= len(fired)
+        return fired
+
+    def _next(self, tick):
+        # Tick terdekat mulai dari `tick` yang punya slot berisi: slot tingkat 0 untuk dipicu, atau
+        # batas putaran tingkat L yang slotnya perlu diturunkan
+        levels = self.levels
+        if levels[0][tick & SLOT_MASK]:
+            return tick
+        for level in range(1, LEVELS):
+            # Di batas putaran, slot tingkat atas harus diturunkan dulu sebelum slot tingkat 0 berikutnya
+            shift = SLOT_BITS * level
+            if tick & ((1 << shift) - 1):
+                break
+            if levels[level][(tick >> shift) & SLOT_MASK]:
+                return tick
+        else:
+            span = SLOT_BITS * LEVELS
+            if self.overflow and not tick & ((1 << span) - 1) and self.overflow[0][0] >> span <= tick >> span:
+                return tick
+        for level in range(LEVELS):
+            shift = SLOT_BITS * level
+            index = (tick >> shift) & SLOT_MASK
+            if tick & ((1 << shift) - 1):
+                index += 1          # slot putaran ini sudah diturunkan
+            slots = levels[level]
+            for position in range(index, SLOTS):
+                if slots[position]:
+                    return (tick >> (shift + SLOT_BITS) << (shift + SLOT_BITS)) | (position << shift)
+        if self.overflow:
+            span = SLOT_BITS * LEVELS
+            return tick if not tick & ((1 << span) - 1) else ((tick >> span) + 1) << span
+        return math.inf
+
+    def _cascade(self, tick):
+        # Tingkat tertinggi lebih dulu, supaya timer bisa turun beberapa tingkat dalam satu tick
+        live, dues, levels = self.live, self.dues, self.levels
+        if not tick & ((1 << (SLOT_BITS * LEVELS)) - 1):
+            epoch = tick >> (SLOT_BITS * LEVELS)
+            while self.overflow and self.overflow[0][0] >> (SLOT_BITS * LEVELS) <= epoch:
+                due, timer_id = heapq.heappop(self.overflow)
+                if live[timer_id]:
+                    self._place(timer_id, due)
+        for level in range(LEVELS - 1, 0, -1):
+            if tick & ((1 << (SLOT_BITS * level)) - 1):
+                continue
+            index = (tick >> (SLOT_BITS * level)) & SLOT_MASK
+            slot = levels[level][index]
+            if slot:
+                levels[level][index] = array("l")
+                # _place versi inline: di sini jatuh tempo selalu >= tick dan berada di bawah tingkat ini
+                for timer_id in slot:
+                    if live[timer_id]:
+                        due = dues[timer_id]
+                        lower = ((due ^ tick).bit_length() - 1) // SLOT_BITS if due != tick else 0
+                        levels[lower][(due >> (SLOT_BITS * lower)) & SLOT_MASK].append(timer_id)
+
+class ReminderStore:
+    # Pengingat yang masih menunggu, satu baris per (pengguna, kegiatan, offset)
+    SCHEMA = ("CREATE TABLE IF NOT EXISTS reminders (username TEXT NOT NULL, activity_id INTEGER NOT NULL, "
+              "offset INTEGER NOT NULL, starts_at REAL NOT NULL, PRIMARY KEY (username, activity_id, offset)) "
+              "WITHOUT ROWID")
+    INSERT = "INSERT OR REPLACE INTO reminders (username, activity_id, offset, starts_at) VALUES (?, ?, ?, ?)"
+    DELETE = "DELETE FROM reminders WHERE username = ? AND activity_id = ?"
+    SELECT_ALL = "SELECT username, activity_id, offset, starts_at FROM reminders"
+    COUNT = "SELECT COUNT(*) FROM reminders"
+
+    def __init__(self, path=None):
+        self.path = path or data_path("reminders.db")
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(self.SCHEMA)
+
+    def save(self, bookings):
+        # bookings: {(pengguna, kegiatan): [(offset, mulai), ...] atau None bila tidak ada lagi}
+        deletes = list(bookings)
+        inserts = [(username, activity_id, offset, starts_at)
+                   for (username, activity_id), rows in bookings.items() if rows
+                   for offset, starts_at in rows]
+        with self.lock:
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.executemany(self.DELETE, deletes)
+                self.connection.executemany(self.INSERT, inserts)
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def load(self):
+        with self.lock:
+            return self.connection.execute(self.SELECT_ALL).fetchall()
+
+    def count(self):
+        with self.lock:
+            return self.connection.execute(self.COUNT).fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+
+def offset_label(offset):
+    if offset % 86400 == 0 and offset >= 2 * 86400:
+        return f"{offset // 86400} hari"
+    if offset % 3600 == 0:
+        return f"{offset // 3600} jam"
+    return f"{max(1, offset // 60)} menit"
+
+
+def reminder_text(activity, offset):
+    return (f"⏰ Pengingat: '{activity['name']}' dimulai {offset_label(offset)} lagi, "
+            f"{activity['time']} di {activity['location']}.")
+
+
+class ReminderScheduler:
+    # Data per pengingat disimpan di array paralel (id = indeks), bukan objek per pengingat, agar
+    # jutaan pengingat tetap hemat memori. Pengingat satu pesanan dirantai lewat `chain`, dan
+    # `bookings` menunjuk ke id pertamanya sehingga pembatalan pesanan O(jumlah offset).
+    def __init__(self, notification_hub=None, store=None, offsets=REMINDER_OFFSETS, clock=time.time,
+                 activities=None, batch_size=DELIVERY_BATCH, write_behind=False):
+        self.notification_hub = notification_hub if notification_hub is not None else default_hub()
+        self.store = store if store is not None else ReminderStore()
+        self.offsets = list(offsets)
+        self.clock = clock
+        self.activities = activities if activities is not None else get_activity
+        self.batch_size = batch_size
+        # Tanpa write-behind setiap perubahan langsung ditulis; dengan write-behind (thread latar aktif)
+        # perubahan dikumpulkan dan ditulis per interval atau setiap FLUSH_BATCH pesanan
+        self.write_behind = write_behind
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.users = {}                 # nama -> indeks
+        self.user_names = []
+        self.bookings = {}              # indeks pengguna << 32 | id kegiatan -> id pengingat pertama
+        self.dirty = {}                 # (pengguna, kegiatan) -> baris untuk store
+        self.texts = {}
+        self.delivered = self.skipped = 0
+        self._reset(math.floor(clock()))
+        self.polling = threading.Event()
+        self.poller = None
+        self._load()
+
+    def __len__(self):
+        return len(self.wheel)
+
+    def _reset(self, tick):
+        self.wheel = TimerWheel(tick)
+        self.user_ids = array("l")
+        self.activity_ids = array("l")
+        self.offset_ids = bytearray()
+        self.starts = array("d")
+        self.chain = array("l")         # id pengingat berikutnya dari pesanan yang sama, -1 = akhir
+
+    def _user(self, username):
+        index = self.users.get(username)
+        if index is None:
+            index = self.users[username] = len(self.user_names)
+            self.user_names.append(username)
+        return index
+
+    def _offset(self, offset):
+        if offset not in self.offsets:
+            self.offsets.append(offset)
+        return self.offsets.index(offset)
+
+    def _add(self, user, activity_id, offset_id, starts_at, following):
+        timer_id = len(self.user_ids)
+        self.user_ids.append(user)
+        self.activity_ids.append(activity_id)
+        self.offset_ids.append(offset_id)
+        self.starts.append(starts_at)
+        self.chain.append(following)
+        self.wheel.insert(timer_id, math.ceil(starts_at - self.offsets[offset_id]))
+        return timer_id
+
+    def _pending(self, head):
+        live, chain, timer_id, found = self.wheel.live, self.chain, head, []
+        while timer_id >= 0:
+            if live[timer_id]:
+                found.append(timer_id)
+            timer_id = chain[timer_id]
+        return found
+
+    def _rows(self, ids):
+        return [(self.offsets[self.offset_ids[timer_id]], self.starts[timer_id]) for timer_id in ids] or None
+
+    def _cancel(self, key):
+        head = self.bookings.pop(key, None)
+        if head is None:
+            return 0
+        cancelled = 0
+        for timer_id in self._pending(head):
+            cancelled += self.wheel.cancel(timer_id)
+        return cancelled
+
+    def schedule(self, username, activity_id, starts_at):
+        # Pengingat yang waktunya sudah lewat saat memesan tidak dijadwalkan; mengembalikan jumlahnya
+        now = self.clock()
+        with self.lock:
+            user = self._user(username)
+            key = user << 32 | activity_id
+            replaced = self._cancel(key)
+            head, rows = -1, []
+            for offset_id, offset in enumerate(self.offsets):
+                if starts_at - offset > now:
+                    head = self._add(user, activity_id, offset_id, starts_at, head)
+                    rows.append((offset, starts_at))
+            if head >= 0:
+                self.bookings[key] = head
+            if rows or replaced:
+                self.dirty[username, activity_id] = rows or None
+        self._maybe_flush()
+        return len(rows)
+
+    def cancel(self, username, activity_id):
+        with self.lock:
+            user = self.users.get(username)
+            if user is None:
+                return 0
+            cancelled = self._cancel(user << 32 | activity_id)
+            if cancelled:
+                self.dirty[username, activity_id] = None
+        self._maybe_flush()
+        return cancelled
+
+    def pending_for(self, username, activity_id):
+        # [(offset, waktu mulai)] pengingat yang masih menunggu untuk satu pesanan
+        with self.lock:
+            user = self.users.get(username)
+            head = self.bookings.get(user << 32 | activity_id) if user is not None else None
+            return self._rows(self._pending(head)) or [] if head is not None else []
+
+    def poll(self, now=None):
+        # Picu semua pengingat yang jatuh tempo sampai `now` lalu kirim per kelompok. Pengingat yang
+        # kegiatannya sudah dimulai (mis. tertunda karena server mati lama) dibuang.
+        now = self.clock() if now is None else now
+        groups = {}
+        with self.lock:
+            fired = self.wheel.advance(math.floor(now))
+            user_ids, activity_ids, offset_ids, starts = self.user_ids, self.activity_ids, self.offset_ids, self.starts
+            finished = set()
+            for timer_id in fired:
+                user, activity_id = user_ids[timer_id], activity_ids[timer_id]
+                finished.add(user << 32 | activity_id)
+                if starts[timer_id] <= now:
+                    self.skipped += 1
+                    continue
+                recipients = groups.get((activity_id, offset_ids[timer_id]))
+                if recipients is None:
+                    recipients = groups[activity_id, offset_ids[timer_id]] = []
+                recipients.append(self.user_names[user])
+            for key in finished:
+                self._settle(key)
+            if len(self.user_ids) - len(self.wheel) > max(len(self.wheel), COMPACT_MIN):
+                self._compact()
+
+        delivered = 0
+        for (activity_id, offset_id), recipients in groups.items():
+            text = self._text(activity_id, offset_id)
+            if text is None:
+                continue
+            for start in range(0, len(recipients), self.batch_size):
+                self.notification_hub.push_many(recipients[start:start + self.batch_size], "activity", text)
+            delivered += len(recipients)
+        self.delivered += delivered
+        self._maybe_flush()
+        return delivered
+
+    def _settle(self, key):
+        head = self.bookings.get(key)
+        if head is None:
+            return
+        ids = self._pending(head)
+        if not ids:
+            del self.bookings[key]
+        self.dirty[self.user_names[key >> 32], key & 0xFFFFFFFF] = self._rows(ids)
+
+    def _text(self, activity_id, offset_id):
+        text = self.texts.get((activity_id, offset_id))
+        if text is None:
+            activity = self.activities(activity_id)
+            if activity is None:
+                return None
+            text = self.texts[activity_id, offset_id] = reminder_text(activity, self.offsets[offset_id])
+        return text
+
+    def _compact(self):
+        # Id pengingat tidak dipakai ulang; setelah id mati lebih banyak daripada yang menunggu,
+        # array dan roda dibangun ulang hanya dari pengingat yang masih menunggu (O(n), diamortisasi)
+        old_wheel, old_chain = self.wheel, self.chain
+        old = (self.user_ids, self.activity_ids, self.offset_ids, self.starts)
+        self._reset(old_wheel.tick)
+        for key, head in self.bookings.items():
+            new_head, timer_id = -1, head
+            while timer_id >= 0:
+                if old_wheel.live[timer_id]:
+                    user, activity_id, offset_id, starts_at = (column[timer_id] for column in old)
+                    new_head = self._add(user, activity_id, offset_id, starts_at, new_head)
+                timer_id = old_chain[timer_id]
+            self.bookings[key] = new_head
+
+    def _load(self):
+        # Setelah restart: pengingat yang jatuh tempo selama server mati dikirim pada poll berikutnya
+        now = self.clock()
+        with self.lock:
+            heads = {}
+            for username, activity_id, offset, starts_at in self.store.load():
+                if starts_at <= now:
+                    self.dirty[username, activity_id] = None
+                    continue
+                user = self._user(username)
+                key = user << 32 | activity_id
+                heads[key] = self._add(user, activity_id, self._offset(offset), starts_at, heads.get(key, -1))
+            self.bookings.update(heads)
+
+    def _maybe_flush(self):
+        if not self.write_behind or len(self.dirty) >= FLUSH_BATCH:
+            self.flush()
+
+    def flush(self):
+        if not self.dirty:
+            return
+        with self.flush_lock:
+            with self.lock:
+                dirty, self.dirty = self.dirty, {}
+            if dirty:
+                self.store.save(dirty)
+
+    def start(self, interval=1.0):
+        # Thread latar yang memanggil poll() setiap `interval` detik
+        if self.poller is not None:
+            return
+        self.polling.clear()
+        self.write_behind = True
+
+        def loop():
+            while not self.polling.wait(interval):
+                self.poll()
+                self.flush()
+            self.flush()
+
+        self.poller = threading.Thread(target=loop, name="reminders", daemon=True)
+        self.poller.start()
+
+    def stop(self):
+        if self.poller is not None:
+            self.polling.set()
+            self.poller.join()
+            self.poller = None
+
+    def close(self):
+        self.stop()
+        self.flush()
+        self.store.close()
+
+
+_default_scheduler = None
+
+
+def default_reminders():
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = ReminderScheduler()
+    return _default_scheduler
@@ -0,0 +1,143 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time as clock, timedelta, timezone
+
+WIB = timezone(timedelta(hours=7), "WIB")
+
+DAYS = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu"]
+MONTHS = [
+    "Januari", "Februari", "Maret", "April", "Mei", "Juni",
+    "Juli", "Agustus", "September", "Oktober", "November", "Desember",
+]
+
+# Menerima "Senin, 3 Juni (07:00 - 09:00) WIB" maupun "Selasa, 4 Juni (11:00 - 13.00 WIB)"
+_PATTERN = re.compile(
+    r"(?:(?P<day>[A-Za-z]+),\s*)?(?P<date>\d{1,2})\s+(?P<month>[A-Za-z]+)(?:\s+(?P<year>\d{4}))?"
+    r".*?(?P<h1>\d{1,2})[:.](?P<m1>\d{2})\s*-\s*(?P<h2>\d{1,2})[:.](?P<m2>\d{2})"
+)
+
+
+def _guess_year(day_name, day, month, today=None):
+    # Tahun tidak ditulis: pilih tahun terdekat yang harinya cocok dengan nama hari
+    today = today or date.today()
+    if day_name in DAYS:
+        for offset in (0, 1, -1, 2, -2, 3, -3, 4, -4, 5, -5, 6, -6):
+            try:
+                candidate = date(today.year + offset, month, day)
+            except ValueError:
+                continue
+            if candidate.weekday() == DAYS.index(day_name):
+                return candidate.year
+    return today.year
+
+
+def parse_schedule(text, year=None):
+    match = _PATTERN.search(text)
+    if not match:
+        raise ValueError(f"Format jadwal tidak dikenali: {text!r}")
+
+    month_name = match["month"].capitalize()
+    if month_name not in MONTHS:
+        raise ValueError(f"Nama bulan tidak dikenali: {match['month']!r}")
+    month = MONTHS.index(month_name) + 1
+    day = int(match["date"])
+    year = year or (int(match["year"]) if match["year"] else _guess_year(match["day"], day, month))
+
+    start = datetime(year, month, day, int(match["h1"]), int(match["m1"]), tzinfo=WIB)
+    end = datetime(year, month, day, int(match["h2"]), int(match["m2"]), tzinfo=WIB)
+    if end <= start:
+        end += timedelta(days=1)
+    return start, end
+
+
+def format_schedule(start, end):
+    start, end = start.astimezone(WIB), end.astimezone(WIB)
+    return (
+        f"{DAYS[start.weekday()]}, {start.day} {MONTHS[start.month - 1]} {start.year} "
+        f"({start:%H:%M} - {end:%H:%M} WIB)"
+    )
+
+
+def overlaps(a_start, a_end, b_start, b_end):
+    return a_start < b_end and b_start < a_end
+
+
+class ScheduleIndex:
+    # Interval terurut berdasarkan waktu mulai (timestamp float di array). Karena durasi sesi
+    # dibatasi max_duration, semua interval yang beririsan dengan [t0, t1) ada di antara
+    # bisect(t0 - max_duration) dan bisect(t1): query O(log n + k).
+    def __init__(self, sessions=()):
+        self.starts = array("d")
+        self.ends = array("d")
+        self.ids = []
+        self.max_duration = 0.0
+        self.bulk_load(sessions)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def bulk_load(self, sessions):
+        rows = [(start.timestamp(), end.timestamp(), session_id) for session_id, start, end in sessions]
+        rows += zip(self.starts, self.ends, self.ids)
+        rows.sort(key=lambda row: row[0])
+        self.starts = array("d", (row[0] for row in rows))
+        self.ends = array("d", (row[1] for row in rows))
+        self.ids = [row[2] for row in rows]
+        self.max_duration = max((end - start for start, end, _ in rows), default=0.0)
+
+    def add(self, session_id, start, end):
+        start, end = start.timestamp(), end.timestamp()
+        position = bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self.ids.insert(position, session_id)
+        self.max_duration = max(self.max_duration, end - start)
+
+    def remove(self, session_id, start):
+        timestamp = start.timestamp()
+        position = bisect_left(self.starts, timestamp)
+        while position < len(self.starts) and self.starts[position] == timestamp:
+            if self.ids[position] == session_id:
+                del self.starts[position]
+                del self.ends[position]
+                del self.ids[position]
+                return True
+            position += 1
+        return False
+
+    def _overlapping(self, low, high):
+        starts, ends, ids = self.starts, self.ends, self.ids
+        first = bisect_left(starts, low - self.max_duration)
+        last = bisect_left(starts, high)
+        return [ids[i] for i in range(first, last) if ends[i] > low]
+
+    def between(self, start, end):
+        return self._overlapping(start.timestamp(), end.timestamp())
+
+    def happening_at(self, moment=None):
+        moment = (moment or datetime.now(WIB)).timestamp()
+        return self._overlapping(moment, moment + 1e-6)
+
+    def daily_window(self, first_day, days, from_time, to_time):
+        # Mis. "antara 08:00 dan 12:00 minggu ini": gabungan jendela harian selama `days` hari
+        found = []
+        seen = set()
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            start = datetime.combine(day, from_time, WIB)
+            end = datetime.combine(day, to_time, WIB)
+            for session_id in self.between(start, end):
+                if session_id not in seen:
+                    seen.add(session_id)
+                    found.append(session_id)
+        return found
+
+
+def week_start(day=None):
+    day = day or datetime.now(WIB).date()
+    return day - timedelta(days=day.weekday())
+
+
+def this_week_between(index, from_hour, to_hour, day=None):
+    return index.daily_window(week_start(day), 7, clock(from_hour), clock(to_hour))
@@ -1,74 +1,124 @@
 from abc import ABC, abstractmethod
 
+from render import Message
+from activities_service.booking import BOOKED, WAITLISTED
+from activities_service.catalog import list_activities
+from activities_service.views import ActivityListView, ActivityDetailView, ConflictView, BookingView
+from geo import DEFAULT_LOCATION
+from search import ranked
+
+NEARBY_RADIUS_KM = 5
+NEARBY_LIMIT = 10
+
 class ActivityState(ABC):
-    def __init__(self, context):
-        self.context = context
+    __slots__ = ()
 
     @abstractmethod
-    def handle(self):
+    def handle(self, context, **options):
         pass
 
 class FindActivityState(ActivityState):
-    def handle(self):
-        print(f"\n🎯 Mencari kegiatan untuk '{self.context.username}'...\n")
-        self.context.activities = [
-            {
-                "id": 1,
-                "name": "Yoga Pagi",
-                "time": "Senin, 3 Juni (07:00 - 09:00) WIB",
-                "location": "Taman Komunitas",
-                "photo": "🧘",
-                "description": "Sesi yoga lembut untuk memulai hari.",
-                "participants": 10
-            },
-            {
-                "id": 2,
-                "name": "Kelas Memasak",
-                "time": "Selasa, 4 Juni (11:00 - 13.00 WIB)",
-                "location": "Dapur Pusat Lansia",
-                "photo": "👩‍🍳",
-                "description": "Belajar memasak makanan sehat bersama.",
-                "participants": 8
-            },
-            {
-                "id": 3,
-                "name": "Terapi Seni",
-                "time": "Rabu, 5 Juni (14:00 - 15:00 WIB)",
-                "location": "Aula Seni",
-                "photo": "🎨",
-                "description": "Ekspresikan emosi melalui lukisan.",
-                "participants": 12
-            }
-        ]
+    def handle(self, context, window=None, nearby=False, radius_km=NEARBY_RADIUS_KM, limit=NEARBY_LIMIT, query=None,
+               **options):
+        activities = list_activities()
+        schedule = context.schedule
+        if window is not None:
+            # window = (mulai, selesai) datetime, mis. "antara 08:00 dan 12:00 minggu ini"
+            wanted = set(schedule.between(*window))
+            activities = [activity for activity in activities if activity['id'] in wanted]
+        if nearby:
+            # Urutkan dari yang terdekat dengan lokasi pengguna
+            lat, lon = context.location or DEFAULT_LOCATION
+            by_id = {activity['id']: activity for activity in activities}
+            activities = []
+            for distance, activity_id in context.places.within(lat, lon, radius_km):
+                if activity_id in by_id:
+                    by_id[activity_id]['distance_km'] = distance
+                    activities.append(by_id[activity_id])
+            activities = activities[:limit]
+        if query:
+            activities = ranked(context.search_index, query, "activity", activities)
+        context.activities = activities
 
-        print("✨ Kegiatan yang Tersedia:\n")
-        for idx, activity in enumerate(self.context.activities, 1):
-            print(f"[{idx}] {activity['photo']} {activity['name']} pukul {activity['time']} - {activity['location']}")
+        listing = ActivityListView(
+            username=context.username,
+            query=query,
+            activities=activities,
+            happening=schedule.happening_at() if activities else [],
+        )
+        if not activities:
+            return listing
+        context.show(listing)
 
-        choice = input("\nPilih kegiatan untuk melihat detail (1-3): ")
-        if choice.isdigit() and 1 <= int(choice) <= len(self.context.activities):
-            self.context.selected_activity = self.context.activities[int(choice) - 1]
-            self.context.set_state(self.context.book_activity_state)
-        else:
-            print("❗ Pilihan tidak valid.")
+        choice = context.ask(f"\nPilih kegiatan untuk melihat detail (1-{len(activities)}): ")
+        if choice.isdigit() and 1 <= int(choice) <= len(context.activities):
+            context.selected_activity = context.activities[int(choice) - 1]
+            context.events.emit(context, "activities.selected", activity_id=context.selected_activity['id'])
+            context.set_state(context.book_activity_state)
+            return None
+        return Message("activities.invalid_choice", "❗ Pilihan tidak valid.")
 
 class BookActivityState(ActivityState):
-    def handle(self):
-        activity = self.context.selected_activity
-        print(f"\n📄 Detail Kegiatan:\n")
-        print(f"{activity['photo']} {activity['name']}")
-        print(f"📍 Lokasi: {activity['location']}")
-        print(f"🕒 Waktu: {activity['time']}")
-        print(f"🧾 Deskripsi: {activity['description']}")
-        print(f"👥 Jumlah Peserta: {activity['participants']}")
+    def conflicts(self, context, activity):
+        # Sesi yang beririsan dengan kegiatan ini, dibatasi ke kegiatan yang sudah dipesan pengguna
+        booked = context.booking_engine.bookings_for(context.username)
+        if not booked:
+            return []
+        overlapping = context.schedule.between(activity['start'], activity['end'])
+        return [activity_id for activity_id in overlapping if activity_id in booked and activity_id != activity['id']]
+
+    def handle(self, context, **options):
+        activity = context.selected_activity
+        engine = context.booking_engine
+        context.show(ActivityDetailView(
+            activity=activity, participants=engine.count(activity['id']), capacity=engine.capacity(activity['id'])
+        ))
+
+        clashes = self.conflicts(context, activity)
+        if clashes:
+            names = {item['id']: item['name'] for item in list_activities()}
+            return ConflictView(clashes=[names.get(activity_id, str(activity_id)) for activity_id in clashes])
+
+        confirm = context.ask("\nApakah Anda ingin mendaftar kegiatan ini? (y/n): ").lower()
+        if confirm != 'y':
+            return BookingView(activity=activity, status="declined")
+
+        status = engine.book(activity['id'], context.username)
+        context.events.emit(context, "activities.booked", activity_id=activity['id'], status=status)
+        view = BookingView(activity=activity, status=status)
+        if status == BOOKED:
+            context.dashboards.booked(context.username, activity['id'])
+            view.data["reminders"] = context.reminders.schedule(
+                context.username, activity['id'], activity['start'].timestamp()
+            )
+            context.notification_hub.push(
+                context.username, "activity",
+                f"📅 Pendaftaran '{activity['name']}' terkonfirmasi: {activity['time']} di {activity['location']}."
+            )
+        elif status == WAITLISTED:
+            view.data["position"] = engine.waitlist_position(activity['id'], context.username)
+        return view
+
+class CancelBookingState(ActivityState):
+    def handle(self, context, **options):
+        activity = context.selected_activity
+        if not activity:
+            return Message("activities.no_selection", "❗ Belum ada kegiatan yang dipilih.")
+
+        cancelled, promoted = context.booking_engine.cancel(activity['id'], context.username)
+        if not cancelled:
+            return Message("activities.not_booked", f"⚠️ Anda tidak terdaftar di '{activity['name']}'.")
 
-        confirm = input("\nApakah Anda ingin mendaftar kegiatan ini? (y/n): ").lower()
-        if confirm == 'y':
-            if not self.context.booked:
-                self.context.booked = True
-                print(f"\n✅ Anda berhasil mendaftar '{activity['name']}'!")
-                print(f"📅 Jadwal Anda: {activity['name']} pukul {activity['time']} di {activity['location']}")
-            else:
-                print("⚠️ Anda sudah mendaftar kegiatan.")
-        else:
-            print("↩️ Pendaftaran dibatalkan.")
+        context.events.emit(context, "activities.cancelled", activity_id=activity['id'], promoted=promoted)
+        context.dashboards.cancelled(context.username, activity['id'])
+        context.reminders.cancel(context.username, activity['id'])
+        if promoted:
+            context.dashboards.booked(promoted, activity['id'])
+            context.reminders.schedule(promoted, activity['id'], activity['start'].timestamp())
+            context.notification_hub.push(
+                promoted, "activity",
+                f"🎉 Ada kursi kosong! Anda kini terdaftar di '{activity['name']}' pukul {activity['time']}."
+            )
+        context.set_state(context.find_activity_state)
+        return Message("activities.cancelled", f"↩️ Pendaftaran '{activity['name']}' telah dibatalkan.",
+                       activity_id=activity['id'], promoted=promoted)
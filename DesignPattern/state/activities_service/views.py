@@ -0,0 +1,72 @@
+from render import View
+from activities_service.booking import BOOKED, WAITLISTED, ALREADY_BOOKED, ALREADY_WAITLISTED, WAITLIST_FULL
+
+
+class ActivityListView(View):
+    kind = "activities.list"
+
+    def lines(self):
+        if self.get('query'):
+            lines = [f"\n🔎 Mencari kegiatan '{self['query']}' untuk '{self['username']}'...\n"]
+        else:
+            lines = [f"\n🎯 Mencari kegiatan untuk '{self['username']}'...\n"]
+        if not self['activities']:
+            lines.append("📭 Tidak ada kegiatan yang cocok dengan pencarian.")
+            return lines
+
+        lines.append("✨ Kegiatan yang Tersedia:\n")
+        for idx, activity in enumerate(self['activities'], 1):
+            live = " 🔴 Sedang berlangsung" if activity['id'] in self['happening'] else ""
+            distance = f" ({activity['distance_km']:.1f} km)" if 'distance_km' in activity else ""
+            lines.append(f"[{idx}] {activity['photo']} {activity['name']} pukul {activity['time']} - "
+                         f"{activity['location']}{distance}{live}")
+        return lines
+
+
+class ActivityDetailView(View):
+    kind = "activities.detail"
+
+    def lines(self):
+        activity = self['activity']
+        return [
+            "\n📄 Detail Kegiatan:\n",
+            f"{activity['photo']} {activity['name']}",
+            f"📍 Lokasi: {activity['location']}",
+            f"🕒 Waktu: {activity['time']}",
+            f"🧾 Deskripsi: {activity['description']}",
+            f"👥 Jumlah Peserta: {self['participants']}/{self['capacity']}",
+        ]
+
+
+class ConflictView(View):
+    kind = "activities.conflict"
+
+    def lines(self):
+        return [
+            f"\n⚠️ Jadwal bentrok dengan kegiatan yang sudah Anda daftar: {', '.join(self['clashes'])}.",
+            "↩️ Batalkan pendaftaran tersebut terlebih dahulu untuk mendaftar kegiatan ini.",
+        ]
+
+
+class BookingView(View):
+    kind = "activities.booking"
+
+    def lines(self):
+        activity, status = self['activity'], self['status']
+        if status == BOOKED:
+            lines = [
+                f"\n✅ Anda berhasil mendaftar '{activity['name']}'!",
+                f"📅 Jadwal Anda: {activity['name']} pukul {activity['time']} di {activity['location']}",
+            ]
+            if self.get('reminders'):
+                lines.append(f"⏰ {self['reminders']} pengingat akan dikirim sebelum kegiatan dimulai.")
+            return lines
+        if status == WAITLISTED:
+            return [f"\n⏳ Kegiatan sudah penuh. Anda masuk daftar tunggu nomor {self['position']}."]
+        if status == ALREADY_BOOKED:
+            return ["⚠️ Anda sudah mendaftar kegiatan."]
+        if status == ALREADY_WAITLISTED:
+            return ["⚠️ Anda sudah berada di daftar tunggu kegiatan ini."]
+        if status == WAITLIST_FULL:
+            return ["❗ Kegiatan dan daftar tunggu sudah penuh."]
+        return ["↩️ Pendaftaran dibatalkan."]
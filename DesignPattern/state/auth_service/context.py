@@ -1,9 +1,39 @@
-from auth_service.states import (
-    LoginState, SignupState, OnboardingState, ForgotPasswordState, ProfileSetupState
-)
+from console import default_input
+from render import Message, default_renderer
+from events import default_event_log
+from metrics import instrumented
+from auth_service.credentials import default_credential_service
+from auth_service.repository import default_repository
+from search import default_search_index
+from friends_service.matchmaking import default_matchmaker
+from services import LazyState
 
+@instrumented
 class AuthContext:
-    def __init__(self, username=None, password=None, confirm_password=None, email=None, full_name=None):
+    # State dibagi semua sesi (flyweight) dan dibuat saat pertama dipakai; data sesi disimpan di slot, tanpa __dict__ per instance
+    signup_state = LazyState("auth_service.states:SignupState")
+    login_state = LazyState("auth_service.states:LoginState")
+    onboarding_state = LazyState("auth_service.states:OnboardingState")
+    forgot_password_state = LazyState("auth_service.states:ForgotPasswordState")
+    profile_setup_state = LazyState("auth_service.states:ProfileSetupState")
+
+    __slots__ = ("repository", "credentials", "search_index", "input_provider", "renderer", "username", "password",
+                 "confirm_password", "email", "full_name", "mode", "hobbies", "story", "profile_completed",
+                 "matchmaker", "events", "state")
+    # Data yang ikut disimpan saat sesi dikeluarkan dari memori (lihat sessions.py); kata sandi tidak
+    SNAPSHOT_FIELDS = ("email", "full_name", "mode", "hobbies", "story", "profile_completed")
+    SERVICE = "auth"
+
+    def __init__(self, username=None, password=None, confirm_password=None, email=None, full_name=None,
+                 repository=None, credentials=None, search_index=None, input_provider=None,
+                 renderer=None, events=None, matchmaker=None):
+        self.repository = repository if repository is not None else default_repository()
+        self.credentials = credentials if credentials is not None else default_credential_service()
+        self.search_index = search_index if search_index is not None else default_search_index()
+        self.input_provider = input_provider if input_provider is not None else default_input()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        self.matchmaker = matchmaker if matchmaker is not None else default_matchmaker()
         self.username = username
         self.password = password
         self.confirm_password = confirm_password
@@ -14,19 +44,26 @@ class AuthContext:
         self.story = ""
         self.profile_completed = False
 
-        self.signup_state = SignupState(self)
-        self.login_state = LoginState(self)
-        self.onboarding_state = OnboardingState(self)
-        self.forgot_password_state = ForgotPasswordState(self)
-        self.profile_setup_state = ProfileSetupState(self)
-
         self.state = None
 
     def set_state(self, state):
+        # Setiap perpindahan state dicatat ke log kejadian append-only (lihat events.py)
+        self.events.transition(self, state)
         self.state = state
 
+    def show(self, view):
+        self.renderer.render(view)
+
+    def ask(self, prompt=""):
+        # Output yang tertunda harus tampil sebelum prompt
+        self.renderer.flush()
+        return self.input_provider.ask(prompt)
+
     def request(self):
         if self.state:
-            self.state.handle()
+            view = self.state.handle(self)
         else:
-            print("[Auth] Tidak ada state yang aktif.")
+            view = Message("auth.no_state", "[Auth] Tidak ada state yang aktif.")
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
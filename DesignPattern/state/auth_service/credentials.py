@@ -0,0 +1,174 @@
+import base64
+import concurrent.futures
+import hashlib
+import hmac
+import os
+import threading
+import time
+
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+class CredentialQueueFull(RuntimeError):
+    pass
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def _unb64(text):
+    return base64.b64decode(text.encode("ascii"))
+
+
+def _derive(algorithm, params, password, salt):
+    if algorithm == "scrypt":
+        n, r, p = params
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 2**20, dklen=KEY_BYTES)
+    if algorithm == "pbkdf2_sha256":
+        (iterations,) = params
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations, dklen=KEY_BYTES)
+    raise ValueError(f"Algoritma hash tidak dikenal: {algorithm}")
+
+
+def parse_hash(encoded):
+    # Format: algoritma$param1$param2...$salt$hash
+    algorithm, *fields = encoded.split("$")
+    *params, salt, digest = fields
+    return algorithm, tuple(int(value) for value in params), _unb64(salt), _unb64(digest)
+
+
+def hash_password(password, algorithm, params):
+    salt = os.urandom(SALT_BYTES)
+    digest = _derive(algorithm, params, password, salt)
+    return "$".join([algorithm, *(str(value) for value in params), _b64(salt), _b64(digest)])
+
+
+def verify_password(encoded, password):
+    try:
+        algorithm, params, salt, digest = parse_hash(encoded)
+        derived = _derive(algorithm, params, password, salt)
+    except (ValueError, TypeError):
+        return False
+    return hmac.compare_digest(derived, digest)
+
+
+class CredentialService:
+    # Hash dan verifikasi berjalan di pool terpisah (hashlib melepas GIL), dengan antrean
+    # terbatas: permintaan di atas max_pending menunggu paling lama queue_timeout detik.
+    def __init__(self, algorithm="scrypt", n=2**14, r=8, p=1, iterations=600_000,
+                 workers=None, max_pending=64, queue_timeout=5.0, use_processes=False):
+        self.algorithm = algorithm
+        self.params = (n, r, p) if algorithm == "scrypt" else (iterations,)
+        self.queue_timeout = queue_timeout
+        self.slots = threading.BoundedSemaphore(max_pending)
+        # ProcessPoolExecutor dimuat concurrent.futures hanya saat diakses (impor multiprocessing mahal)
+        futures = concurrent.futures
+        pool_class = futures.ProcessPoolExecutor if use_processes else futures.ThreadPoolExecutor
+        self.executor = pool_class(max_workers=workers or os.cpu_count() or 1)
+        self.dummy_hash = None
+
+    def needs_rehash(self, encoded):
+        try:
+            algorithm, params, _, _ = parse_hash(encoded)
+        except (ValueError, TypeError):
+            return True
+        return algorithm != self.algorithm or params != self.params
+
+    def _submit(self, fn, *args):
+        if not self.slots.acquire(timeout=self.queue_timeout):
+            raise CredentialQueueFull("Antrean verifikasi kata sandi penuh.")
+        return self._start(fn, *args)
+
+    def _start(self, fn, *args):
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    async def _submit_async(self, fn, *args):
+        # asyncio hanya dipakai jalur async (gateway), jadi tidak diimpor di tingkat modul
+        import asyncio
+
+        # Jangan memblokir event loop saat antrean penuh: tunggu dengan sleep singkat
+        deadline = time.monotonic() + self.queue_timeout
+        delay = 0.0005
+        while not self.slots.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                raise CredentialQueueFull("Antrean verifikasi kata sandi penuh.")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.02)
+        return await asyncio.wrap_future(self._start(fn, *args))
+
+    def hash(self, password):
+        return self._submit(hash_password, password, self.algorithm, self.params).result()
+
+    def verify(self, encoded, password):
+        return self._submit(verify_password, encoded, password).result()
+
+    async def hash_async(self, password):
+        return await self._submit_async(hash_password, password, self.algorithm, self.params)
+
+    async def verify_async(self, encoded, password):
+        return await self._submit_async(verify_password, encoded, password)
+
+    # Username yang tidak ada tetap membayar satu derivasi kunci (verifikasi terhadap hash pengganti,
+    # atau membuat hash pengganti itu pada panggilan pertama), supaya waktu respons tidak membocorkan
+    # apakah username terdaftar
+    def _verify_dummy(self, password):
+        if self.dummy_hash is None:
+            self.dummy_hash = self.hash(_b64(os.urandom(SALT_BYTES)))
+        else:
+            self.verify(self.dummy_hash, password)
+
+    async def _verify_dummy_async(self, password):
+        if self.dummy_hash is None:
+            self.dummy_hash = await self.hash_async(_b64(os.urandom(SALT_BYTES)))
+        else:
+            await self.verify_async(self.dummy_hash, password)
+
+    def authenticate(self, repository, username, password):
+        account = repository.get(username)
+        if not account:
+            self._verify_dummy(password)
+            return None
+        if not self.verify(account["password_hash"], password):
+            return None
+        # Parameter biaya berubah sejak akun dibuat: simpan ulang hash dengan parameter baru
+        if self.needs_rehash(account["password_hash"]):
+            account["password_hash"] = self.hash(password)
+            repository.update_password(username, account["password_hash"])
+        return account
+
+    async def authenticate_async(self, repository, username, password):
+        import asyncio
+
+        # Repository bisa memblokir (SQLite): jalankan di executor, bukan di event loop
+        loop = asyncio.get_running_loop()
+        account = await loop.run_in_executor(None, repository.get, username)
+        if not account:
+            await self._verify_dummy_async(password)
+            return None
+        if not await self.verify_async(account["password_hash"], password):
+            return None
+        if self.needs_rehash(account["password_hash"]):
+            account["password_hash"] = await self.hash_async(password)
+            await loop.run_in_executor(None, repository.update_password, username, account["password_hash"])
+        return account
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+_default_service = None
+
+
+def default_credential_service():
+    global _default_service
+    if _default_service is None:
+        _default_service = CredentialService()
+    return _default_service
@@ -0,0 +1,288 @@
+import json
+import queue
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+from auth_service.credentials import default_credential_service, hash_password
+
+ACCOUNT_FIELDS = ("username", "email", "full_name", "password_hash", "mode", "hobbies", "story")
+
+
+class DuplicateAccountError(ValueError):
+    pass
+
+
+def new_account(username, email, full_name, password_hash, mode=None, hobbies=None, story=""):
+    return {
+        "username": username,
+        "email": email,
+        "full_name": full_name,
+        "password_hash": password_hash,
+        "mode": mode,
+        "hobbies": list(hobbies or []),
+        "story": story,
+    }
+
+
+class AccountRepository(ABC):
+    @abstractmethod
+    def create(self, account):
+        pass
+
+    @abstractmethod
+    def get(self, username):
+        pass
+
+    @abstractmethod
+    def get_by_email(self, email):
+        pass
+
+    @abstractmethod
+    def update_password(self, username, password_hash):
+        pass
+
+    @abstractmethod
+    def update_profile(self, username, mode, hobbies, story):
+        pass
+
+    @abstractmethod
+    def bulk_import(self, accounts):
+        pass
+
+    @abstractmethod
+    def count(self):
+        pass
+
+
+class InMemoryAccountRepository(AccountRepository):
+    def __init__(self):
+        self.accounts = {}
+        self.emails = {}
+        self.lock = threading.Lock()
+
+    def create(self, account):
+        with self.lock:
+            if account["username"] in self.accounts or account["email"] in self.emails:
+                raise DuplicateAccountError(account["username"])
+            self.accounts[account["username"]] = dict(account)
+            self.emails[account["email"]] = account["username"]
+
+    def get(self, username):
+        account = self.accounts.get(username)
+        return dict(account) if account else None
+
+    def get_by_email(self, email):
+        username = self.emails.get(email)
+        return self.get(username) if username else None
+
+    def update_password(self, username, password_hash):
+        with self.lock:
+            account = self.accounts.get(username)
+            if account is None:
+                return False
+            account["password_hash"] = password_hash
+            return True
+
+    def update_profile(self, username, mode, hobbies, story):
+        with self.lock:
+            account = self.accounts.get(username)
+            if account is None:
+                return False
+            account.update(mode=mode, hobbies=list(hobbies), story=story)
+            return True
+
+    def bulk_import(self, accounts):
+        imported = 0
+        with self.lock:
+            for account in accounts:
+                if account["username"] in self.accounts or account["email"] in self.emails:
+                    continue
+                self.accounts[account["username"]] = dict(account)
+                self.emails[account["email"]] = account["username"]
+                imported += 1
+        return imported
+
+    def count(self):
+        return len(self.accounts)
+
+
+class SqliteAccountRepository(AccountRepository):
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS accounts (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            email TEXT NOT NULL,
+            full_name TEXT,
+            password_hash TEXT NOT NULL,
+            mode TEXT,
+            hobbies TEXT NOT NULL DEFAULT '[]',
+            story TEXT NOT NULL DEFAULT ''
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_accounts_username ON accounts(username)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_accounts_email ON accounts(email)",
+    )
+
+    # SQL konstan: modul sqlite3 menyimpan statement yang sudah di-prepare per koneksi
+    INSERT = (
+        "INSERT INTO accounts (username, email, full_name, password_hash, mode, hobbies, story) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+    INSERT_IGNORE = INSERT.replace("INSERT", "INSERT OR IGNORE", 1)
+    SELECT_BY_USERNAME = (
+        "SELECT username, email, full_name, password_hash, mode, hobbies, story FROM accounts WHERE username = ?"
+    )
+    SELECT_BY_EMAIL = (
+        "SELECT username, email, full_name, password_hash, mode, hobbies, story FROM accounts WHERE email = ?"
+    )
+    UPDATE_PASSWORD = "UPDATE accounts SET password_hash = ? WHERE username = ?"
+    UPDATE_PROFILE = "UPDATE accounts SET mode = ?, hobbies = ?, story = ? WHERE username = ?"
+    COUNT = "SELECT COUNT(*) FROM accounts"
+    # Versi skema di PRAGMA user_version. Versi 0 dengan kolom `password` berisi kata sandi polos
+    # (skema pertama); versi 1 menyimpan hash di `password_hash`.
+    SCHEMA_VERSION = 1
+    MIGRATE_V1 = "ALTER TABLE accounts RENAME COLUMN password TO password_hash"
+    SELECT_PASSWORDS = "SELECT id, password_hash FROM accounts"
+    UPDATE_PASSWORD_BY_ID = "UPDATE accounts SET password_hash = ? WHERE id = ?"
+
+    def __init__(self, path, pool_size=4, credentials=None):
+        self.path = path
+        self.credentials = credentials if credentials is not None else default_credential_service()
+        self.pool = queue.Queue()
+        self.connections = []
+        for _ in range(pool_size):
+            connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, cached_statements=64)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self.connections.append(connection)
+            self.pool.put(connection)
+
+        with self.connection() as connection:
+            self.migrate(connection)
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+    def migrate(self, connection):
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(accounts)")}
+            if version < 1 and "password" in columns:
+                connection.execute(self.MIGRATE_V1)
+                self._hash_plaintext(connection)
+            if version < self.SCHEMA_VERSION:
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _hash_plaintext(self, connection):
+        # Semua kata sandi polos di-hash di dalam transaksi migrasi, jadi tidak ada yang tersisa
+        # polos di disk walau pemiliknya tidak pernah login lagi. Derivasi berjalan paralel di pool
+        # CredentialService (hashlib melepas GIL) dengan parameter biaya yang sedang berlaku.
+        credentials = self.credentials
+        rows = connection.execute(self.SELECT_PASSWORDS).fetchall()
+        hashes = credentials.executor.map(
+            hash_password, [password for _, password in rows],
+            [credentials.algorithm] * len(rows), [credentials.params] * len(rows),
+        )
+        connection.executemany(self.UPDATE_PASSWORD_BY_ID,
+                               [(password_hash, row_id) for password_hash, (row_id, _) in zip(hashes, rows)])
+
+    @contextmanager
+    def connection(self):
+        connection = self.pool.get()
+        try:
+            yield connection
+        finally:
+            self.pool.put(connection)
+
+    def close(self):
+        for connection in self.connections:
+            connection.close()
+
+    @staticmethod
+    def _row(account):
+        return (
+            account["username"],
+            account["email"],
+            account["full_name"],
+            account["password_hash"],
+            account.get("mode"),
+            json.dumps(account.get("hobbies") or []),
+            account.get("story") or "",
+        )
+
+    @staticmethod
+    def _account(row):
+        if row is None:
+            return None
+        account = dict(zip(ACCOUNT_FIELDS, row))
+        account["hobbies"] = json.loads(account["hobbies"])
+        return account
+
+    def create(self, account):
+        with self.connection() as connection:
+            try:
+                connection.execute(self.INSERT, self._row(account))
+            except sqlite3.IntegrityError as error:
+                raise DuplicateAccountError(account["username"]) from error
+
+    def get(self, username):
+        with self.connection() as connection:
+            return self._account(connection.execute(self.SELECT_BY_USERNAME, (username,)).fetchone())
+
+    def get_by_email(self, email):
+        with self.connection() as connection:
+            return self._account(connection.execute(self.SELECT_BY_EMAIL, (email,)).fetchone())
+
+    def update_password(self, username, password_hash):
+        with self.connection() as connection:
+            return connection.execute(self.UPDATE_PASSWORD, (password_hash, username)).rowcount > 0
+
+    def update_profile(self, username, mode, hobbies, story):
+        with self.connection() as connection:
+            cursor = connection.execute(self.UPDATE_PROFILE, (mode, json.dumps(list(hobbies)), story, username))
+            return cursor.rowcount > 0
+
+    def bulk_import(self, accounts, batch_size=10_000):
+        # Satu transaksi per batch; akun yang username/email-nya sudah ada dilewati
+        imported = 0
+        batch = []
+        with self.connection() as connection:
+            for account in accounts:
+                batch.append(self._row(account))
+                if len(batch) >= batch_size:
+                    imported += self._insert_batch(connection, batch)
+                    batch = []
+            if batch:
+                imported += self._insert_batch(connection, batch)
+        return imported
+
+    def _insert_batch(self, connection, rows):
+        before = connection.total_changes
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(self.INSERT_IGNORE, rows)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return connection.total_changes - before
+
+    def count(self):
+        with self.connection() as connection:
+            return connection.execute(self.COUNT).fetchone()[0]
+
+
+_default_repository = None
+
+
+def default_repository():
+    global _default_repository
+    if _default_repository is None:
+        _default_repository = InMemoryAccountRepository()
+    return _default_repository
@@ -1,75 +1,123 @@
+import secrets
 from abc import ABC, abstractmethod
 
+from render import Message
+from auth_service.repository import DuplicateAccountError, new_account
+from auth_service.views import SignupView, LoginView, OnboardingView, ProfileView, ForgotPasswordView
+from search import profile_document
+
 class AuthState(ABC):
-    def __init__(self, context):
-        self.context = context
+    # Tanpa atribut per instance: satu objek state dipakai bersama oleh semua sesi
+    __slots__ = ()
 
     @abstractmethod
-    def handle(self):
+    def handle(self, context):
         pass
 
 class LoginState(AuthState):
-    def handle(self):
-        print(f"[Auth] Pengguna '{self.context.username}' mencoba masuk...")
-        if self.context.username == "elder1" and self.context.password == "pass123":
-            print("[Auth] Masuk berhasil!")
-            self.context.set_state(self.context.onboarding_state)
-        else:
-            print("[Auth] Gagal masuk! Nama pengguna atau kata sandi salah.")
+    def handle(self, context):
+        account = context.credentials.authenticate(
+            context.repository, context.username, context.password
+        )
+        if account:
+            context.email = account["email"]
+            context.full_name = account["full_name"]
+            context.mode = account["mode"]
+            context.hobbies = account["hobbies"]
+            context.story = account["story"]
+            context.set_state(context.onboarding_state)
+        context.events.emit(context, "auth.logged_in" if account else "auth.login_failed")
+        return LoginView(username=context.username, success=bool(account))
 
 class OnboardingState(AuthState):
-    def handle(self):
-        print(f"[Auth] Menjalankan onboarding untuk pengguna '{self.context.username}'...")
-        self.context.profile_completed = True
-        print(f"[Auth] Onboarding selesai untuk pengguna '{self.context.username}'")
+    def handle(self, context):
+        context.profile_completed = True
+        context.events.emit(context, "auth.onboarded")
+        return OnboardingView(username=context.username)
 
 class SignupState(AuthState):
-    def handle(self):
-        print(f"[Auth] Mendaftarkan pengguna dengan email '{self.context.email}' dan username '{self.context.username}'...")
-        
-        if not (self.context.email and self.context.password and self.context.confirm_password and self.context.username and self.context.full_name):
-            print("[Auth] Gagal mendaftar: Informasi tidak lengkap.")
-            return
-        
-        if self.context.password != self.context.confirm_password:
-            print("[Auth] Gagal mendaftar: Password dan konfirmasi password tidak sama.")
-            return
-        
-        # Simulasi penyimpanan akun berhasil
-        print(f"[Auth] Akun berhasil dibuat untuk '{self.context.email}' dengan username '{self.context.username}' dan nama '{self.context.full_name}'")
-        self.context.set_state(self.context.profile_setup_state)
+    def handle(self, context):
+        view = SignupView(email=context.email, username=context.username, full_name=context.full_name)
+
+        if not (context.email and context.password and context.confirm_password and context.username and context.full_name):
+            view.data["status"] = "incomplete"
+            return view
+
+        if context.password != context.confirm_password:
+            view.data["status"] = "mismatch"
+            return view
+
+        password_hash = context.credentials.hash(context.password)
+        account = new_account(context.username, context.email, context.full_name, password_hash)
+        try:
+            context.repository.create(account)
+        except DuplicateAccountError:
+            view.data["status"] = "duplicate"
+            return view
+
+        view.data["status"] = "created"
+        context.events.emit(context, "auth.signed_up", email=context.email, full_name=context.full_name)
+        context.set_state(context.profile_setup_state)
+        return view
 
 class ProfileSetupState(AuthState):
-    def handle(self):
-        print(f"[Auth] Silakan lengkapi profil untuk pengguna '{self.context.username}'")
-        
+    def handle(self, context):
+        context.show(Message(
+            "auth.profile_start", f"[Auth] Silakan lengkapi profil untuk pengguna '{context.username}'"
+        ))
+
         # Pilih mode: pertemanan / cinta
-        mode = input("Pilih mode (pertemanan/cinta): ").strip().lower()
+        mode = context.ask("Pilih mode (pertemanan/cinta): ").strip().lower()
         while mode not in ['pertemanan', 'cinta']:
-            print("Mode tidak valid. Pilih 'pertemanan' atau 'cinta'.")
-            mode = input("Pilih mode (pertemanan/cinta): ").strip().lower()
-        self.context.mode = mode
+            context.show(Message("auth.invalid_mode", "Mode tidak valid. Pilih 'pertemanan' atau 'cinta'."))
+            mode = context.ask("Pilih mode (pertemanan/cinta): ").strip().lower()
+        context.mode = mode
 
         # Input hobi (pisahkan dengan koma jika lebih dari satu)
-        hobbies = input("Masukkan hobi (pisahkan dengan koma jika lebih dari satu): ").strip()
-        self.context.hobbies = [h.strip() for h in hobbies.split(',') if h.strip()]
+        hobbies = context.ask("Masukkan hobi (pisahkan dengan koma jika lebih dari satu): ").strip()
+        context.hobbies = [h.strip() for h in hobbies.split(',') if h.strip()]
 
         # Cerita pengalaman
-        story = input("Ceritakan pengalamanmu (singkat): ").strip()
-        self.context.story = story
+        story = context.ask("Ceritakan pengalamanmu (singkat): ").strip()
+        context.story = story
 
-        print(f"[Auth] Profil lengkap dengan mode '{self.context.mode}', hobi {self.context.hobbies}, dan cerita pengalaman tersimpan.")
+        context.repository.update_profile(
+            context.username, context.mode, context.hobbies, context.story
+        )
+        # Cerita dan hobi langsung bisa dicari oleh pengguna lain
+        context.search_index.update(*profile_document({
+            "username": context.username, "full_name": context.full_name,
+            "story": context.story, "hobbies": context.hobbies,
+        }))
+        # Masuk (atau keluar dari) perjodohan mode cinta
+        context.matchmaker.update({
+            "username": context.username, "mode": context.mode, "hobbies": context.hobbies, "story": context.story,
+        })
+        context.events.emit(context, "auth.profile_completed", mode=context.mode, hobbies=context.hobbies,
+                            story=context.story)
         # Setelah selesai, lanjut ke login
-        self.context.set_state(self.context.login_state)
+        context.set_state(context.login_state)
+        return ProfileView(mode=context.mode, hobbies=context.hobbies, story=context.story)
 
 class ForgotPasswordState(AuthState):
-    def handle(self):
-        print(f"[Auth] Permintaan atur ulang kata sandi untuk '{self.context.email}'...")
-        if self.context.email:
-            print(f"[Auth] Email konfirmasi telah dikirim ke '{self.context.email}'")
-            # Simulasi email confirmation dan reset
-            self.context.password = "kata_sandi_baru_123"
-            print(f"[Auth] Kata sandi telah direset ke '{self.context.password}' (hanya simulasi)")
-            self.context.set_state(self.context.login_state)
-        else:
-            print("[Auth] Tidak ada email yang diberikan. Tidak dapat mereset kata sandi.")
+    def handle(self, context):
+        view = ForgotPasswordView(email=context.email)
+        if not context.email:
+            view.data["status"] = "no_email"
+            return view
+
+        account = context.repository.get_by_email(context.email)
+        if not account:
+            view.data["status"] = "not_found"
+            return view
+
+        # Simulasi email confirmation dan reset
+        context.password = secrets.token_urlsafe(9)
+        context.repository.update_password(
+            account["username"], context.credentials.hash(context.password)
+        )
+        view.data["status"] = "reset"
+        view.temporary_password = context.password
+        context.events.append(account["username"], context.SERVICE, "auth.password_reset")
+        context.set_state(context.login_state)
+        return view
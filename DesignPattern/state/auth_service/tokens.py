@@ -0,0 +1,58 @@
+import secrets
+import threading
+import time
+
+SESSION_TTL = 12 * 60 * 60      # detik
+TOKEN_BYTES = 32
+
+
+class SessionTokens:
+    # Token sesi yang diberikan saat login berhasil: token acak -> (username, waktu kedaluwarsa).
+    # Hanya di memori, jadi setelah gateway dimulai ulang pengguna perlu login lagi.
+    def __init__(self, ttl=SESSION_TTL, clock=time.time):
+        self.ttl = ttl
+        self.clock = clock
+        self.tokens = {}
+        self.lock = threading.Lock()
+        self.next_sweep = 1024
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def issue(self, username):
+        token = secrets.token_urlsafe(TOKEN_BYTES)
+        with self.lock:
+            now = self.clock()
+            # Token kedaluwarsa yang tidak pernah dipakai lagi dibersihkan sesekali, bukan tiap request
+            if len(self.tokens) >= self.next_sweep:
+                self.tokens = {key: entry for key, entry in self.tokens.items() if entry[1] > now}
+                self.next_sweep = max(1024, 2 * len(self.tokens))
+            self.tokens[token] = (username, now + self.ttl)
+        return token
+
+    def resolve(self, token):
+        # Username pemilik token, atau None bila token tidak dikenal atau sudah kedaluwarsa
+        if not token:
+            return None
+        with self.lock:
+            entry = self.tokens.get(token)
+            if entry is None:
+                return None
+            if entry[1] <= self.clock():
+                del self.tokens[token]
+                return None
+            return entry[0]
+
+    def revoke(self, token):
+        with self.lock:
+            return self.tokens.pop(token, None) is not None
+
+
+_default_tokens = None
+
+
+def default_session_tokens():
+    global _default_tokens
+    if _default_tokens is None:
+        _default_tokens = SessionTokens()
+    return _default_tokens
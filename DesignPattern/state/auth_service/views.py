@@ -0,0 +1,68 @@
+from render import View
+
+
+class SignupView(View):
+    kind = "auth.signup"
+
+    def lines(self):
+        lines = [f"[Auth] Mendaftarkan pengguna dengan email '{self['email']}' dan username '{self['username']}'..."]
+        status = self['status']
+        if status == "incomplete":
+            lines.append("[Auth] Gagal mendaftar: Informasi tidak lengkap.")
+        elif status == "mismatch":
+            lines.append("[Auth] Gagal mendaftar: Password dan konfirmasi password tidak sama.")
+        elif status == "duplicate":
+            lines.append("[Auth] Gagal mendaftar: Username atau email sudah digunakan.")
+        else:
+            lines.append(
+                f"[Auth] Akun berhasil dibuat untuk '{self['email']}' dengan username '{self['username']}' "
+                f"dan nama '{self['full_name']}'"
+            )
+        return lines
+
+
+class LoginView(View):
+    kind = "auth.login"
+
+    def lines(self):
+        result = "[Auth] Masuk berhasil!" if self['success'] else "[Auth] Gagal masuk! Nama pengguna atau kata sandi salah."
+        return [f"[Auth] Pengguna '{self['username']}' mencoba masuk...", result]
+
+
+class OnboardingView(View):
+    kind = "auth.onboarding"
+
+    def lines(self):
+        return [
+            f"[Auth] Menjalankan onboarding untuk pengguna '{self['username']}'...",
+            f"[Auth] Onboarding selesai untuk pengguna '{self['username']}'",
+        ]
+
+
+class ProfileView(View):
+    kind = "auth.profile"
+
+    def lines(self):
+        return [
+            f"[Auth] Profil lengkap dengan mode '{self['mode']}', hobi {self['hobbies']}, "
+            f"dan cerita pengalaman tersimpan."
+        ]
+
+
+class ForgotPasswordView(View):
+    kind = "auth.forgot_password"
+    # Kata sandi sementara sengaja di luar data: hanya tampil di konsol (simulasi email), tidak
+    # pernah ikut to_dict() sehingga tidak terkirim lewat API/JSON
+    temporary_password = None
+
+    def lines(self):
+        lines = [f"[Auth] Permintaan atur ulang kata sandi untuk '{self['email']}'..."]
+        status = self['status']
+        if status == "no_email":
+            lines.append("[Auth] Tidak ada email yang diberikan. Tidak dapat mereset kata sandi.")
+        elif status == "not_found":
+            lines.append("[Auth] Email tidak ditemukan. Tidak dapat mereset kata sandi.")
+        else:
+            lines.append(f"[Auth] Email konfirmasi telah dikirim ke '{self['email']}'")
+            lines.append(f"[Auth] Kata sandi telah direset ke '{self.temporary_password}' (hanya simulasi)")
+        return lines
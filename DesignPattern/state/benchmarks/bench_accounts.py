@@ -0,0 +1,56 @@
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_accounts [jumlah_akun]
+import os
+import random
+import sys
+import tempfile
+import time
+
+from auth_service.repository import InMemoryAccountRepository, SqliteAccountRepository, new_account
+
+OPERATIONS = 20_000
+
+
+def accounts(start, stop):
+    # Hash tetap: benchmark ini mengukur repositori, bukan biaya hashing (lihat bench_login)
+    for i in range(start, stop):
+        yield new_account(f"lansia{i}", f"lansia{i}@panti.example", f"Lansia {i}", "rahasia", "pertemanan", ["Yoga"])
+
+
+def run(name, repository, total):
+    preload = total - OPERATIONS
+    start = time.perf_counter()
+    imported = repository.bulk_import(accounts(0, preload))
+    bulk = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for account in accounts(preload, total):
+        repository.create(account)
+    signup = time.perf_counter() - start
+
+    rng = random.Random(1)
+    usernames = [f"lansia{rng.randrange(total)}" for _ in range(OPERATIONS)]
+    start = time.perf_counter()
+    for username in usernames:
+        account = repository.get(username)
+        assert account["password_hash"] == "rahasia"
+    login = time.perf_counter() - start
+
+    print(f"\n{name}: {repository.count():,} akun")
+    print(f"  bulk import     {imported / bulk:12,.0f} akun/s ({bulk:.1f} s)")
+    print(f"  signup          {OPERATIONS / signup:12,.0f} signup/s")
+    print(f"  login (lookup)  {OPERATIONS / login:12,.0f} login/s")
+
+
+def main(argv):
+    total = int(argv[0]) if argv else 1_000_000
+    run("memori", InMemoryAccountRepository(), total)
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SqliteAccountRepository(os.path.join(directory, "accounts.db"))
+        run("sqlite (WAL)", repository, total)
+        repository.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,127 @@
+# Generator beban untuk broker chat. Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_chat_broker --conversations 10000 --messages 10
+#   python -m benchmarks.bench_chat_broker --conversations 10000 --rate 5000   (beban merata)
+#   python -m benchmarks.bench_chat_broker --tcp --conversations 500
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from chat_service.broker import ChatBroker
+from chat_service.server import ChatServer
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report(label, total, elapsed, latencies, broker):
+    print(f"{label}")
+    print(f"  pesan terkirim  {total:,} dalam {elapsed:.2f} s ({total / elapsed:,.0f} pesan/s)")
+    print(f"  latensi p50     {percentile(latencies, 0.50) * 1e3:8.2f} ms")
+    print(f"  latensi p99     {percentile(latencies, 0.99) * 1e3:8.2f} ms")
+    print(f"  perangkat diputus (konsumen lambat): {broker.dropped_devices}")
+
+
+async def in_process(conversations, messages, devices, rate):
+    broker = ChatBroker()
+    expected = conversations * messages * devices
+    latencies = []
+    finished = asyncio.Event()
+
+    async def consume(device):
+        while True:
+            message = await device.receive()
+            latencies.append(time.time() - message.sent_at)
+            if len(latencies) == expected:
+                finished.set()
+
+    consumers = []
+    for i in range(conversations):
+        for d in range(devices):
+            consumers.append(asyncio.create_task(consume(broker.connect(f"b{i}", f"b{i}-{d}"))))
+
+    # rate > 0: tiap percakapan mengirim dengan jeda tetap sehingga total mendekati rate pesan/s
+    interval = conversations / rate if rate else 0
+
+    async def talk(i):
+        if interval:
+            await asyncio.sleep(random.random() * interval)
+        for m in range(messages):
+            await broker.send(f"a{i}", f"b{i}", f"pesan {m}")
+            if interval:
+                await asyncio.sleep(interval)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(talk(i) for i in range(conversations)))
+    await finished.wait()
+    elapsed = time.perf_counter() - start
+
+    for task in consumers:
+        task.cancel()
+    await broker.close()
+    report(f"Broker dalam proses: {conversations:,} percakapan x {messages} pesan, {devices} perangkat/penerima",
+           expected, elapsed, latencies, broker)
+
+
+async def over_tcp(conversations, messages):
+    server = await ChatServer(port=0).start()
+    expected = conversations * messages
+    latencies = []
+    finished = asyncio.Event()
+
+    async def client(user):
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(json.dumps({"login": user}).encode() + b"\n")
+        await writer.drain()
+        return reader, writer
+
+    async def consume(reader):
+        async for line in reader:
+            latencies.append(time.time() - json.loads(line)["sent_at"])
+            if len(latencies) == expected:
+                finished.set()
+
+    receivers = [await client(f"b{i}") for i in range(conversations)]
+    senders = [await client(f"a{i}") for i in range(conversations)]
+    await asyncio.sleep(0.1)
+    consumers = [asyncio.create_task(consume(reader)) for reader, _ in receivers]
+
+    async def talk(i):
+        writer = senders[i][1]
+        for m in range(messages):
+            writer.write(json.dumps({"to": f"b{i}", "text": f"pesan {m}"}).encode() + b"\n")
+        await writer.drain()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(talk(i) for i in range(conversations)))
+    await finished.wait()
+    elapsed = time.perf_counter() - start
+
+    for task in consumers:
+        task.cancel()
+    for _, writer in receivers + senders:
+        writer.close()
+    await server.stop()
+    report(f"Lewat TCP lokal: {conversations:,} percakapan x {messages} pesan", expected, elapsed, latencies, server.broker)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--conversations", type=int, default=10_000)
+    parser.add_argument("--messages", type=int, default=10)
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--rate", type=int, default=0, help="pesan/s total; 0 = kirim sekaligus")
+    parser.add_argument("--tcp", action="store_true")
+    args = parser.parse_args()
+
+    if args.tcp:
+        asyncio.run(over_tcp(args.conversations, args.messages))
+    else:
+        asyncio.run(in_process(args.conversations, args.messages, args.devices, args.rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_chat_history [pesan_per_percakapan] [jumlah_percakapan]
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from chat_service.history import ChatHistoryLog
+
+WRITERS = 8
+SYNC_APPENDS = 2_000
+
+
+def main(argv):
+    per_conversation = int(argv[0]) if len(argv) > 0 else 100_000
+    conversations = int(argv[1]) if len(argv) > 1 else 5
+    text = "Selamat pagi! Jangan lupa senam bersama di taman jam tujuh ya."
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = ChatHistoryLog(directory, segment_bytes=16 * 2**20)
+        total = per_conversation * conversations
+        start = time.perf_counter()
+        for i in range(per_conversation):
+            for c in range(conversations):
+                log.append(f"lansia{c}", "Diana", text)
+        log.flush()
+        elapsed = time.perf_counter() - start
+        print(f"{total:,} pesan, {conversations} percakapan x {per_conversation:,}")
+        print(f"  append (fsync group commit di latar)  {total / elapsed:10,.0f} pesan/s")
+
+        # Append tersinkron dari banyak thread: satu fsync melayani banyak penulis
+        def writer(worker):
+            for i in range(SYNC_APPENDS // WRITERS):
+                log.append(f"lansia{worker}", "Eve", text, sync=True)
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(WRITERS)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"  append sync=True, {WRITERS} thread            {SYNC_APPENDS / elapsed:10,.0f} pesan/s")
+
+        rng = random.Random(2)
+        samples = 500
+        start = time.perf_counter()
+        for _ in range(samples):
+            log.recent("lansia0", "Diana", 50)
+        recent = (time.perf_counter() - start) / samples
+        start = time.perf_counter()
+        for _ in range(samples):
+            log.page("lansia0", "Diana", before=rng.randrange(per_conversation), limit=50)
+        deep = (time.perf_counter() - start) / samples
+        print(f"  baca 50 pesan terakhir                 {recent * 1e6:10.1f} µs")
+        print(f"  baca halaman acak (mundur)             {deep * 1e6:10.1f} µs")
+        log.close()
+
+        start = time.perf_counter()
+        log = ChatHistoryLog(directory)
+        print(f"  buka ulang + bangun indeks             {time.perf_counter() - start:10.2f} s")
+
+        start = time.perf_counter()
+        removed = log.compact(keep_last=1_000)
+        print(f"  kompaksi (simpan 1.000/percakapan)     {time.perf_counter() - start:10.2f} s, {removed:,} pesan dibuang")
+        assert log.count("lansia0", "Diana") == 1_000
+        log.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,139 @@
+# Dasbor termaterialisasi: biaya membangun dasbor semua pengguna, latensi membuka dasbor (satu lookup)
+# dibanding menghitungnya dari tiga sumber setiap kali, dan biaya pembaruan inkremental per kejadian.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_dashboard [jumlah_pengguna]
+import gc
+import random
+import resource
+import sys
+import time
+
+from activities_service.booking import BookingEngine
+from community_service.membership import Membership
+from dashboard_service.context import DashboardContext
+from dashboard_service.store import DashboardStore
+from friends_service.graph import SocialGraph, FRIEND, REQUEST
+
+COMMUNITIES = 500
+ACTIVITIES = 2_000
+FRIENDS = 4             # teman per pengguna (dua arah, jadi rata-rata derajat ~2x)
+SAMPLES = 100_000
+UPDATES = 100_000
+
+
+class DiscardRenderer:
+    def render(self, view):
+        pass
+
+    def flush(self):
+        pass
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return (samples[len(samples) // 2] * 1e6, samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6)
+
+
+def timed(function, arguments):
+    samples = []
+    for argument in arguments:
+        started = time.perf_counter()
+        function(argument)
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def populate(users, rng):
+    graph, engine, membership = SocialGraph(), BookingEngine(), Membership()
+    for activity_id in range(ACTIVITIES):
+        engine.register(activity_id, capacity=len(users))
+    for i, name in enumerate(users):
+        for _ in range(FRIENDS // 2):
+            graph.add(FRIEND, name, users[rng.randrange(len(users))])
+        if i % 3 == 0:
+            graph.add(REQUEST, name, users[rng.randrange(len(users))])
+        for _ in range(rng.randint(0, 3)):
+            membership.join(rng.randrange(COMMUNITIES), name)
+        for _ in range(rng.randint(0, 3)):
+            engine.book(rng.randrange(ACTIVITIES), name)
+    return graph, engine, membership
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 1_000_000
+    rng = random.Random(11)
+    users = [f"lansia{i}" for i in range(count)]
+    communities = [{"id": i, "name": f"Komunitas {i}"} for i in range(COMMUNITIES)]
+    activities = [{"id": i, "name": f"Kegiatan {i}", "time": f"Senin, 3 Juni 2024 ({i % 12 + 7:02d}:00 - "
+                   f"{i % 12 + 8:02d}:00 WIB)"} for i in range(ACTIVITIES)]
+
+    started = time.perf_counter()
+    graph, engine, membership = populate(users, rng)
+    print(f"{count:,} pengguna, {graph.edge_count():,} sisi pertemanan, {COMMUNITIES} komunitas, "
+          f"{ACTIVITIES:,} kegiatan (data sumber dibuat dalam {time.perf_counter() - started:.1f} s)")
+
+    store = DashboardStore(graph, engine, membership, communities, activities)
+    gc.collect()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    for name in users:
+        store.get(name)
+    elapsed = time.perf_counter() - started
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"  materialisasi semua dasbor        {elapsed:8.1f} s  ({elapsed / count * 1e6:.1f} µs/pengguna, "
+          f"RSS +{(rss_after - rss_before) / 1024:,.0f} MiB)")
+
+    sample = [users[rng.randrange(count)] for _ in range(SAMPLES)]
+    p50, p99 = timed(store.build, sample)
+    print(f"  hitung dari 3 sumber per buka     p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+    p50, p99 = timed(store.get, sample)
+    print(f"  buka dasbor termaterialisasi      p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+
+    # Jalur lengkap lewat state: lookup + DashboardView + render (renderer dibuang)
+    context = DashboardContext(username=users[0], renderer=DiscardRenderer(), dashboards=store)
+
+    def open_dashboard(name):
+        context.username = name
+        context.request()
+
+    p50, p99 = timed(open_dashboard, sample[:20_000])
+    print(f"  DashboardContext.request()        p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+
+    # Pembaruan inkremental (hanya bagian dasbor; perubahan sumbernya diukur terpisah di benchmark lain)
+    targets = [(users[rng.randrange(count)], rng.randrange(COMMUNITIES), rng.randrange(ACTIVITIES),
+                users[rng.randrange(count)]) for _ in range(UPDATES)]
+    for label, apply in [
+        ("gabung komunitas", lambda item: store.joined(item[0], item[1])),
+        ("pesan kegiatan", lambda item: store.booked(item[0], item[2])),
+        ("batal kegiatan", lambda item: store.cancelled(item[0], item[2])),
+        ("tambah teman", lambda item: store.friend_added(item[0], item[3])),
+    ]:
+        p50, p99 = timed(apply, targets)
+        print(f"  update: {label:<24}  p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+
+    # Dasbor tetap sama dengan hasil hitung ulang dari sumber bila sumber dan dasbor berubah bersama
+    checks = [(users[rng.randrange(count)], rng.randrange(COMMUNITIES), rng.randrange(ACTIVITIES),
+               users[rng.randrange(count)]) for _ in range(2_000)]
+    for name, _, _, _ in checks:
+        store.forget(name)
+        store.get(name)
+    for name, community_id, activity_id, friend in checks:
+        membership.join(community_id, name)
+        store.joined(name, community_id)
+        engine.book(activity_id, name)
+        store.booked(name, activity_id)
+        graph.add(REQUEST, name, friend)
+        store.friend_added(name, friend)
+        if rng.random() < 0.5:
+            engine.cancel(activity_id, name)
+            store.cancelled(name, activity_id)
+    for name, _, _, _ in checks:
+        entry, fresh = store.get(name), store.build(name)
+        assert set(entry.communities) == set(fresh.communities), name
+        assert set(entry.activities) == set(fresh.activities), name
+        assert set(entry.friends) == set(fresh.friends), name
+    print(f"  konsisten dengan hitung ulang     {len(checks):,} pengguna diperiksa")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
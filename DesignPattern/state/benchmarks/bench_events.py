@@ -0,0 +1,136 @@
+# Log kejadian: throughput append dengan fsync (group commit), append sync=True dari banyak thread,
+# biaya set_state yang tercatat, dan kecepatan replay (agregat dan bangun ulang context).
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_events [jumlah_kejadian] [jumlah_pengguna]
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from events import EventLog, TRANSITION, read_events
+from replay import Aggregates, rebuild_contexts
+from activities_service.context import ActivityContext
+
+WRITERS = 8
+SYNC_APPENDS = 4_000
+NAIVE_APPENDS = 500
+
+# (bobot, layanan, nama, data) — campuran kejadian seorang pengguna aktif
+WORKLOAD = [
+    (30, "friends", TRANSITION, lambda rng: {"from": "search_friends_state", "to": "friend_detail_state"}),
+    (15, "activities", TRANSITION, lambda rng: {"from": "find_activity_state", "to": "book_activity_state"}),
+    (10, "community", TRANSITION, lambda rng: {"from": "browse_community_state", "to": "join_community_state"}),
+    (10, "activities", "activities.selected", lambda rng: {"activity_id": rng.randint(1, 3)}),
+    (8, "activities", "activities.booked", lambda rng: {"activity_id": rng.randint(1, 3), "status": "booked"}),
+    (2, "activities", "activities.cancelled", lambda rng: {"activity_id": rng.randint(1, 3), "promoted": None}),
+    (8, "community", "community.selected", lambda rng: {"community_id": rng.randint(1, 3)}),
+    (5, "community", "community.joined", lambda rng: {"community_id": rng.randint(1, 3)}),
+    (7, "friends", "friends.liked", lambda rng: {"friend": rng.choice(["Diana", "Eve", "Charlie"])}),
+    (5, "friends", "friends.request_sent", lambda rng: {"friend": rng.choice(["Diana", "Eve", "Charlie"])}),
+]
+
+
+def make_events(count, users, seed=3):
+    rng = random.Random(seed)
+    weights = [item[0] for item in WORKLOAD]
+    for item in rng.choices(WORKLOAD, weights, k=count):
+        _, service, name, data = item
+        yield f"lansia{rng.randrange(users)}", service, name, data(rng)
+
+
+def directory_bytes(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def main(argv):
+    count = int(argv[0]) if len(argv) > 0 else 1_000_000
+    users = int(argv[1]) if len(argv) > 1 else 100_000
+    events = list(make_events(count, users))
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = EventLog(directory)
+        start = time.perf_counter()
+        for username, service, name, data in events:
+            log.append(username, service, name, data)
+        log.flush()
+        elapsed = time.perf_counter() - start
+        size = directory_bytes(directory)
+        print(f"{count:,} kejadian, {users:,} pengguna, {size / count:.1f} byte/kejadian")
+        print(f"  append, fsync group commit di latar      {count / elapsed:10,.0f} kejadian/s ({log.commits:,} fsync)")
+
+        # Append tersinkron dari banyak thread: satu fsync melayani banyak penulis
+        def writer(worker):
+            rng = random.Random(worker)
+            for _ in range(SYNC_APPENDS // WRITERS):
+                log.append(f"lansia{worker}", "activities", "activities.booked",
+                           {"activity_id": rng.randint(1, 3), "status": "booked"}, sync=True)
+
+        commits = log.commits
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(WRITERS)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"  append sync=True, {WRITERS} thread              {SYNC_APPENDS / elapsed:10,.0f} kejadian/s "
+              f"({log.commits - commits:,} fsync)")
+
+        # Pembanding: fsync untuk setiap kejadian
+        with open(os.path.join(directory, "naive.bin"), "ab") as handle:
+            start = time.perf_counter()
+            for username, service, name, data in events[:NAIVE_APPENDS]:
+                handle.write(repr((username, service, name, data)).encode())
+                handle.flush()
+                os.fsync(handle.fileno())
+            elapsed = time.perf_counter() - start
+        os.remove(os.path.join(directory, "naive.bin"))
+        print(f"  pembanding: fsync per kejadian           {NAIVE_APPENDS / elapsed:10,.0f} kejadian/s")
+
+        # set_state pada context asli, dengan dan tanpa log
+        context = ActivityContext(username="lansia0", events=log)
+        states = [context.find_activity_state, context.book_activity_state, context.cancel_booking_state]
+        rounds = 100_000
+        start = time.perf_counter()
+        for i in range(rounds):
+            context.set_state(states[i % 3])
+        logged = (time.perf_counter() - start) / rounds
+        start = time.perf_counter()
+        for i in range(rounds):
+            context.state = states[i % 3]
+        bare = (time.perf_counter() - start) / rounds
+        print(f"  set_state tercatat                       {logged * 1e6:10.2f} µs (tanpa log {bare * 1e6:.2f} µs)")
+        log.close()
+
+        total = count + SYNC_APPENDS + rounds
+        start = time.perf_counter()
+        replayed = sum(1 for _ in read_events(directory))
+        elapsed = time.perf_counter() - start
+        assert replayed == total, (replayed, total)
+        print(f"  replay: baca + decode                    {replayed / elapsed:10,.0f} kejadian/s")
+
+        aggregates = Aggregates()
+        start = time.perf_counter()
+        for event in read_events(directory):
+            aggregates.apply(event)
+        elapsed = time.perf_counter() - start
+        print(f"  replay: agregat                          {replayed / elapsed:10,.0f} kejadian/s")
+
+        subset = list(read_events(directory))[:200_000]
+        start = time.perf_counter()
+        sessions = rebuild_contexts(subset)
+        elapsed = time.perf_counter() - start
+        print(f"  replay: bangun ulang context             {len(subset) / elapsed:10,.0f} kejadian/s "
+              f"({len(sessions):,} pengguna)")
+
+        start = time.perf_counter()
+        reopened = EventLog(directory)
+        print(f"  buka ulang (pulihkan nomor urut)         {(time.perf_counter() - start) * 1e3:10.1f} ms")
+        assert reopened.seq == total
+        reopened.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
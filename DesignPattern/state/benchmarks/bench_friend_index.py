@@ -0,0 +1,82 @@
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_friend_index [jumlah_profil ...]
+import random
+import sys
+import time
+
+from friends_service.index import FriendIndex
+
+INTERESTS = [
+    "Yoga", "Reading", "Cooking", "Gaming", "Berkebun", "Membaca", "Menyanyi",
+    "Merajut", "Catur", "Jalan Kaki", "Memancing", "Melukis", "Tai Chi", "Musik",
+    "Menari", "Fotografi", "Bersepeda", "Berenang", "Puisi", "Sejarah",
+]
+QUERIES = 200
+
+
+def make_profiles(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"lansia{i}",
+            "photo": f"lansia{i}.jpg",
+            "interest": rng.sample(INTERESTS, rng.randint(1, 4)),
+            "description": "",
+            "age": rng.randint(55, 95),
+        }
+        for i in range(count)
+    ]
+
+
+def scan(profiles, interest_filter):
+    return [p for p in profiles if interest_filter in p["interest"]]
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    return (time.perf_counter() - start) / repeat
+
+
+def run(count):
+    profiles = make_profiles(count)
+    rng = random.Random(count)
+    singles = [rng.choice(INTERESTS) for _ in range(QUERIES)]
+    pairs = [rng.sample(INTERESTS, 2) for _ in range(QUERIES)]
+
+    start = time.perf_counter()
+    index = FriendIndex(profiles)
+    build = time.perf_counter() - start
+
+    repeat = max(3, QUERIES * 10_000 // count)
+    repeat = min(repeat, QUERIES)
+    results = {
+        "scan 1 minat": timed(lambda i: scan(profiles, singles[i]), repeat),
+        "index 1 minat": timed(lambda i: index.search(all_of=[singles[i]]), repeat),
+        "index 2 minat (AND)": timed(lambda i: index.search(all_of=pairs[i]), repeat),
+        "index 2 minat (OR)": timed(lambda i: index.search(any_of=pairs[i]), repeat),
+        "index usia 70-75": timed(lambda i: index.search(min_age=70, max_age=75), repeat),
+        "index minat + usia + hal. 3": timed(
+            lambda i: index.search(all_of=[singles[i]], min_age=65, max_age=80, offset=40), repeat
+        ),
+    }
+
+    start = time.perf_counter()
+    for i in range(QUERIES):
+        index.update_interests(f"lansia{i}", pairs[i])
+    update = (time.perf_counter() - start) / QUERIES
+
+    print(f"\n{count:,} profil (bangun indeks {build:.2f} s, update minat {update * 1e6:.1f} µs)")
+    for name, seconds in results.items():
+        print(f"  {name:<30} {seconds * 1e3:10.3f} ms/query")
+
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or [10_000, 100_000, 1_000_000]
+    for count in sizes:
+        run(count)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
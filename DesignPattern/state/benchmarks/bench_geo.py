@@ -0,0 +1,75 @@
+# Benchmark query "di sekitar saya": GeoGrid vs pemindaian linear. Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_geo [jumlah_titik ...]
+import random
+import sys
+import time
+
+from geo import GeoGrid, distance_km
+
+QUERIES = 500
+K = 10
+RADIUS_KM = 2.0
+# Titik tersebar di Pulau Jawa, sebagian besar menumpuk di sekitar kota-kota besar
+CITIES = [(-6.20, 106.82), (-6.91, 107.61), (-7.25, 112.75), (-6.97, 110.42), (-7.80, 110.36)]
+
+
+def make_points(count, seed=3):
+    rng = random.Random(seed)
+    points = []
+    for key in range(count):
+        if rng.random() < 0.7:
+            lat, lon = rng.choice(CITIES)
+            points.append((key, rng.gauss(lat, 0.15), rng.gauss(lon, 0.15)))
+        else:
+            points.append((key, rng.uniform(-8.5, -6.0), rng.uniform(105.5, 114.5)))
+    return points
+
+
+def brute_nearest(points, lat, lon, k):
+    distances = sorted((distance_km(lat, lon, p_lat, p_lon), key) for key, p_lat, p_lon in points)
+    return distances[:k]
+
+
+def run(count, cell_degrees):
+    points = make_points(count)
+    started = time.perf_counter()
+    grid = GeoGrid(cell_degrees)
+    grid.bulk_load(points)
+    build = time.perf_counter() - started
+
+    rng = random.Random(11)
+    queries = [(lat + rng.gauss(0, 0.01), lon + rng.gauss(0, 0.01)) for _, lat, lon in rng.sample(points, QUERIES)]
+
+    started = time.perf_counter()
+    for lat, lon in queries:
+        grid.nearest(lat, lon, K)
+    knn = (time.perf_counter() - started) / QUERIES
+
+    started = time.perf_counter()
+    found = 0
+    for lat, lon in queries:
+        found += len(grid.within(lat, lon, RADIUS_KM))
+    radius = (time.perf_counter() - started) / QUERIES
+
+    # Pemindaian linear hanya untuk beberapa query (lambat) dan untuk memeriksa hasil
+    checked = queries[:3]
+    started = time.perf_counter()
+    expected = [brute_nearest(points, lat, lon, K) for lat, lon in checked]
+    brute = (time.perf_counter() - started) / len(checked)
+    for (lat, lon), want in zip(checked, expected):
+        got = grid.nearest(lat, lon, K)
+        assert [round(d, 9) for d, _ in got] == [round(d, 9) for d, _ in want], "hasil k-NN berbeda"
+
+    print(f"{count:>10,} titik, sel {cell_degrees}° | bangun {build:.2f} s | {K}-NN {knn * 1e3:.3f} ms | "
+          f"radius {RADIUS_KM} km {radius * 1e3:.3f} ms (~{found // QUERIES:,} titik) | "
+          f"pemindaian {brute * 1e3:,.0f} ms ({brute / knn:,.0f}x lebih lambat)")
+
+
+def main(sizes):
+    for count in sizes:
+        for cell_degrees in (0.05, 0.01):
+            run(count, cell_degrees)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,75 @@
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_login [jumlah_login_bersamaan] [scrypt_n]
+import asyncio
+import statistics
+import sys
+import time
+
+from auth_service.credentials import CredentialService
+from auth_service.repository import InMemoryAccountRepository, new_account
+
+ACCOUNTS = 200
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def storm(credentials, repository, logins):
+    latencies = []
+    lags = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        # Layanan lain di event loop yang sama: ukur keterlambatan tick 10 ms
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    async def login(i):
+        start = time.perf_counter()
+        account = await credentials.authenticate_async(repository, f"lansia{i % ACCOUNTS}", "rahasia")
+        latencies.append(time.perf_counter() - start)
+        assert account is not None
+
+    ticker = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    await asyncio.gather(*(login(i) for i in range(logins)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+    return elapsed, latencies, lags
+
+
+def main(argv):
+    logins = int(argv[0]) if len(argv) > 0 else 500
+    n = int(argv[1]) if len(argv) > 1 else 2**14
+
+    setup = CredentialService(n=n)
+    repository = InMemoryAccountRepository()
+    password_hash = setup.hash("rahasia")
+    for i in range(ACCOUNTS):
+        repository.create(new_account(f"lansia{i}", f"lansia{i}@example.com", f"Lansia {i}", password_hash))
+    setup.shutdown()
+
+    credentials = CredentialService(n=n, max_pending=32, queue_timeout=60)
+    elapsed, latencies, lags = asyncio.run(storm(credentials, repository, logins))
+    credentials.shutdown()
+
+    print(f"{logins} login bersamaan, scrypt n={n}, {credentials.executor._max_workers} worker")
+    print(f"  throughput      {logins / elapsed:10.1f} login/s")
+    print(f"  latensi p50     {percentile(latencies, 0.50) * 1e3:10.1f} ms")
+    print(f"  latensi p99     {percentile(latencies, 0.99) * 1e3:10.1f} ms")
+    print(f"  lag event loop  {statistics.mean(lags) * 1e3:10.2f} ms rata-rata, {max(lags) * 1e3:.2f} ms maks")
+
+    # Rehash otomatis saat parameter biaya dinaikkan
+    stronger = CredentialService(n=n * 2)
+    account = stronger.authenticate(repository, "lansia0", "rahasia")
+    print(f"  rehash ke n={n * 2}  {'ya' if account['password_hash'] != password_hash else 'tidak'}")
+    stronger.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,113 @@
+# Perjodohan mode cinta: waktu job malam untuk semua pengguna (per wilayah, di process pool) dan
+# latensi perbaikan inkremental saat satu profil berubah, dibanding menghitung ulang satu wilayah.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_matchmaking [jumlah_pengguna] [pekerja]
+import os
+import random
+import sys
+import time
+
+from friends_service.matchmaking import Matchmaker, RegionShard, TOP_K, WINDOW
+
+CHANGES = 2_000
+
+# (lat, lon) pusat kota; bobot mengikuti Zipf sehingga beberapa kota jauh lebih padat
+CITIES = [
+    (-6.2, 106.8), (-7.25, 112.75), (-6.9, 107.6), (3.6, 98.67), (-6.97, 110.42), (-5.15, 119.43),
+    (-2.99, 104.76), (-7.8, 110.36), (-0.95, 100.35), (-8.65, 115.22), (-1.27, 116.83), (0.51, 101.45),
+    (-3.32, 114.59), (-0.03, 109.33), (-7.98, 112.63), (-6.6, 106.8), (-6.24, 106.99), (-6.18, 106.63),
+    (1.47, 124.84), (-3.7, 128.18), (-10.18, 123.6), (-2.53, 140.72), (-0.5, 117.15), (-7.57, 110.82),
+    (-6.73, 108.55), (-7.33, 108.22), (-8.58, 116.1), (-1.61, 103.61), (-5.43, 105.26), (-3.8, 102.27),
+]
+HOBBIES = [
+    "Berkebun", "Memasak", "Membaca", "Yoga", "Jalan Pagi", "Menyanyi", "Menari", "Memancing", "Catur",
+    "Merajut", "Melukis", "Fotografi", "Senam", "Bersepeda", "Berenang", "Karaoke", "Angklung", "Keroncong",
+    "Wayang", "Batik", "Tanaman Hias", "Burung", "Kaligrafi", "Puisi", "Sejarah", "Pengajian", "Paduan Suara",
+    "Tai Chi", "Bulu Tangkis", "Tenis Meja", "Domino", "Teka-teki Silang", "Menjahit", "Kerajinan", "Musik",
+    "Film", "Wisata", "Kuliner", "Relawan", "Cucu",
+]
+WORDS = (
+    "pensiun guru pegawai petani pedagang perawat dokter tentara sopir penjahit nelayan pasar kampung desa "
+    "kota anak cucu istri suami almarhum keluarga rumah kebun sawah sungai laut gunung pantai masjid gereja "
+    "pura sekolah kantor pabrik toko warung pagi sore malam minggu liburan perjalanan mudik haji umrah "
+    "tetangga sahabat teman lama baru sehat sakit rajin tenang sabar ramah senang bahagia rindu sepi "
+    "menanam memasak membaca menulis mengajar menyanyi menari berjalan bersepeda berenang memancing "
+    "merawat menjahit melukis berdoa bercerita mendengarkan radio televisi koran buku lagu musik kopi teh "
+    "kue sayur buah bunga kucing burung ayam batik wayang gamelan keroncong dangdut angklung"
+).split()
+
+
+def profile(index, rng):
+    lat, lon = CITIES[min(int(rng.paretovariate(1.0)) - 1, len(CITIES) - 1)]
+    return {
+        "name": f"lansia{index}",
+        "mode": "cinta",
+        "age": rng.randint(60, 90),
+        "interest": rng.sample(HOBBIES, rng.randint(2, 5)),
+        "story": " ".join(rng.choices(WORDS, k=rng.randint(8, 16))),
+        "lat": lat + rng.uniform(-0.4, 0.4),
+        "lon": lon + rng.uniform(-0.4, 0.4),
+    }
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return (samples[len(samples) // 2] * 1e3, samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e3)
+
+
+def check(matchmaker):
+    for name, (partner, score) in matchmaker.matches.items():
+        assert matchmaker.matches[partner] == (name, score), name
+        assert name in matchmaker.region_for and partner in matchmaker.region_for, name
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 1_000_000
+    workers = int(argv[1]) if len(argv) > 1 else os.cpu_count() or 1
+    rng = random.Random(24)
+
+    started = time.perf_counter()
+    profiles = [profile(i, rng) for i in range(count)]
+    matchmaker = Matchmaker(profiles)
+    sizes = sorted((len(rows) for rows in matchmaker.regions.values()), reverse=True)
+    print(f"{count:,} pengguna cinta di {len(sizes)} wilayah (terbesar {sizes[0]:,}, median {sizes[len(sizes) // 2]:,}); "
+          f"TOP_K={TOP_K}, WINDOW={WINDOW} (data dibuat dalam {time.perf_counter() - started:.1f} s)")
+
+    started = time.perf_counter()
+    pairs = matchmaker.run(workers=workers)
+    elapsed = time.perf_counter() - started
+    check(matchmaker)
+    average = sum(score for _, score in matchmaker.matches.values()) / max(1, len(matchmaker.matches))
+    print(f"  job malam, {workers} pekerja           {elapsed:8.1f} s  ({elapsed / count * 1e6:.1f} µs/pengguna)")
+    print(f"  hasil                            {pairs:,} pasangan, {2 * pairs / count:.0%} pengguna terjodohkan, "
+          f"skor rata-rata {average:.2f}")
+
+    largest = max(matchmaker.regions.values(), key=len)
+    started = time.perf_counter()
+    RegionShard(largest.values()).match()
+    print(f"  hitung ulang wilayah terbesar    {time.perf_counter() - started:8.2f} s  ({len(largest):,} pengguna)")
+
+    # Perubahan satu profil: hobi dan cerita baru, kadang pindah kota atau keluar dari mode cinta
+    first, warm = [], []
+    for _ in range(CHANGES):
+        name = f"lansia{rng.randrange(count)}"
+        changed = profile(int(name[len("lansia"):]), rng)
+        if rng.random() < 0.05:
+            changed["mode"] = "pertemanan"
+        region = matchmaker.region_for.get(name)
+        cold = region is not None and region not in matchmaker.shards
+        started = time.perf_counter()
+        matchmaker.update(changed)
+        (first if cold else warm).append(time.perf_counter() - started)
+    check(matchmaker)
+    p50, p99 = percentiles(warm)
+    print(f"  ubah profil (shard sudah ada)    p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  ({len(warm):,} perubahan)")
+    if first:
+        p50, p99 = percentiles(first)
+        print(f"  ubah profil pertama di wilayah   p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  ({len(first):,} perubahan, "
+              f"termasuk membangun shard)")
+    print(f"  konsisten setelah perubahan      {len(matchmaker.matches) // 2:,} pasangan saling cocok")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
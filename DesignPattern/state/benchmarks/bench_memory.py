@@ -0,0 +1,79 @@
+# Memori per sesi: N context hidup sekaligus per layanan, diukur dengan tracemalloc.
+# Layanan bersama (repositori, hub, broker, mesin booking, katalog) dibuat sebelum pengukuran,
+# jadi angka di bawah hanya biaya sesi itu sendiri.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_memory [jumlah_sesi]
+import contextlib
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from storage import DATA_ENV
+
+os.environ.setdefault(DATA_ENV, tempfile.mkdtemp(prefix="silverconnect-bench-"))
+
+from auth_service.context import AuthContext
+from dashboard_service.context import DashboardContext
+from settings_service.context import SettingsContext
+from friends_service.context import FriendContext
+from chat_service.context import ChatContext
+from community_service.context import CommunityContext
+from activities_service.context import ActivityContext
+from notifications_service.context import NotificationContext
+
+
+def start_chat(index):
+    chat = ChatContext(f"lansia{index}")
+    chat.request(friend_name="Diana")      # ChatStartState → ChatSendMessageState
+    return chat
+
+
+SERVICES = [
+    ("AuthContext", lambda i: AuthContext(username=f"lansia{i}", password="rahasia123", email=f"lansia{i}@example.com")),
+    ("DashboardContext", lambda i: DashboardContext(username=f"lansia{i}")),
+    ("SettingsContext", lambda i: SettingsContext(username=f"lansia{i}")),
+    ("FriendContext", lambda i: FriendContext(username=f"lansia{i}", hobbies=["Yoga", "Membaca"], mode="cinta")),
+    ("ChatContext", lambda i: ChatContext(f"lansia{i}")),
+    ("ChatContext (mulai chat)", start_chat),
+    ("CommunityContext", lambda i: CommunityContext(username=f"lansia{i}")),
+    ("ActivityContext", lambda i: ActivityContext(username=f"lansia{i}")),
+    ("NotificationContext", lambda i: NotificationContext(username=f"lansia{i}")),
+]
+
+
+def measure(factory, sessions):
+    factory(-1)     # pemanasan: layanan default dan cache impor
+    names = [f"lansia{i}" for i in range(sessions)]   # string nama tidak dihitung sebagai biaya sesi
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    live = [factory(i) for i in range(sessions)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del live, names
+    return (after - before) / sessions
+
+
+def main(sessions):
+    print(f"{sessions:,} sesi hidup per layanan")
+    print(f"{'Context':<28}{'byte/sesi':>12}")
+    total = 0
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        results = [(name, measure(factory, sessions)) for name, factory in SERVICES]
+    for name, per_session in results:
+        print(f"{name:<28}{per_session:>12,.0f}")
+        if "(" not in name:
+            total += per_session
+    print(f"{'Total satu pengguna':<28}{total:>12,.0f}")
+    print(f"→ {sessions_per_gib(total):,.0f} pengguna per GiB")
+
+
+def sessions_per_gib(per_session):
+    return (1 << 30) / per_session if per_session else 0
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
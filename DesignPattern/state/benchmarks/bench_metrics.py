@@ -0,0 +1,117 @@
+# Biaya instrumentasi per panggilan request(): metrik mati (request() asli), metrik menyala
+# (histogram + perpindahan state), banyak thread, serta waktu ekspor teks Prometheus.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_metrics [jumlah_panggilan]
+import sys
+import threading
+import time
+
+from metrics import default_metrics
+from dashboard_service.context import DashboardContext
+from notifications_service.context import NotificationContext
+
+ROUNDS = 5
+THREADS = 4
+
+
+class DiscardRenderer:
+    def render(self, view):
+        pass
+
+    def flush(self):
+        pass
+
+
+def best_of(function, calls):
+    # Putaran tercepat, dalam ns per panggilan
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        function(calls)
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1e9
+
+
+def main(argv):
+    calls = int(argv[0]) if argv else 200_000
+    metrics = default_metrics()
+    renderer = DiscardRenderer()
+    dashboard = DashboardContext(username="lansia0", renderer=renderer)
+    notifications = NotificationContext(username="lansia0", renderer=renderer)
+
+    def requests(count):
+        request = dashboard.request
+        for _ in range(count):
+            request()
+
+    def with_transitions(count):
+        # Pindah bolak-balik antar state agar setiap panggilan mencatat satu sisi perpindahan
+        states = (dashboard.dashboard_state, dashboard.settings_state)
+        for i in range(count):
+            dashboard.state = states[i & 1]
+            dashboard.request()
+        dashboard.state = dashboard.dashboard_state
+
+    metrics.disable()
+    plain = type(dashboard).request
+    disabled = best_of(requests, calls)
+    metrics.enable()
+    assert type(dashboard).request.__wrapped__ is plain
+    enabled = best_of(requests, calls)
+    metrics.disable()
+    assert type(dashboard).request is plain
+    metrics.reset()
+    print(f"{calls:,} panggilan DashboardContext.request(), putaran tercepat dari {ROUNDS}")
+    print(f"  metrik mati (request() asli)     {disabled:8.0f} ns/panggilan")
+    print(f"  metrik menyala                   {enabled:8.0f} ns/panggilan  (+{enabled - disabled:.0f} ns)")
+
+    # State diganti dari luar sebelum setiap request, sehingga setiap panggilan tercatat dengan
+    # state yang berbeda-beda (dua seri histogram)
+    metrics.disable()
+    moving_off = best_of(with_transitions, calls)
+    metrics.enable()
+    moving_on = best_of(with_transitions, calls)
+    print(f"  request + ganti state, mati      {moving_off:8.0f} ns/panggilan")
+    print(f"  request + ganti state, menyala   {moving_on:8.0f} ns/panggilan  (+{moving_on - moving_off:.0f} ns)")
+
+    # Beberapa thread sekaligus: setiap thread menulis ke shard-nya sendiri tanpa lock
+    metrics.reset()
+    metrics.enable()
+    contexts = [NotificationContext(username=f"lansia{i}", renderer=renderer) for i in range(THREADS)]
+
+    def worker(context):
+        for _ in range(calls // THREADS):
+            context.request()
+
+    def run_threads():
+        threads = [threading.Thread(target=worker, args=(context,)) for context in contexts]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return (time.perf_counter() - started) / (calls // THREADS * THREADS) * 1e9
+
+    metrics.disable()
+    threaded_off = run_threads()
+    metrics.enable()
+    threaded_on = run_threads()
+    observed = sum(sum(item.counts) for item in metrics.snapshot()[0].values())
+    assert observed == calls // THREADS * THREADS, observed
+    print(f"  {THREADS} thread, mati                   {threaded_off:8.0f} ns/panggilan")
+    print(f"  {THREADS} thread, menyala                {threaded_on:8.0f} ns/panggilan  (+{threaded_on - threaded_off:.0f} ns), "
+          f"{observed:,} tercatat")
+
+    # Ekspor: banyak seri (layanan x state) dan sisi perpindahan
+    for i in range(2_000):
+        metrics.observe("friends", notifications.check_notification_state, i * 1e-6, dashboard.dashboard_state)
+    started = time.perf_counter()
+    text = metrics.render()
+    print(f"  render Prometheus                {(time.perf_counter() - started) * 1e3:8.2f} ms, "
+          f"{text.count(chr(10)):,} baris")
+    metrics.disable()
+    metrics.reset()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,49 @@
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_notifications [jumlah_inbox]
+import random
+import sys
+import time
+
+from notifications_service.inbox import NotificationHub
+
+CHECKS = 20_000
+
+
+def main(argv):
+    users = [f"lansia{i}" for i in range(int(argv[0]) if argv else 1_000_000)]
+    hub = NotificationHub()
+
+    start = time.perf_counter()
+    for user in users:
+        hub.push(user, "friend", "🤝 Ada permintaan pertemanan baru.")
+    print(f"{len(users):,} inbox, isi awal {time.perf_counter() - start:.1f} s")
+
+    start = time.perf_counter()
+    hub.broadcast("event", "🎉 Perayaan Ulang Tahun Bulanan Jumat ini jam 16:00!")
+    print(f"  broadcast ke semua inbox (ring bersama)   {(time.perf_counter() - start) * 1e6:10.1f} µs")
+
+    start = time.perf_counter()
+    hub.push_many(users, "event", "🎶 Musik langsung di halaman besok pagi!")
+    elapsed = time.perf_counter() - start
+    print(f"  fan-out tertarget push_many ke semua      {elapsed * 1e3:10.1f} ms ({len(users) / elapsed:,.0f} inbox/s)")
+
+    rng = random.Random(4)
+    sample = [users[rng.randrange(len(users))] for _ in range(CHECKS)]
+    for user in sample[:CHECKS // 2]:
+        for i in range(20):
+            hub.push(user, "chat", f"💬 pesan {i}")
+
+    start = time.perf_counter()
+    for user in sample:
+        hub.unread_count(user)
+    unread = (time.perf_counter() - start) / CHECKS
+    start = time.perf_counter()
+    for user in sample:
+        hub.check(user)
+    check = (time.perf_counter() - start) / CHECKS
+    print(f"  unread_count per pengguna                 {unread * 1e6:10.1f} µs")
+    print(f"  check (baca + tandai dibaca)              {check * 1e6:10.1f} µs")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
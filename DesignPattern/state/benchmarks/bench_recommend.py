@@ -0,0 +1,45 @@
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_recommend [jumlah_kandidat] [jumlah_pengguna_batch]
+import os
+import random
+import sys
+import time
+
+from benchmarks.bench_friend_index import INTERESTS, make_profiles
+from friends_service.recommend import HobbyRecommender, recommend_all
+
+MODES = ["pertemanan", "cinta"]
+
+
+def main(argv):
+    candidates = int(argv[0]) if len(argv) > 0 else 100_000
+    batch_users = int(argv[1]) if len(argv) > 1 else 1_000
+
+    profiles = make_profiles(candidates)
+    rng = random.Random(5)
+    for profile in profiles:
+        profile["mode"] = rng.choice(MODES)
+
+    start = time.perf_counter()
+    recommender = HobbyRecommender(profiles)
+    print(f"{candidates:,} kandidat, encode bitset {time.perf_counter() - start:.2f} s")
+
+    queries = [(rng.sample(INTERESTS, 3), rng.choice(MODES)) for _ in range(50)]
+    start = time.perf_counter()
+    for hobbies, mode in queries:
+        recommender.recommend(hobbies, mode=mode, k=10)
+    elapsed = (time.perf_counter() - start) / len(queries)
+    print(f"  satu pengguna vs semua kandidat  {elapsed * 1e3:8.1f} ms "
+          f"({candidates / elapsed / 1e6:.2f} juta pasangan/s)")
+
+    users = [(p["name"], p["interest"], p["mode"]) for p in profiles[:batch_users]]
+    for workers in sorted({1, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        results = recommend_all(recommender, users, k=10, workers=workers, chunk_size=250)
+        elapsed = time.perf_counter() - start
+        print(f"  batch {len(results):,} pengguna, {workers} proses   {elapsed:8.1f} s "
+              f"({len(results) / elapsed:.1f} pengguna/s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
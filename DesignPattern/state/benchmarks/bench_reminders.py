@@ -0,0 +1,137 @@
+# Pengingat kegiatan: throughput sisip, batal dan picu dengan jutaan pengingat menunggu di roda waktu,
+# biaya tulis ke SQLite (write-behind) dan waktu memuat ulang setelah restart.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_reminders [jumlah_pengingat] [jumlah_kegiatan]
+import gc
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from activities_service.reminders import ReminderScheduler, ReminderStore, REMINDER_OFFSETS
+
+START = 1_717_372_800           # Senin, 3 Juni 2024 07:00 WIB
+HORIZON = 30 * 86400            # kegiatan tersebar dalam 30 hari ke depan
+FIRE_SPAN = 7 * 86400           # jam simulasi dimajukan 7 hari
+POLL_EVERY = 60                 # detik simulasi per poll
+CANCELLED = 0.1                 # bagian pesanan yang dibatalkan
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class CountingHub:
+    # Pengganti NotificationHub: hanya menghitung, supaya yang diukur adalah penjadwal
+    def __init__(self):
+        self.batches = self.delivered = 0
+
+    def push_many(self, users, category, text):
+        self.batches += 1
+        self.delivered += len(users)
+
+
+class TimedStore(ReminderStore):
+    # Mencatat waktu tulis SQLite agar biaya roda waktu bisa dipisahkan dari biaya disk
+    def __init__(self, path):
+        super().__init__(path)
+        self.elapsed = 0.0
+
+    def save(self, bookings):
+        started = time.perf_counter()
+        super().save(bookings)
+        self.elapsed += time.perf_counter() - started
+
+
+def activity(activity_id):
+    return {"name": f"Kegiatan {activity_id}", "time": "Senin, 07:00 WIB", "location": "Balai Warga"}
+
+
+def rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 10_000_000
+    activities = int(argv[1]) if len(argv) > 1 else 5_000
+    bookings = count // len(REMINDER_OFFSETS)
+    rng = random.Random(25)
+    starts = [START + 86400 + rng.randrange(HORIZON) for _ in range(activities)]
+    print(f"{bookings:,} pesanan x {len(REMINDER_OFFSETS)} pengingat = {count:,} pengingat, {activities:,} kegiatan")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "reminders.db")
+        clock, hub = Clock(START), CountingHub()
+        store = TimedStore(path)
+        scheduler = ReminderScheduler(hub, store, clock=clock, activities=activity, write_behind=True)
+        picks = [rng.randrange(activities) for _ in range(bookings)]
+
+        gc.collect()
+        before = rss_mib()
+        started = time.perf_counter()
+        for user, activity_id in enumerate(picks):
+            scheduler.schedule(f"lansia{user}", activity_id, starts[activity_id])
+        elapsed = time.perf_counter() - started
+        pending = len(scheduler)
+        print(f"  schedule                         {elapsed:8.2f} s  ({pending / (elapsed - store.elapsed):,.0f} "
+              f"pengingat/s tanpa SQLite, RSS +{rss_mib() - before:,.0f} MiB)")
+        scheduler.flush()
+        print(f"    di antaranya write-behind      {store.elapsed:8.2f} s  ({pending / store.elapsed:,.0f} baris/s)")
+        print(f"  di SQLite                        {scheduler.store.count():,} baris")
+
+        cancelled = rng.sample(range(bookings), int(bookings * CANCELLED))
+        store.elapsed = 0.0
+        started = time.perf_counter()
+        removed = 0
+        for user in cancelled:
+            removed += scheduler.cancel(f"lansia{user}", picks[user])
+        elapsed = time.perf_counter() - started
+        print(f"  cancel                           {elapsed:8.2f} s  ({removed / (elapsed - store.elapsed):,.0f} "
+              f"pengingat/s tanpa SQLite, {len(scheduler):,} tersisa)")
+        for user in cancelled:
+            picks[user] = None
+
+        # Jam dimajukan per menit selama seminggu; setiap poll memicu dan mengirim yang jatuh tempo
+        expected = sum(1 for activity_id in picks if activity_id is not None
+                       for offset in REMINDER_OFFSETS if starts[activity_id] - offset <= START + FIRE_SPAN)
+        store.elapsed = 0.0
+        started = time.perf_counter()
+        polls = 0
+        for now in range(START + POLL_EVERY, START + FIRE_SPAN + 1, POLL_EVERY):
+            clock.now = now
+            scheduler.poll()
+            polls += 1
+        elapsed = time.perf_counter() - started
+        print(f"  poll selama 7 hari simulasi      {elapsed:8.2f} s  ({hub.delivered / (elapsed - store.elapsed):,.0f} "
+              f"pengingat/s tanpa SQLite, {polls:,} poll, {hub.delivered:,} terkirim dalam {hub.batches:,} batch)")
+        assert hub.delivered == expected, (hub.delivered, expected)
+
+        started = time.perf_counter()
+        scheduler.flush()
+        print(f"  flush sisa perubahan             {time.perf_counter() - started:8.2f} s")
+        remaining = len(scheduler)
+        samples = {f"lansia{user}": (activity_id, scheduler.pending_for(f"lansia{user}", activity_id))
+                   for user, activity_id in enumerate(picks[:100_000]) if activity_id is not None}
+        scheduler.close()
+        del scheduler
+        gc.collect()
+
+        started = time.perf_counter()
+        scheduler = ReminderScheduler(hub, ReminderStore(path), clock=clock, activities=activity)
+        elapsed = time.perf_counter() - started
+        print(f"  muat ulang setelah restart       {elapsed:8.2f} s  ({len(scheduler):,} pengingat menunggu)")
+        assert len(scheduler) == remaining, (len(scheduler), remaining)
+        for user, (activity_id, rows) in samples.items():
+            assert sorted(scheduler.pending_for(user, activity_id)) == sorted(rows), user
+        scheduler.close()
+        print(f"  konsisten setelah restart        {len(samples):,} pesanan diperiksa")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
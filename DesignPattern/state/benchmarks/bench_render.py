@@ -0,0 +1,75 @@
+# Benchmark alur main() dengan output ke pipe: waktu per alur dan jumlah syscall write().
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_render [jumlah_alur]
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from storage import DATA_ENV
+
+JOURNEY_ANSWERS = ["cinta", "Yoga, Membaca", "Cerita", "n", "Besar", "Gelap", "1", "y", "2", "y"]
+
+
+class CountingFile(io.FileIO):
+    # Menghitung syscall write() yang benar-benar sampai ke file descriptor
+    writes = 0
+
+    def write(self, data):
+        CountingFile.writes += 1
+        return super().write(data)
+
+
+def drain(fd):
+    while os.read(fd, 65536):
+        pass
+
+
+def piped_stdout(line_buffering):
+    # line_buffering=True meniru terminal / PYTHONUNBUFFERED: setiap baris langsung ditulis
+    read_fd, write_fd = os.pipe()
+    reader = threading.Thread(target=drain, args=(read_fd,), daemon=True)
+    reader.start()
+    raw = CountingFile(write_fd, "w")
+    stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=line_buffering)
+    return stream, reader, read_fd
+
+
+def run(journeys, line_buffering):
+    from console import ScriptedInput
+    import main as app
+
+    stream, reader, read_fd = piped_stdout(line_buffering)
+    original = sys.stdout
+    CountingFile.writes = 0
+    sys.stdout = stream
+    try:
+        started = time.perf_counter()
+        for _ in range(journeys):
+            app.main(ScriptedInput(JOURNEY_ANSWERS))
+        stream.flush()
+        elapsed = time.perf_counter() - started
+    finally:
+        sys.stdout = original
+        stream.close()
+        reader.join()
+        os.close(read_fd)
+    label = "per baris (tty)" if line_buffering else "blok (pipe)"
+    print(f"{label:<16} {elapsed / journeys * 1e3:8.2f} ms/alur  {CountingFile.writes / journeys:7.1f} write()/alur")
+
+
+def main(journeys):
+    os.environ[DATA_ENV] = tempfile.mkdtemp(prefix="silverconnect-bench-")
+    # Hash kata sandi murah agar yang terukur adalah state dan output, bukan scrypt
+    from auth_service import credentials
+    credentials._default_service = credentials.CredentialService(n=2**10, workers=1)
+
+    run(1, False)   # pemanasan: impor modul dan layanan default
+    for line_buffering in (False, True):
+        run(journeys, line_buffering)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,72 @@
+# Benchmark query jadwal: indeks interval vs pemindaian linear. Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_schedule [jumlah_sesi ...]
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from activities_service.schedule import WIB, ScheduleIndex, this_week_between, week_start
+
+QUERIES = 200
+
+
+def make_sessions(count, seed=7):
+    # Sesi 30-180 menit tersebar acak selama satu tahun, mulai antara 06:00 dan 20:00
+    rng = random.Random(seed)
+    origin = datetime(2024, 1, 1, tzinfo=WIB)
+    sessions = []
+    for session_id in range(count):
+        start = origin + timedelta(days=rng.randrange(365), minutes=rng.randrange(6 * 60, 20 * 60, 15))
+        sessions.append((session_id, start, start + timedelta(minutes=rng.randrange(30, 181, 15))))
+    return sessions
+
+
+def scan_between(sessions, start, end):
+    return [session_id for session_id, s, e in sessions if s < end and start < e]
+
+
+def run(count):
+    sessions = make_sessions(count)
+    started = time.perf_counter()
+    index = ScheduleIndex(sessions)
+    build = time.perf_counter() - started
+
+    rng = random.Random(1)
+    days = [datetime(2024, 1, 1).date() + timedelta(days=rng.randrange(358)) for _ in range(QUERIES)]
+
+    started = time.perf_counter()
+    found = 0
+    for day in days:
+        found += len(this_week_between(index, 8, 12, day))
+    weekly = (time.perf_counter() - started) / QUERIES
+
+    started = time.perf_counter()
+    for day in days:
+        index.happening_at(datetime.combine(day, datetime.min.time(), WIB) + timedelta(hours=10))
+    now = (time.perf_counter() - started) / QUERIES
+
+    # Pemindaian linear hanya untuk beberapa query (lambat) dan untuk memeriksa hasil
+    scanned = 0.0
+    for day in days[:3]:
+        first = week_start(day)
+        expected = set()
+        started = time.perf_counter()
+        for offset in range(7):
+            current = datetime.combine(first + timedelta(days=offset), datetime.min.time(), WIB)
+            expected.update(scan_between(sessions, current + timedelta(hours=8), current + timedelta(hours=12)))
+        scanned += time.perf_counter() - started
+        assert expected == set(this_week_between(index, 8, 12, day)), "hasil indeks berbeda dari pemindaian"
+    scanned /= 3
+
+    print(f"{count:>10,} sesi | bangun {build:.2f} s | 08:00-12:00 minggu ini {weekly * 1e3:.3f} ms "
+          f"(~{found // QUERIES:,} sesi) | sedang berlangsung {now * 1e6:.1f} µs | "
+          f"pemindaian {scanned * 1e3:.0f} ms ({scanned / weekly:,.0f}x lebih lambat)")
+
+
+def main(sizes):
+    for count in sizes:
+        run(count)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
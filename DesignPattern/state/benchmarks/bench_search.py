@@ -0,0 +1,122 @@
+# Pencarian teks: waktu bangun indeks, latensi query BM25, pelengkapan otomatis, dan pembaruan
+# inkremental pada dokumen sintetis berbahasa Indonesia (distribusi kata mirip Zipf).
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_search [jumlah_dokumen ...]
+import gc
+import random
+import resource
+import sys
+import time
+from itertools import accumulate
+
+from search import SearchIndex, words
+
+ROOTS = """
+    yoga senam jalan kaki taman kebun tanam bunga sayur buah masak dapur resep kue roti teh kopi
+    baca buku cerita puisi tulis lukis seni gambar musik lagu nyanyi tari angklung gamelan batik
+    rajut jahit kerajinan foto film catur kartu teka teki ingatan otak sehat obat dokter jantung
+    darah tekanan gula diet gizi tidur napas meditasi doa ibadah masjid gereja pura vihara pengajian
+    arisan komunitas teman sahabat keluarga cucu anak pasangan cinta kenangan sejarah kota desa
+    pantai gunung danau sungai hutan wisata ziarah perjalanan bus kereta sepeda renang air pagi sore
+    malam minggu hari bulan pasar belanja tabungan pensiun relawan sosial bantu ajar latih kelas
+    kursus bahasa inggris jepang komputer ponsel internet video panggilan berita koran radio
+    televisi drama wayang keroncong dangdut pantun humor tawa senyum semangat bahagia tenang
+""".split()
+PREFIXES = ["", "", "", "ber", "me", "pe", "ke", "di", "ter", "se"]
+SUFFIXES = ["", "", "", "an", "kan", "nya", "i"]
+PLACES = ["Menteng", "Kemang", "Cempaka", "Tebet", "Kuningan", "Rawamangun", "Cibubur", "Depok", "Bekasi",
+          "Bogor", "Tangerang", "Ciputat", "Cilandak", "Pancoran", "Matraman", "Senen", "Gambir"]
+KINDS = ["community", "activity", "profile"]
+
+
+def make_vocabulary(rng, size=20_000):
+    # Kata turunan dari akar umum + nama tempat bernomor sebagai ekor panjang
+    vocabulary = {prefix + root + suffix for prefix in PREFIXES for root in ROOTS for suffix in SUFFIXES}
+    while len(vocabulary) < size:
+        vocabulary.add(f"{rng.choice(PLACES).lower()}{rng.randrange(1000)}")
+    vocabulary = sorted(vocabulary)
+    rng.shuffle(vocabulary)
+    return vocabulary
+
+
+def make_documents(count, seed=7):
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    weights = list(accumulate(1 / (rank + 1) ** 1.05 for rank in range(len(vocabulary))))
+    for index in range(count):
+        title = " ".join(rng.choices(vocabulary, cum_weights=weights, k=rng.randint(2, 4)))
+        body = " ".join(rng.choices(vocabulary, cum_weights=weights, k=rng.randint(10, 25)))
+        yield (KINDS[index % 3], index), title.title(), body
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return (samples[len(samples) // 2] * 1e3, samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e3)
+
+
+def timed(function, arguments):
+    samples = []
+    for argument in arguments:
+        started = time.perf_counter()
+        function(argument)
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def run(count):
+    rng = random.Random(11)
+    documents = list(make_documents(count))
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    index = SearchIndex()
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    index.bulk_load(documents)
+    build = time.perf_counter() - started
+    gc.enable()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Query dari kata yang benar-benar ada: umum (df tinggi), jarang, dan campuran 2-3 kata
+    by_df = sorted(index.vocabulary, key=lambda word: -index.word_df[index.vocabulary[word]])
+    common = by_df[:50]
+    rare = by_df[len(by_df) // 2:len(by_df) // 2 + 200]
+    mixed = [" ".join(rng.sample(by_df[:2000], rng.randint(2, 3))) for _ in range(200)]
+
+    print(f"\n{count:,} dokumen, {len(index.terms):,} term, {sum(len(ids) for ids, _ in index.postings):,} posting")
+    print(f"Bangun indeks: {build:.2f} s → {count / build:,.0f} dokumen/detik, "
+          f"RSS +{(rss_after - rss_before) / 1024:,.0f} MiB")
+    for label, queries, kind in (
+        ("1 kata umum", common, None),
+        ("1 kata jarang", rare, None),
+        ("2-3 kata", mixed, None),
+        ("2-3 kata, kind=activity", mixed, "activity"),
+    ):
+        p50, p99 = timed(lambda query: index.search(query, limit=10, kind=kind), queries)
+        print(f"  cari {label:<30} p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+    prefixes = [word[:length] for word in rng.sample(by_df[:5000], 200) for length in (1, 2, 3)]
+    p50, p99 = timed(lambda prefix: index.complete(prefix), prefixes)
+    print(f"  pelengkapan awalan 1-3 huruf       p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+    updates = [documents[rng.randrange(count)] for _ in range(1000)]
+    p50, p99 = timed(lambda document: index.update(document[0], document[1], document[2] + " renovasi"), updates)
+    print(f"  ubah dokumen (hapus + tambah)      p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+    # Pembanding: pindai substring di semua teks, tanpa peringkat
+    texts = [f"{title} {body}".lower() for _, title, body in documents[:count]]
+    started = time.perf_counter()
+    for query in common[:5]:
+        needle = words(query)[0]
+        [i for i, text in enumerate(texts) if needle in text]
+    scan = (time.perf_counter() - started) / 5
+    print(f"  pembanding: pindai substring 1 kata {scan * 1e3:8.1f} ms/query")
+
+
+def main(counts):
+    for count in counts:
+        run(count)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
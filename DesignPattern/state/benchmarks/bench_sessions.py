@@ -0,0 +1,126 @@
+# Session manager dengan working set besar: pengisian (dengan spill LRU ke SQLite), akses acak
+# (hit vs pemulihan dari snapshot), ukuran snapshot, dan batas memori untuk kapasitas LRU tertentu.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_sessions [--users 1000000] [--capacity 100000] [--touches 200000]
+import argparse
+import gc
+import os
+import random
+import resource
+import tempfile
+import time
+import tracemalloc
+
+from activities_service.catalog import list_activities
+from activities_service.context import ActivityContext
+from benchmarks.load_simulator import LatencyHistogram
+from chat_service.context import ChatContext
+from friends_service.context import FriendContext
+from friends_service.graph import SocialGraph
+from sessions import SessionManager, SessionStore, state_name
+
+SERVICES = ("friends", "chat", "activities")
+
+
+def make_factories():
+    graph = SocialGraph()
+    return {
+        "friends": lambda username: FriendContext(username=username, graph=graph, hobbies=["Yoga", "Membaca"],
+                                                  mode="cinta"),
+        "chat": lambda username: ChatContext(username),
+        "activities": lambda username: ActivityContext(username=username),
+    }
+
+
+def use(manager, username, activity):
+    # Satu "kunjungan": setiap layanan berpindah state dan menyimpan sedikit data sesi
+    friends = manager.get(username, "friends")
+    friends.location = (-6.1754, 106.8272)
+    friends.set_state(friends.friend_detail_state)
+
+    chat = manager.get(username, "chat")
+    chat.friend_name = "Diana"
+    chat.set_state(chat.send_message_state)
+
+    activities = manager.get(username, "activities")
+    activities.selected_activity = activity
+    activities.set_state(activities.book_activity_state)
+
+
+def live_bytes_per_session(sample=2000):
+    # tracemalloc terlalu lambat untuk 1 juta sesi; ukur sampel dengan kapasitas tak terbatas
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SessionManager(capacity=sample, store=SessionStore(os.path.join(directory, "s.db")),
+                                 factories=make_factories())
+        activity = list_activities()[0]
+        use(manager, "pemanasan", activity)
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(sample):
+            use(manager, f"lansia{index}", activity)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        manager.close()
+    return (after - before) / sample
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session manager LRU + snapshot")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--capacity", type=int, default=100_000)
+    parser.add_argument("--touches", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    per_session = live_bytes_per_session()
+    activities = list_activities()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.db")
+        manager = SessionManager(capacity=args.capacity, store=SessionStore(path), factories=make_factories())
+
+        started = time.perf_counter()
+        for index in range(args.users):
+            use(manager, f"lansia{index}", activities[index % len(activities)])
+        manager.flush()
+        populate = time.perf_counter() - started
+        stored, stored_bytes = manager.store.stats()
+
+        hits = LatencyHistogram()
+        restores = LatencyHistogram()
+        wrong = 0
+        for _ in range(args.touches):
+            index = rng.randrange(args.users)
+            username = f"lansia{index}"
+            live = username in manager
+            started = time.perf_counter()
+            session = manager.session(username)
+            (hits if live else restores).record(time.perf_counter() - started)
+            contexts = session.contexts
+            if (state_name(contexts["activities"]) != "book_activity_state"
+                    or contexts["activities"].selected_activity["id"] != activities[index % len(activities)]["id"]
+                    or state_name(contexts["chat"]) != "send_message_state"):
+                wrong += 1
+        file_bytes = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        manager.close()
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(f"{args.users:,} pengguna, kapasitas LRU {args.capacity:,}, layanan: {', '.join(SERVICES)}")
+    print(f"Pengisian: {populate:.1f} s → {args.users / populate:,.0f} sesi/detik (termasuk spill)")
+    print(f"Snapshot: {stored:,} baris, rata-rata {stored_bytes / max(stored, 1):.0f} byte, "
+          f"file SQLite {file_bytes / 2**20:,.0f} MiB")
+    for label, histogram in (("hit (di memori)", hits), ("pulih dari snapshot", restores)):
+        if histogram.count:
+            print(f"{label:<22}{histogram.count:>9,}  rata2 {histogram.total / histogram.count * 1e6:7.1f}µs  "
+                  f"p50 {histogram.percentile(0.50) * 1e6:7.1f}µs  p99 {histogram.percentile(0.99) * 1e6:7.1f}µs")
+    print(f"Sesi dengan data/state salah setelah pulih: {wrong}")
+    print(f"Memori sesi hidup: {per_session:,.0f} byte/sesi → batas LRU {per_session * args.capacity / 2**20:,.0f} MiB "
+          f"(semua {args.users:,} hidup: {per_session * args.users / 2**20:,.0f} MiB)")
+    print(f"RSS puncak proses: {peak_rss / 2**20:,.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Pengaturan berlapis: memori untuk sejuta pengguna (sebagian kecil punya override) dibanding satu dict
+# per pengguna, baca tunggal dan massal, biaya ubah pengaturan (termasuk tulis SQLite dan notifikasi
+# pelanggan), serta waktu membuka ulang store dari disk.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_settings [jumlah_pengguna] [persen_override]
+import gc
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from settings_service.store import SettingsStore, CHOICES, DEFAULTS
+
+SAMPLES = 100_000
+BULK = 200              # pengguna per baca massal (mis. daftar anggota komunitas)
+SUBSCRIBERS = 10
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return (samples[len(samples) // 2] * 1e6, samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6)
+
+
+def timed(function, arguments):
+    samples = []
+    for argument in arguments:
+        started = time.perf_counter()
+        function(argument)
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 1_000_000
+    percent = float(argv[1]) if len(argv) > 1 else 5.0
+    rng = random.Random(23)
+    users = [f"lansia{i}" for i in range(count)]
+    changed = rng.sample(users, int(count * percent / 100))
+    print(f"{count:,} pengguna, {len(changed):,} dengan override ({percent:g}%)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "settings.db")
+        store = SettingsStore(path)
+        gc.collect()
+        before = rss_mib()
+        started = time.perf_counter()
+        for name in changed:
+            store.set(name, "font_size", "Besar")
+            if rng.random() < 0.3:
+                store.set(name, "theme", "Gelap")
+        elapsed = time.perf_counter() - started
+        print(f"  isi override (+ SQLite)          {elapsed:8.2f} s  ({elapsed / len(changed) * 1e6:.1f} µs/pengguna, "
+              f"RSS +{rss_mib() - before:,.0f} MiB)")
+
+        # Pembanding: setiap pengguna menyimpan dict pengaturannya sendiri
+        before = rss_mib()
+        naive = {name: dict(DEFAULTS) for name in users}
+        print(f"  pembanding: dict per pengguna             RSS +{rss_mib() - before:,.0f} MiB")
+        del naive
+        gc.collect()
+
+        sample = [users[rng.randrange(count)] for _ in range(SAMPLES)]
+        p50, p99 = timed(lambda name: store.get(name, "font_size"), sample)
+        print(f"  get(pengguna, font_size)         p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+        batches = [sample[i:i + BULK] for i in range(0, SAMPLES, BULK)]
+        p50, p99 = timed(store.get_many, batches)
+        print(f"  get_many({BULK} pengguna)          p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+        p50, p99 = timed(lambda batch: store.values(batch, "font_size"), batches)
+        print(f"  values({BULK} pengguna, font_size) p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+
+        # Setiap set benar-benar mengubah nilai (pengguna acak, nilai selain yang sekarang)
+        toggles = [(name, rng.choice([value for value in CHOICES["font_size"] if value != store.get(name, "font_size")]))
+                   for name in rng.sample(users, 20_000)]
+        p50, p99 = timed(lambda item: store.set(item[0], "font_size", item[1]), toggles)
+        print(f"  set (+ SQLite) tanpa pelanggan   p50 {p50:6.2f} µs  p99 {p99:6.2f} µs")
+
+        # Renderer dasbor/chat memegang LiveSettings; perubahan didorong ke sana tanpa polling
+        received = []
+        subscriptions = [store.subscribe(lambda *change: received.append(change)) for _ in range(SUBSCRIBERS)]
+        live = [store.live(name) for name, _ in toggles]
+        toggles = [(name, rng.choice([other for other in CHOICES["font_size"] if other != value]))
+                   for name, value in toggles]
+        p50, p99 = timed(lambda item: store.set(item[0], "font_size", item[1]), toggles)
+        print(f"  set + {SUBSCRIBERS} pelanggan + live       p50 {p50:6.2f} µs  p99 {p99:6.2f} µs  "
+              f"({len(received):,} notifikasi)")
+        for view, (name, _) in zip(live, toggles):
+            assert view.font_size == store.get(name, "font_size"), name
+        for subscription in subscriptions:
+            subscription.cancel()
+
+        expected = {name: dict(store.settings(name)) for name in rng.sample(users, 10_000)}
+        overrides = len(store)
+        store.close()
+        gc.collect()
+        started = time.perf_counter()
+        store = SettingsStore(path)
+        elapsed = time.perf_counter() - started
+        print(f"  buka ulang dari disk             {elapsed * 1e3:8.1f} ms  ({len(store):,} pengguna dengan override)")
+        assert len(store) == overrides
+        for name, values in expected.items():
+            assert dict(store.settings(name)) == values, name
+        store.close()
+        print(f"  konsisten setelah buka ulang     {len(expected):,} pengguna diperiksa")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
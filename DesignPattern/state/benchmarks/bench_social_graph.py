@@ -0,0 +1,78 @@
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.bench_social_graph [jumlah_edge ...]
+import random
+import sys
+import time
+import tracemalloc
+
+from friends_service.graph import SocialGraph, FRIEND, LIKE, REQUEST
+
+EDGES_PER_USER = 20
+LOOKUPS = 100_000
+
+
+def build(edge_count, seed=11):
+    rng = random.Random(seed)
+    users = max(2, edge_count // EDGES_PER_USER)
+    names = [f"lansia{i}" for i in range(users)]
+    graph = SocialGraph()
+    for name in names:
+        graph.intern(name)
+
+    kinds = (FRIEND, FRIEND, LIKE, REQUEST)
+    added = 0
+    while added < edge_count:
+        a, b = rng.randrange(users), rng.randrange(users)
+        if a != b and graph.add(rng.choice(kinds), names[a], names[b]):
+            added += 1
+    return graph, names
+
+
+def run(edge_count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph, names = build(edge_count)
+    elapsed = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Nama pengguna sudah ada di luar graf pada sistem nyata, jadi tidak dihitung
+    name_bytes = sum(sys.getsizeof(name) for name in names)
+    # Edge FRIEND disimpan dua arah, tetapi dihitung sebagai satu relasi
+    stored = graph.edge_count()
+    graph_bytes = used - name_bytes
+
+    rng = random.Random(3)
+    pairs = [(names[rng.randrange(len(names))], names[rng.randrange(len(names))]) for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    for a, b in pairs:
+        graph.has(FRIEND, a, b)
+    has_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+    start = time.perf_counter()
+    for a, b in pairs[:10_000]:
+        graph.mutual_friend_count(a, b)
+    mutual_us = (time.perf_counter() - start) / 10_000 * 1e6
+
+    start = time.perf_counter()
+    for a, _ in pairs[:1_000]:
+        graph.friends_of_friends(a, limit=20)
+    fof_us = (time.perf_counter() - start) / 1_000 * 1e6
+
+    print(f"\n{edge_count:,} relasi ({stored:,} edge tersimpan, {len(names):,} pengguna), bangun {elapsed:.1f} s")
+    print(f"  memori graf         {graph_bytes / 2**20:10.1f} MiB")
+    print(f"  byte per relasi     {graph_bytes / edge_count:10.1f}")
+    print(f"  byte per edge       {graph_bytes / stored:10.1f}")
+    print(f"  has(FRIEND)         {has_us:10.2f} µs")
+    print(f"  mutual_friend_count {mutual_us:10.2f} µs")
+    print(f"  friends_of_friends  {fof_us:10.2f} µs")
+
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or [1_000_000, 2_000_000]
+    for count in sizes:
+        run(count)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
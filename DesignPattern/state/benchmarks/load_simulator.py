@@ -0,0 +1,233 @@
+# Simulasi beban: N lansia virtual menjalani alur lengkap (daftar → onboarding → teman → chat →
+# komunitas → kegiatan → notifikasi) dengan input skrip, tersebar di beberapa proses.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.load_simulator [--elders 2000] [--workers 4] [--chunk 100] [--scrypt-n 1024]
+import argparse
+import contextlib
+import math
+import os
+import random
+import tempfile
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from console import ScriptedInput
+from auth_service.context import AuthContext
+from auth_service.credentials import CredentialService
+from auth_service.repository import InMemoryAccountRepository
+from friends_service.context import FriendContext
+from chat_service.broker import BrokerRunner
+from chat_service.context import ChatContext
+from chat_service.history import ChatHistoryLog
+from community_service.context import CommunityContext
+from activities_service.booking import BookingEngine
+from activities_service.catalog import ACTIVITIES
+from activities_service.context import ActivityContext
+from dashboard_service.context import DashboardContext
+from settings_service.context import SettingsContext
+from notifications_service.context import NotificationContext
+from notifications_service.inbox import NotificationHub
+
+HOBBIES = ["Membaca", "Berkebun", "Yoga", "Memasak", "Jalan Kaki", "Melukis", "Menyanyi"]
+FRIENDS = ["Charlie", "Diana", "Eve"]
+BUCKETS_PER_OCTAVE = 4
+
+
+class LatencyHistogram:
+    # Histogram log2 (4 bucket per kelipatan dua) dalam mikrodetik: kecil dan bisa digabung antar proses
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, seconds):
+        micros = max(seconds * 1e6, 1.0)
+        self.buckets[int(math.log2(micros) * BUCKETS_PER_OCTAVE)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def merge(self, other):
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def percentile(self, fraction):
+        # Batas atas bucket yang memuat persentil tersebut, dalam detik
+        wanted = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= wanted:
+                return min(2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE) / 1e6, self.maximum)
+        return self.maximum
+
+
+class Recorder:
+    def __init__(self):
+        self.states = {}
+        self.errors = Counter()
+
+    def step(self, context, **options):
+        name = type(context.state).__name__
+        started = time.perf_counter()
+        try:
+            context.request(**options)
+        except Exception:
+            self.errors[name] += 1
+            raise
+        finally:
+            self.states.setdefault(name, LatencyHistogram()).record(time.perf_counter() - started)
+
+
+_services = None
+
+
+def _init_worker(scrypt_n, data_dir):
+    # Layanan bersama per proses, seperti default_*() di aplikasi
+    global _services
+    _services = {
+        "repository": InMemoryAccountRepository(),
+        "credentials": CredentialService(n=scrypt_n, workers=1),
+        "hub": NotificationHub(),
+        "broker": BrokerRunner(),
+        "history": ChatHistoryLog(os.path.join(data_dir, f"chat-{os.getpid()}"), durable=False),
+        "engine": BookingEngine(),
+    }
+    for activity in ACTIVITIES:
+        _services["engine"].register(activity["id"], activity["capacity"], activity["participants"])
+
+
+def journey(index, recorder, rng):
+    services = _services
+    user = f"lansia{index}"
+    hobbies = rng.sample(HOBBIES, 2)
+    mode = rng.choice(["pertemanan", "cinta"])
+    script = ScriptedInput([
+        mode, ", ".join(hobbies), "Saya senang bertemu teman baru.",      # profil
+        "n",                                                              # edit profil di dasbor
+        rng.choice(["Kecil", "Sedang", "Besar"]), rng.choice(["Terang", "Gelap"]),
+        str(rng.randint(1, 3)), "y",                                      # komunitas
+        str(rng.randint(1, 3)), "y",                                      # kegiatan
+    ], default="n")
+
+    auth = AuthContext(
+        username=user, password="rahasia123", confirm_password="rahasia123",
+        email=f"{user}@example.com", full_name=f"Lansia {index}",
+        repository=services["repository"], credentials=services["credentials"], input_provider=script,
+    )
+    auth.set_state(auth.signup_state)
+    recorder.step(auth)
+    recorder.step(auth)                 # ProfileSetupState
+    auth.set_state(auth.login_state)
+    recorder.step(auth)
+    auth.set_state(auth.onboarding_state)
+    recorder.step(auth)
+
+    dashboard = DashboardContext(username=user, input_provider=script)
+    recorder.step(dashboard)
+    dashboard.set_state(dashboard.profile_state)
+    recorder.step(dashboard)
+
+    settings = SettingsContext(username=user, input_provider=script)
+    recorder.step(settings)
+    settings.set_state(settings.theme_state)
+    recorder.step(settings)
+
+    friends = FriendContext(username=user, hobbies=hobbies, mode=mode, notification_hub=services["hub"])
+    friend = rng.choice(FRIENDS)
+    recorder.step(friends, interest_filter=rng.choice(["Yoga", "Reading", "Gaming", "Cooking"]))
+    recorder.step(friends, friend_name=friend)
+    recorder.step(friends, friend_name=friend, action="add")
+    friends.set_state(friends.recommend_friends_state)
+    recorder.step(friends)
+
+    chat = ChatContext(user, broker=services["broker"], history=services["history"], notification_hub=services["hub"])
+    recorder.step(chat, friend_name=friend)
+    recorder.step(chat, message=f"Halo {friend}, apa kabar?")
+
+    community = CommunityContext(username=user, notification_hub=services["hub"], input_provider=script)
+    recorder.step(community)
+    recorder.step(community)
+
+    activities = ActivityContext(
+        username=user, notification_hub=services["hub"], booking_engine=services["engine"], input_provider=script
+    )
+    recorder.step(activities)
+    recorder.step(activities)
+
+    notifications = NotificationContext(username=user, notification_hub=services["hub"])
+    recorder.step(notifications)
+
+
+def run_chunk(first, count, seed):
+    recorder = Recorder()
+    rng = random.Random(seed)
+    failures = 0
+    started = time.perf_counter()
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        for index in range(first, first + count):
+            try:
+                journey(index, recorder, rng)
+            except Exception:
+                failures += 1
+                if failures == 1:
+                    first_error = traceback.format_exc()
+    elapsed = time.perf_counter() - started
+    return recorder, count - failures, failures, elapsed, (first_error if failures else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi beban alur SilverConnect")
+    parser.add_argument("--elders", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=100)
+    parser.add_argument("--scrypt-n", type=int, default=2**10,
+                        help="biaya hash kata sandi; 16384 = nilai produksi (jauh lebih lambat)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    states = {}
+    errors = Counter()
+    completed = failed = 0
+    busy = 0.0
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as data_dir, ProcessPoolExecutor(
+        args.workers, initializer=_init_worker, initargs=(args.scrypt_n, data_dir)
+    ) as pool:
+        futures = [
+            pool.submit(run_chunk, first, min(args.chunk, args.elders - first), args.seed + first)
+            for first in range(0, args.elders, args.chunk)
+        ]
+        for future in as_completed(futures):
+            recorder, ok, bad, elapsed, error = future.result()
+            completed += ok
+            failed += bad
+            busy += elapsed
+            errors.update(recorder.errors)
+            for name, histogram in recorder.states.items():
+                states.setdefault(name, LatencyHistogram()).merge(histogram)
+            if error and failed == bad:
+                print(f"❗ Contoh kegagalan sesi:\n{error}")
+    wall = time.perf_counter() - started
+
+    print(f"\n{args.elders:,} lansia virtual, {args.workers} proses, scrypt n={args.scrypt_n}")
+    print(f"{'State':<26}{'jumlah':>9}{'rata2':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'maks':>10}{'galat':>7}")
+    for name, histogram in sorted(states.items(), key=lambda item: -item[1].total):
+        print(f"{name:<26}{histogram.count:>9,}"
+              f"{histogram.total / histogram.count * 1e3:>8.2f}ms"
+              f"{histogram.percentile(0.50) * 1e3:>8.2f}ms"
+              f"{histogram.percentile(0.95) * 1e3:>8.2f}ms"
+              f"{histogram.percentile(0.99) * 1e3:>8.2f}ms"
+              f"{histogram.maximum * 1e3:>8.2f}ms"
+              f"{errors.get(name, 0):>7}")
+    print(f"\nSesi selesai: {completed:,}, gagal: {failed:,}, waktu {wall:.2f} s "
+          f"→ {completed / wall:,.1f} sesi/detik ({busy / max(completed, 1) * 1e3:.1f} ms per sesi di worker)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Anggaran waktu mulai: waktu impor titik masuk dan waktu sampai request pertama, masing-masing di
+# proses Python baru, plus daftar layanan yang context-nya ikut dimuat (katalog layanan lain boleh
+# ikut lewat indeks pencarian bersama). Modul termahal dilaporkan dari
+# -X importtime. Keluar dengan kode 1 jika ada skenario yang melewati anggaran atau memuat layanan
+# yang tidak dibutuhkannya. Jalankan dari DesignPattern/state:
+#   python -m benchmarks.startup_budget [--runs 5] [--top 8] [--scale 1.0]
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+STATE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MARKER = "STARTUP"
+
+PROLOGUE = """
+import time
+started = time.perf_counter()
+"""
+
+EPILOGUE = """
+import sys
+loaded = sorted(name[:-len("_service.context")] for name in sys.modules if name.endswith("_service.context"))
+print(f"{MARKER} {(time.perf_counter() - started) * 1e3:.3f} {','.join(loaded) or '-'}")
+"""
+
+# nama -> (kode, anggaran ms, layanan yang boleh dimuat)
+SCENARIOS = {
+    "impor main": ("import main", 15.0, set()),
+    # Login username tak dikenal tetap membayar satu derivasi scrypt (hash pengganti, lihat
+    # CredentialService._verify_dummy), sama seperti login akun yang ada
+    "request pertama: auth": ("""
+from console import ScriptedInput
+from services import default_registry
+auth = default_registry().create("auth", username="mulai", password="x", input_provider=ScriptedInput([]))
+auth.set_state(auth.login_state)
+auth.request()
+""", 120.0, {"auth"}),
+    "request pertama: auth + chat": ("""
+from console import ScriptedInput
+from services import default_registry
+services = default_registry()
+auth = services.create("auth", username="mulai", password="x", input_provider=ScriptedInput([]))
+auth.set_state(auth.login_state)
+auth.request()
+chat = services.create("chat", username="mulai")
+chat.request(friend_name="Diana")
+""", 150.0, {"auth", "chat"}),
+}
+
+
+def run(code, data_dir, importtime=False):
+    script = PROLOGUE + code + EPILOGUE.replace("MARKER", repr(MARKER))
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", script]
+    env = dict(os.environ, SILVERCONNECT_DATA=data_dir)
+    env.pop("SILVERCONNECT_METRICS", None)
+    result = subprocess.run(command, cwd=STATE_DIR, env=env, capture_output=True, text=True, check=True)
+    line = next(line for line in reversed(result.stdout.splitlines()) if line.startswith(MARKER))
+    _, milliseconds, loaded = line.split()
+    return float(milliseconds), set() if loaded == "-" else set(loaded.split(",")), result.stderr
+
+
+def slowest_imports(stderr, top):
+    # Baris "import time: self | kumulatif | nama", diurutkan menurut waktu impor modul itu sendiri
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(own), int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Anggaran waktu mulai SilverConnect")
+    parser.add_argument("--runs", type=int, default=5, help="proses per skenario; diambil yang tercepat")
+    parser.add_argument("--top", type=int, default=8, help="jumlah modul termahal yang ditampilkan")
+    parser.add_argument("--scale", type=float, default=1.0, help="pengali anggaran untuk mesin yang lebih lambat")
+    args = parser.parse_args(argv)
+
+    failures = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        print(f"{'Skenario':<32}{'anggaran':>10}{'tercepat':>10}   layanan dimuat")
+        for name, (code, budget, allowed) in SCENARIOS.items():
+            budget *= args.scale
+            timings, loaded = [], set()
+            for _ in range(args.runs):
+                milliseconds, loaded, _ = run(code, data_dir)
+                timings.append(milliseconds)
+            best = min(timings)
+            extra = loaded - allowed
+            status = "✅" if best <= budget and not extra else "❌"
+            print(f"{status} {name:<30}{budget:>8.1f}ms{best:>8.1f}ms   {', '.join(sorted(loaded)) or '-'}")
+            if best > budget:
+                failures.append(f"{name}: {best:.1f} ms > anggaran {budget:.1f} ms")
+            if extra:
+                failures.append(f"{name}: memuat layanan yang tidak dibutuhkan: {', '.join(sorted(extra))}")
+
+            _, _, stderr = run(code, data_dir, importtime=True)
+            for own, cumulative, module in slowest_imports(stderr, args.top):
+                print(f"      {own / 1e3:7.2f} ms sendiri {cumulative / 1e3:8.2f} ms kumulatif  {module}")
+
+    if failures:
+        print("\n❌ Anggaran waktu mulai terlampaui:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\n✅ Semua skenario dalam anggaran.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+# Uji beban pemesanan bersamaan, dua skenario:
+# - skala: ribuan pemesan berebut kursi di banyak kegiatan; memastikan tidak ada overbooking dan
+#   melaporkan pemesanan/detik.
+# - race: sedikit pengguna dan sedikit kursi, sehingga pembatalan hampir selalu memicu promosi;
+#   memastikan user_bookings tetap sama dengan daftar peserta walau pengguna yang baru dipromosikan
+#   dari daftar tunggu langsung membatalkan. Diulang beberapa kali karena race ini jarang muncul.
+# Jalankan dari DesignPattern/state:
+#   python -m benchmarks.stress_booking [jumlah_pemesan] [jumlah_thread]
+import asyncio
+import random
+import sys
+import threading
+import time
+
+from activities_service.booking import BOOKED, WAITLISTED, BookingEngine
+
+SCALE_ACTIVITIES = 20
+SCALE_CAPACITY = 50
+
+RACE_ACTIVITIES = 4
+RACE_CAPACITY = 3
+RACE_BOOKERS = 64
+RACE_ROUNDS = 20_000
+RACE_TRIALS = 5
+
+
+def check(engine, label, counts, elapsed):
+    operations, bookings = map(sum, zip(*counts))
+    for activity_id, slots in engine.activities.items():
+        assert slots.taken() <= slots.capacity, f"overbooking di kegiatan {activity_id}"
+        assert not set(slots.participants) & slots.waiting, "pengguna terdaftar sekaligus menunggu"
+        assert len(slots.waitlist) == len(slots.waiting)
+        if slots.waitlist:
+            assert slots.taken() == slots.capacity, "kursi kosong padahal ada daftar tunggu"
+    for user, booked in engine.user_bookings.items():
+        for activity_id in booked:
+            assert user in engine.activities[activity_id].participants, f"{user} tertinggal di user_bookings"
+    for activity_id, slots in engine.activities.items():
+        for user in slots.participants:
+            assert activity_id in engine.user_bookings.get(user, ()), f"{user} hilang dari user_bookings"
+    booked = sum(len(slots.participants) for slots in engine.activities.values())
+    waiting = sum(len(slots.waitlist) for slots in engine.activities.values())
+    print(f"{label}: {operations:,} operasi dalam {elapsed:.2f} s ({bookings / elapsed:,.0f} pemesanan/s, "
+          f"{operations / elapsed:,.0f} op/s), {booked:,} terdaftar, {waiting:,} menunggu — tidak ada overbooking ✅")
+
+
+def scale_workload(engine, users, seed):
+    # Setiap pengguna memesan tiga kegiatan acak; sebagian membatalkan, memicu promosi dari daftar tunggu
+    rng = random.Random(seed)
+    operations = bookings = 0
+    for user in users:
+        mine = []
+        for _ in range(3):
+            activity_id = rng.randrange(SCALE_ACTIVITIES)
+            if engine.book(activity_id, user) in (BOOKED, WAITLISTED):
+                mine.append(activity_id)
+            operations += 1
+            bookings += 1
+        if mine and rng.random() < 0.3:
+            engine.cancel(rng.choice(mine), user)
+            operations += 1
+    return operations, bookings
+
+
+def race_workload(engine, users, seed):
+    # Setiap putaran pengguna memesan atau membatalkan secara acak. Pengguna milik thread lain bisa
+    # dipromosikan kapan saja, lalu membatalkan di thread-nya sendiri bersamaan dengan promosi itu.
+    rng = random.Random(seed)
+    operations = bookings = 0
+    for _ in range(RACE_ROUNDS):
+        for user in users:
+            activity_id = rng.randrange(RACE_ACTIVITIES)
+            if rng.random() < 0.5:
+                engine.book(activity_id, user)
+                bookings += 1
+            else:
+                engine.cancel(activity_id, user)
+            operations += 1
+    return operations, bookings
+
+
+def make_engine(activities, capacity):
+    engine = BookingEngine()
+    for activity_id in range(activities):
+        engine.register(activity_id, capacity)
+    return engine
+
+
+def with_threads(label, workload, engine, bookers, threads):
+    users = [f"lansia{i}" for i in range(bookers)]
+    chunks = [users[i::threads] for i in range(threads)]
+    counts = [(0, 0)] * threads
+    barrier = threading.Barrier(threads)
+
+    def run(index):
+        barrier.wait()
+        counts[index] = workload(engine, chunks[index], index)
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    check(engine, f"{label}, {threads} thread, {bookers:,} pemesan", counts, time.perf_counter() - start)
+
+
+async def with_tasks(label, workload, engine, bookers, tasks):
+    users = [f"lansia{i}" for i in range(bookers)]
+
+    async def run(index):
+        # Task async memanggil engine dari thread pool supaya benar-benar bersaing dengan lock
+        return await asyncio.to_thread(workload, engine, users[index::tasks], index)
+
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(run(i) for i in range(tasks)))
+    check(engine, f"{label}, {tasks} task async, {bookers:,} pemesan", counts, time.perf_counter() - start)
+
+
+def main(argv):
+    bookers = int(argv[0]) if len(argv) > 0 else 20_000
+    threads = int(argv[1]) if len(argv) > 1 else 32
+    sys.setswitchinterval(1e-6)   # perbanyak pergantian thread agar race lebih mungkin muncul
+    with_threads("skala", scale_workload, make_engine(SCALE_ACTIVITIES, SCALE_CAPACITY), bookers, threads)
+    asyncio.run(with_tasks("skala", scale_workload, make_engine(SCALE_ACTIVITIES, SCALE_CAPACITY),
+                           bookers, threads))
+    for _ in range(RACE_TRIALS):
+        with_threads("race", race_workload, make_engine(RACE_ACTIVITIES, RACE_CAPACITY), RACE_BOOKERS, threads)
+        asyncio.run(with_tasks("race", race_workload, make_engine(RACE_ACTIVITIES, RACE_CAPACITY),
+                               RACE_BOOKERS, threads))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,508 @@
+# Suite benchmark untuk semua context, setiap handle() state, dan alur main() lengkap.
+# Hasil ditulis sebagai JSON dan dibandingkan dengan baseline; keluar dengan kode 1 jika ada
+# jalur yang melambat melebihi ambang. Jalankan dari DesignPattern/state:
+#   python -m benchmarks.suite [--sizes 100 10000] [--filter state/] [--output hasil.json]
+#                              [--baseline benchmarks/baseline.json] [--threshold 0.5] [--update-baseline]
+import argparse
+import contextlib
+import gc
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import main as app
+from activities_service.booking import BookingEngine
+from activities_service.catalog import ACTIVITIES, list_activities
+from activities_service.context import ActivityContext
+from auth_service.context import AuthContext
+from auth_service.credentials import CredentialService
+from auth_service.repository import InMemoryAccountRepository, new_account
+from benchmarks.bench_friend_index import make_profiles
+from chat_service.broker import BrokerRunner
+from chat_service.context import ChatContext
+from chat_service.history import ChatHistoryLog
+from community_service.catalog import list_communities
+from community_service.context import CommunityContext
+from console import ScriptedInput
+from dashboard_service.context import DashboardContext
+from friends_service.catalog import PROFILES
+from friends_service.context import FriendContext
+from friends_service.index import FriendIndex
+from friends_service.recommend import HobbyRecommender
+from notifications_service.context import NotificationContext
+from notifications_service.inbox import NotificationHub
+from settings_service.context import SettingsContext
+from storage import DATA_ENV
+
+SUITE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(SUITE_DIR, "baseline.json")
+SCRYPT_N = 2**10    # biaya hash diturunkan agar suite cepat; jalur kode tetap sama
+ROUNDS = 7
+ROUND_SECONDS = 0.05
+
+CASES = []
+
+
+def case(name, sized=True):
+    def register(setup):
+        CASES.append((name, sized, setup))
+        return setup
+    return register
+
+
+class Environment:
+    # Layanan terisolasi per ukuran data, diisi data sintetis sebanyak `size`
+    def __init__(self, size, data_dir):
+        self.size = size
+        self.credentials = CredentialService(n=SCRYPT_N, workers=1)
+        self.password_hash = self.credentials.hash("rahasia123")
+        self.repository = InMemoryAccountRepository()
+        self.repository.bulk_import(
+            new_account(f"lansia{i}", f"lansia{i}@example.com", f"Lansia {i}", self.password_hash)
+            for i in range(size)
+        )
+        self.repository.create(new_account("elder1", "elder1@example.com", "Elder One", self.password_hash))
+
+        self.hub = NotificationHub()
+        for i in range(size):
+            self.hub.push(f"lansia{i}", "friend", "🤝 Permintaan pertemanan baru.")
+        for i in range(min(size, 1000)):
+            self.hub.broadcast("wellness", f"🧘 Tips {i}")
+
+        self.broker = BrokerRunner()
+        self.history = ChatHistoryLog(os.path.join(data_dir, f"chat-{size}"), durable=False)
+        for i in range(size):
+            sender, recipient = ("elder1", "Diana") if i % 2 else ("Diana", "elder1")
+            self.history.append(sender, recipient, f"Pesan ke-{i}")
+        self.history.flush()
+
+        self.engine = BookingEngine()
+        for activity in ACTIVITIES:
+            self.engine.register(activity["id"], activity["capacity"] + size, activity["participants"])
+            for i in range(size // len(ACTIVITIES)):
+                self.engine.book(activity["id"], f"lansia{i}")
+
+    def close(self):
+        self.broker.stop()
+        self.history.close()
+
+
+def scripted(*answers, default="n"):
+    return ScriptedInput(answers, default=default)
+
+
+def friend_context(env):
+    profiles = PROFILES + make_profiles(env.size)
+    return FriendContext(
+        username="elder1", hobbies=["Yoga", "Reading"], mode="cinta", notification_hub=env.hub,
+        friend_index=FriendIndex(profiles), recommender=HobbyRecommender(profiles),
+    )
+
+
+# --- Konstruksi context -------------------------------------------------------------------------
+
+@case("context/AuthContext", sized=False)
+def _(env):
+    return lambda: AuthContext(username="elder1", repository=env.repository, credentials=env.credentials)
+
+
+@case("context/DashboardContext", sized=False)
+def _(env):
+    return lambda: DashboardContext(username="elder1")
+
+
+@case("context/SettingsContext", sized=False)
+def _(env):
+    return lambda: SettingsContext(username="elder1")
+
+
+@case("context/FriendContext", sized=False)
+def _(env):
+    return lambda: FriendContext(username="elder1", notification_hub=env.hub)
+
+
+@case("context/ChatContext", sized=False)
+def _(env):
+    return lambda: ChatContext("elder1", broker=env.broker, history=env.history, notification_hub=env.hub)
+
+
+@case("context/CommunityContext", sized=False)
+def _(env):
+    return lambda: CommunityContext(username="elder1", notification_hub=env.hub)
+
+
+@case("context/ActivityContext", sized=False)
+def _(env):
+    return lambda: ActivityContext(username="elder1", notification_hub=env.hub, booking_engine=env.engine)
+
+
+@case("context/NotificationContext", sized=False)
+def _(env):
+    return lambda: NotificationContext(username="elder1", notification_hub=env.hub)
+
+
+# --- Auth ---------------------------------------------------------------------------------------
+
+@case("state/SignupState")
+def _(env):
+    counter = itertools.count()
+
+    def run():
+        user = f"baru{next(counter)}"
+        auth = AuthContext(username=user, password="rahasia123", confirm_password="rahasia123",
+                           email=f"{user}@example.com", full_name=user,
+                           repository=env.repository, credentials=env.credentials)
+        auth.set_state(auth.signup_state)
+        auth.request()
+    return run
+
+
+@case("state/ProfileSetupState")
+def _(env):
+    auth = AuthContext(username="elder1", repository=env.repository, credentials=env.credentials,
+                       input_provider=scripted(default="cinta"))
+
+    def run():
+        auth.set_state(auth.profile_setup_state)
+        auth.request()
+    return run
+
+
+@case("state/LoginState")
+def _(env):
+    auth = AuthContext(username="elder1", password="rahasia123", repository=env.repository, credentials=env.credentials)
+
+    def run():
+        auth.set_state(auth.login_state)
+        auth.request()
+    return run
+
+
+@case("state/OnboardingState", sized=False)
+def _(env):
+    auth = AuthContext(username="elder1", repository=env.repository, credentials=env.credentials)
+
+    def run():
+        auth.set_state(auth.onboarding_state)
+        auth.request()
+    return run
+
+
+@case("state/ForgotPasswordState")
+def _(env):
+    auth = AuthContext(username="elder1", email="elder1@example.com",
+                       repository=env.repository, credentials=env.credentials)
+
+    def run():
+        auth.set_state(auth.forgot_password_state)
+        auth.request()
+    return run
+
+
+# --- Dasbor & pengaturan ------------------------------------------------------------------------
+
+@case("state/ViewDashboardState", sized=False)
+def _(env):
+    dashboard = DashboardContext(username="elder1")
+    return dashboard.request
+
+
+@case("state/ViewProfileState", sized=False)
+def _(env):
+    dashboard = DashboardContext(username="elder1", input_provider=scripted())
+    dashboard.set_state(dashboard.profile_state)
+    return dashboard.request
+
+
+@case("state/SettingsState", sized=False)
+def _(env):
+    dashboard = DashboardContext(username="elder1")
+    dashboard.set_state(dashboard.settings_state)
+    return dashboard.request
+
+
+@case("state/FontSettingsState", sized=False)
+def _(env):
+    settings = SettingsContext(username="elder1", input_provider=scripted(default="Besar"))
+    return settings.request
+
+
+@case("state/ThemeSettingsState", sized=False)
+def _(env):
+    settings = SettingsContext(username="elder1", input_provider=scripted(default="Gelap"))
+    settings.set_state(settings.theme_state)
+    return settings.request
+
+
+# --- Teman --------------------------------------------------------------------------------------
+
+@case("state/SearchFriendsState")
+def _(env):
+    friends = friend_context(env)
+
+    def run():
+        friends.set_state(friends.search_friends_state)
+        friends.request(interest_filter="Yoga")
+    return run
+
+
+@case("state/FriendDetailState")
+def _(env):
+    friends = friend_context(env)
+
+    def run():
+        friends.set_state(friends.friend_detail_state)
+        friends.request(friend_name="Diana")
+    return run
+
+
+@case("state/RecommendFriendsState")
+def _(env):
+    friends = friend_context(env)
+
+    def run():
+        friends.set_state(friends.recommend_friends_state)
+        friends.request()
+    return run
+
+
+@case("state/FriendChatState", sized=False)
+def _(env):
+    friends = FriendContext(username="elder1", notification_hub=env.hub)
+
+    def run():
+        friends.set_state(friends.chat_state)
+        friends.request(friend_name="Diana")
+    return run
+
+
+# --- Chat ---------------------------------------------------------------------------------------
+
+@case("state/ChatStartState")
+def _(env):
+    chat = ChatContext("elder1", broker=env.broker, history=env.history, notification_hub=env.hub)
+
+    def run():
+        chat.set_state(chat.start_state)
+        chat.request(friend_name="Diana")
+    return run
+
+
+@case("state/ChatSendMessageState")
+def _(env):
+    chat = ChatContext("elder1", broker=env.broker, history=env.history, notification_hub=env.hub)
+    chat.friend_name = "Diana"
+    chat.set_state(chat.send_message_state)
+    return lambda: chat.request(message="Halo Diana, apa kabar?")
+
+
+# --- Komunitas & kegiatan -----------------------------------------------------------------------
+
+@case("state/BrowseCommunityState", sized=False)
+def _(env):
+    community = CommunityContext(username="elder1", notification_hub=env.hub, input_provider=scripted(default="1"))
+
+    def run():
+        community.set_state(community.browse_community_state)
+        community.request()
+    return run
+
+
+@case("state/JoinCommunityState", sized=False)
+def _(env):
+    community = CommunityContext(username="elder1", notification_hub=env.hub, input_provider=scripted(default="y"))
+    community.selected_community = list_communities()[0]
+
+    def run():
+        community.joined = False
+        community.set_state(community.join_community_state)
+        community.request()
+    return run
+
+
+@case("state/FindActivityState")
+def _(env):
+    activities = ActivityContext(username="elder1", notification_hub=env.hub, booking_engine=env.engine,
+                                 input_provider=scripted(default="1"))
+
+    def run():
+        activities.set_state(activities.find_activity_state)
+        activities.request()
+    return run
+
+
+@case("state/BookActivityState")
+def _(env):
+    activities = ActivityContext(username="elder1", notification_hub=env.hub, booking_engine=env.engine,
+                                 input_provider=scripted(default="y"))
+    activities.selected_activity = list_activities()[1]
+
+    def run():
+        activities.set_state(activities.book_activity_state)
+        activities.request()
+        env.engine.cancel(activities.selected_activity["id"], "elder1")
+    return run
+
+
+@case("state/CancelBookingState")
+def _(env):
+    activities = ActivityContext(username="elder1", notification_hub=env.hub, booking_engine=env.engine)
+    activities.selected_activity = list_activities()[2]
+
+    def run():
+        env.engine.book(activities.selected_activity["id"], "elder1")
+        activities.set_state(activities.cancel_booking_state)
+        activities.request()
+    return run
+
+
+# --- Notifikasi ---------------------------------------------------------------------------------
+
+@case("state/CheckNotificationState")
+def _(env):
+    notifications = NotificationContext(username="elder1", notification_hub=env.hub)
+
+    def run():
+        for i in range(5):
+            env.hub.push("elder1", "activity", f"📅 Pengingat {i}")
+        notifications.request()
+    return run
+
+
+# --- Alur lengkap -------------------------------------------------------------------------------
+
+JOURNEY_ANSWERS = ["cinta", "Yoga, Membaca", "Cerita", "n", "Besar", "Gelap", "1", "y", "2", "y"]
+
+
+@case("journey/main", sized=False)
+def _(env):
+    return lambda: app.main(scripted(*JOURNEY_ANSWERS))
+
+
+def measure(run):
+    gc.collect()
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        started = time.perf_counter()
+        run()       # pemanasan sekaligus kalibrasi
+        once = time.perf_counter() - started
+        loops = max(1, min(10_000, int(ROUND_SECONDS / max(once, 1e-9))))
+        samples = []
+        # Seperti timeit: GC dimatikan selama pengukuran agar jeda koleksi tidak masuk sampel
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(ROUNDS):
+                started = time.perf_counter()
+                for _ in range(loops):
+                    run()
+                samples.append((time.perf_counter() - started) / loops)
+        finally:
+            if enabled:
+                gc.enable()
+    return {
+        "median_us": statistics.median(samples) * 1e6,
+        "min_us": min(samples) * 1e6,
+        "loops": loops,
+        "rounds": ROUNDS,
+    }
+
+
+def run_suite(sizes, pattern=None, keys=None):
+    results = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        # Layanan default (dipakai journey/main) diarahkan ke direktori sementara
+        os.environ[DATA_ENV] = data_dir
+        for index, size in enumerate(sizes):
+            env = Environment(size, data_dir)
+            try:
+                for name, sized, setup in CASES:
+                    if not sized and index:
+                        continue
+                    key = f"{name}[{size}]" if sized else name
+                    if (pattern and pattern not in key) or (keys is not None and key not in keys):
+                        continue
+                    results[key] = measure(setup(env))
+                    print(f"{key:<45}{results[key]['median_us']:>12,.1f} µs", file=sys.stderr)
+            finally:
+                env.close()
+    return results
+
+
+def compare(results, baseline, threshold, min_delta_us):
+    regressions = []
+    print(f"\n{'Jalur':<45}{'baseline':>12}{'sekarang':>12}{'rasio':>8}")
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            print(f"{key:<45}{'-':>12}{result['min_us']:>10,.1f}µs{'baru':>8}")
+            continue
+        # Putaran tercepat sekarang vs median baseline: gangguan dari proses lain hanya bisa
+        # memperlambat sampel, jadi regresi dilaporkan bila bahkan putaran tercepat lebih lambat.
+        # Selisih absolut minimal menyaring jitter pada jalur yang hanya beberapa mikrodetik.
+        ratio = result["min_us"] / previous["median_us"]
+        slower = result["min_us"] - previous["median_us"] > min_delta_us
+        flag = " ❗" if ratio > 1 + threshold and slower else ""
+        print(f"{key:<45}{previous['median_us']:>10,.1f}µs{result['min_us']:>10,.1f}µs{ratio:>7.2f}x{flag}")
+        if flag:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite benchmark SilverConnect")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--filter", default=None, help="hanya jalur yang namanya memuat teks ini")
+    parser.add_argument("--output", default=None, help="tulis hasil JSON ke file ini")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.5, help="batas perlambatan, 0.5 = 50%%")
+    parser.add_argument("--min-delta-us", type=float, default=5.0,
+                        help="selisih absolut minimal (µs) agar dianggap regresi")
+    parser.add_argument("--update-baseline", action="store_true", help="simpan hasil sebagai baseline baru")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.filter)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created_at": time.time(),
+        "sizes": args.sizes,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+        print(f"✅ Baseline disimpan ke {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️ Baseline {args.baseline} belum ada; jalankan dengan --update-baseline.")
+        return 0
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)["results"]
+    regressions = compare(results, baseline, args.threshold, args.min_delta_us)
+    if regressions:
+        # Ukur ulang sekali jalur yang tampak melambat agar gangguan sesaat tidak menggagalkan suite
+        print("\n🔁 Mengukur ulang jalur yang melambat...")
+        retried = run_suite(args.sizes, keys={key for key, _ in regressions})
+        results.update(retried)
+        regressions = compare(retried, baseline, args.threshold, args.min_delta_us)
+    if regressions:
+        print(f"\n❗ {len(regressions)} jalur melambat lebih dari {args.threshold:.0%}:")
+        for key, ratio in regressions:
+            print(f"   {key}: {ratio:.2f}x")
+        return 1
+    print(f"\n✅ Tidak ada regresi di atas {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
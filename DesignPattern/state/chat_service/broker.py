@@ -0,0 +1,206 @@
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+
+
+def conversation_id(a, b):
+    return (a, b) if a <= b else (b, a)
+
+
+class Message:
+    __slots__ = ("sender", "recipient", "text", "sent_at", "seq")
+
+    def __init__(self, sender, recipient, text, sent_at, seq):
+        self.sender = sender
+        self.recipient = recipient
+        self.text = text
+        self.sent_at = sent_at
+        self.seq = seq
+
+    def to_dict(self):
+        return {
+            "from": self.sender,
+            "to": self.recipient,
+            "text": self.text,
+            "sent_at": self.sent_at,
+            "seq": self.seq,
+        }
+
+
+class Device:
+    def __init__(self, user, device_id, maxsize):
+        self.user = user
+        self.device_id = device_id
+        self.queue = asyncio.Queue(maxsize)
+        self.connected = True
+        self.closed = asyncio.Event()
+
+    async def receive(self):
+        return await self.queue.get()
+
+    def close(self):
+        # Pemegang koneksi (mis. ChatServer) menunggu `closed` untuk menutup socket-nya
+        self.connected = False
+        self.closed.set()
+
+
+class ChatBroker:
+    # Setiap percakapan punya antrean sendiri dan satu task pengirim (pump), sehingga urutan
+    # pesan per percakapan terjaga. Antrean terbatas: pengirim menunggu saat percakapan
+    # penuh, dan perangkat yang terlalu lama tidak membaca diputus.
+    def __init__(self, conversation_queue_size=256, device_queue_size=256,
+                 slow_consumer_timeout=1.0, offline_limit=1000, idle_timeout=30.0):
+        self.conversation_queue_size = conversation_queue_size
+        self.device_queue_size = device_queue_size
+        self.slow_consumer_timeout = slow_consumer_timeout
+        self.offline_limit = offline_limit
+        self.idle_timeout = idle_timeout
+
+        self.devices = {}         # user -> {device_id: Device}
+        self.conversations = {}   # conversation_id -> asyncio.Queue
+        self.pumps = {}           # conversation_id -> Task
+        self.offline = {}         # user -> deque pesan yang belum terkirim
+        self.listeners = []
+        self.sequence = itertools.count(1)
+        self.dropped_devices = 0
+
+    def is_online(self, user):
+        return bool(self.devices.get(user))
+
+    def connect(self, user, device_id=None):
+        devices = self.devices.setdefault(user, {})
+        device_id = device_id or f"{user}-{len(devices) + 1}"
+        device = Device(user, device_id, self.device_queue_size)
+        previous = devices.get(device_id)
+        devices[device_id] = device
+        if previous is not None:
+            # Sambung ulang dengan device_id yang sama: tutup perangkat lama (socket dan task
+            # pengirimnya ikut berhenti) dan pindahkan pesan yang belum sempat dibacanya
+            previous.close()
+            while not previous.queue.empty():
+                device.queue.put_nowait(previous.queue.get_nowait())
+
+        pending = self.offline.pop(user, None)
+        while pending:
+            if device.queue.full():
+                self.offline[user] = pending
+                break
+            device.queue.put_nowait(pending.popleft())
+        return device
+
+    def disconnect(self, device):
+        device.close()
+        devices = self.devices.get(device.user)
+        if devices and devices.get(device.device_id) is device:
+            del devices[device.device_id]
+            if not devices:
+                del self.devices[device.user]
+
+    def add_listener(self, callback):
+        # Dipanggil untuk setiap pesan yang diterima broker (mis. untuk riwayat/notifikasi)
+        self.listeners.append(callback)
+
+    async def send(self, sender, recipient, text, device=None):
+        message = Message(sender, recipient, text, time.time(), next(self.sequence))
+        for callback in self.listeners:
+            callback(message)
+
+        key = conversation_id(sender, recipient)
+        queue = self.conversations.get(key)
+        if queue is None:
+            queue = self.conversations[key] = asyncio.Queue(self.conversation_queue_size)
+            self.pumps[key] = asyncio.create_task(self._pump(key, queue))
+        await queue.put((message, device))
+        return message
+
+    async def _pump(self, key, queue):
+        try:
+            while True:
+                try:
+                    message, origin = await asyncio.wait_for(queue.get(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    if queue.empty():
+                        return
+                    continue
+                await self._deliver(message, origin)
+        finally:
+            if self.conversations.get(key) is queue:
+                del self.conversations[key]
+                del self.pumps[key]
+
+    async def _deliver(self, message, origin):
+        recipients = list(self.devices.get(message.recipient, {}).values())
+        if not recipients:
+            self.offline.setdefault(message.recipient, deque(maxlen=self.offline_limit)).append(message)
+        # Sinkronkan juga ke perangkat lain milik pengirim
+        recipients += [d for d in self.devices.get(message.sender, {}).values() if d is not origin]
+
+        for device in recipients:
+            try:
+                device.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                try:
+                    await asyncio.wait_for(device.queue.put(message), self.slow_consumer_timeout)
+                except asyncio.TimeoutError:
+                    self.dropped_devices += 1
+                    self.disconnect(device)
+                    if device.user == message.recipient and not self.is_online(message.recipient):
+                        self.offline.setdefault(message.recipient, deque(maxlen=self.offline_limit)).append(message)
+
+    async def close(self):
+        pumps = list(self.pumps.values())
+        for task in pumps:
+            task.cancel()
+        await asyncio.gather(*pumps, return_exceptions=True)
+
+
+class BrokerRunner:
+    # Menjalankan broker di event loop pada thread terpisah supaya state sinkron bisa memakainya
+    def __init__(self, broker=None):
+        self.loop = asyncio.new_event_loop()
+        self.broker = broker
+        self.thread = threading.Thread(target=self._run, name="chat-broker", daemon=True)
+        self.ready = threading.Event()
+        self.thread.start()
+        self.ready.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        if self.broker is None:
+            self.broker = ChatBroker()
+        self.loop.call_soon(self.ready.set)
+        self.loop.run_forever()
+
+    def call(self, coroutine, timeout=5.0):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def call_soon(self, fn, *args):
+        async def invoke():
+            return fn(*args)
+        return self.call(invoke())
+
+    def send(self, sender, recipient, text):
+        return self.call(self.broker.send(sender, recipient, text))
+
+    def connect(self, user, device_id=None):
+        return self.call_soon(self.broker.connect, user, device_id)
+
+    def is_online(self, user):
+        return self.broker.is_online(user)
+
+    def stop(self):
+        self.call(self.broker.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+_default_runner = None
+
+
+def default_broker():
+    global _default_runner
+    if _default_runner is None:
+        _default_runner = BrokerRunner()
+    return _default_runner
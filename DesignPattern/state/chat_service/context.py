@@ -1,18 +1,49 @@
-from chat_service.states import ChatStartState, ChatSendMessageState
+from render import default_renderer
+from events import default_event_log
+from metrics import instrumented
+from chat_service.broker import default_broker
+from chat_service.history import default_history
+from notifications_service.inbox import default_hub
+from services import LazyState
+from settings_service.store import default_settings_store
 
+@instrumented
 class ChatContext:
-    def __init__(self, username):
+    start_state = LazyState("chat_service.states:ChatStartState")
+    send_message_state = LazyState("chat_service.states:ChatSendMessageState")
+
+    __slots__ = ("username", "broker", "history", "notification_hub", "renderer", "friend_name", "message",
+                 "display", "events", "state")
+    SNAPSHOT_FIELDS = ("friend_name", "message")
+    SERVICE = "chat"
+
+    def __init__(self, username, broker=None, history=None, notification_hub=None, renderer=None, events=None,
+                 settings=None):
         self.username = username
+        self.broker = broker if broker is not None else default_broker()
+        self.history = history if history is not None else default_history()
+        self.notification_hub = notification_hub if notification_hub is not None else default_hub()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        # Ukuran font dan tema terbaru, diperbarui SettingsStore saat pengguna mengubahnya
+        self.display = (settings if settings is not None else default_settings_store()).live(username)
         self.friend_name = None
         self.message = None
-        self.state = ChatStartState(self)
+        self.state = self.start_state
 
     def set_state(self, state):
+        self.events.transition(self, state)
         self.state = state
 
+    def show(self, view):
+        self.renderer.render(view)
+
     def request(self, friend_name=None, message=None):
         if friend_name:
             self.friend_name = friend_name
         if message:
             self.message = message
-        self.state.handle()
+        view = self.state.handle(self)
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
@@ -0,0 +1,307 @@
+import atexit
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from array import array
+
+from storage import data_path
+
+# crc32, waktu kirim, panjang pengirim, panjang penerima, panjang teks
+HEADER = struct.Struct("<IdHHI")
+SEGMENT_SUFFIX = ".log"
+COMPACT_SUFFIX = ".compact"
+# Catatan kompaksi yang sedang berjalan: "target seg1 seg2 ...". Selama berkas ini ada, segmen hasil
+# gabungan (target + COMPACT_SUFFIX atau target yang sudah diganti) lebih baru daripada segmen lain
+# di daftar itu, jadi pemulihan menyelesaikan kompaksi alih-alih membaca pesan yang sama dua kali.
+MANIFEST = "compact.manifest"
+OFFSET_BITS = 40
+
+
+def conversation_key(a, b):
+    return f"{a}\x1f{b}" if a <= b else f"{b}\x1f{a}"
+
+
+def _position(segment_id, offset):
+    return (segment_id << OFFSET_BITS) | offset
+
+
+class ChatHistoryLog:
+    # Log append-only bersegmen. Indeks offset per percakapan disimpan di memori (array('Q'))
+    # dan dibangun ulang dari segmen saat dibuka; pembacaan memakai mmap.
+    def __init__(self, directory, segment_bytes=64 * 2**20, commit_interval=0.005, durable=True):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.commit_interval = commit_interval
+        self.durable = durable
+        os.makedirs(directory, exist_ok=True)
+
+        self.index = {}        # conversation_key -> array('Q') posisi pesan
+        self.maps = {}         # segment_id -> (mmap, ukuran)
+        self.lock = threading.Lock()
+        self.flushed = threading.Condition(self.lock)
+        self.buffer = bytearray()
+        self.appended = 0      # nomor urut append terakhir
+        self.committed = 0     # nomor urut append terakhir yang sudah di-fsync
+        self.flusher = None
+        self.closed = False
+
+        self._load()
+
+    def _segment_ids(self):
+        names = (name for name in os.listdir(self.directory) if name.endswith(SEGMENT_SUFFIX))
+        return sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in names)
+
+    def _segment_path(self, segment_id):
+        return os.path.join(self.directory, f"{segment_id:08d}{SEGMENT_SUFFIX}")
+
+    def _sync_directory(self):
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _recover(self):
+        # Selesaikan kompaksi yang terputus crash. Tanpa manifest, berkas .compact belum lengkap
+        # (crash saat menulis) dan segmen aslinya masih utuh: cukup dibuang.
+        manifest = os.path.join(self.directory, MANIFEST)
+        if os.path.exists(manifest):
+            with open(manifest) as handle:
+                target, *merged = (int(value) for value in handle.read().split())
+            temporary = self._segment_path(target) + COMPACT_SUFFIX
+            if os.path.exists(temporary):
+                os.replace(temporary, self._segment_path(target))
+            for segment_id in merged:
+                if segment_id != target and os.path.exists(self._segment_path(segment_id)):
+                    os.remove(self._segment_path(segment_id))
+            self._sync_directory()
+            os.remove(manifest)
+        for name in os.listdir(self.directory):
+            if name.endswith(COMPACT_SUFFIX) or name == MANIFEST + ".tmp":
+                os.remove(os.path.join(self.directory, name))
+
+    def _load(self):
+        self._recover()
+        self.index = {}
+        segment_ids = self._segment_ids() or [1]
+        for segment_id in segment_ids:
+            self._scan(segment_id)
+
+        self.segment_id = segment_ids[-1]
+        self.file = open(self._segment_path(self.segment_id), "ab")
+        self.written = self.file.tell()   # ukuran segmen aktif di disk (tanpa buffer)
+
+    def _scan(self, segment_id):
+        path = self._segment_path(segment_id)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+
+        with open(path, "rb") as handle:
+            data = handle.read()
+        offset = 0
+        while offset + HEADER.size <= len(data):
+            crc, _, sender_len, recipient_len, text_len = HEADER.unpack_from(data, offset)
+            end = offset + HEADER.size + sender_len + recipient_len + text_len
+            if end > len(data) or zlib.crc32(data[offset + 4:end]) != crc:
+                break
+            start = offset + HEADER.size
+            sender = data[start:start + sender_len].decode()
+            recipient = data[start + sender_len:start + sender_len + recipient_len].decode()
+            self.index.setdefault(conversation_key(sender, recipient), array("Q")).append(
+                _position(segment_id, offset)
+            )
+            offset = end
+
+        # Potong catatan yang tidak lengkap (crash saat menulis)
+        if offset < len(data):
+            with open(path, "r+b") as handle:
+                handle.truncate(offset)
+
+    @staticmethod
+    def _encode(sender, recipient, text, sent_at):
+        sender_bytes, recipient_bytes, text_bytes = sender.encode(), recipient.encode(), text.encode()
+        body = struct.pack("<dHHI", sent_at, len(sender_bytes), len(recipient_bytes), len(text_bytes))
+        body += sender_bytes + recipient_bytes + text_bytes
+        return struct.pack("<I", zlib.crc32(body)) + body
+
+    def append(self, sender, recipient, text, sent_at=None, sync=False):
+        record = self._encode(sender, recipient, text, sent_at if sent_at is not None else time.time())
+        with self.lock:
+            if self.written + len(self.buffer) + len(record) > self.segment_bytes and self.written + len(self.buffer):
+                self._rotate()
+            position = _position(self.segment_id, self.written + len(self.buffer))
+            self.buffer += record
+            self.index.setdefault(conversation_key(sender, recipient), array("Q")).append(position)
+            self.appended += 1
+            ticket = self.appended
+
+            if self.flusher is None and self.durable:
+                self.flusher = threading.Thread(target=self._flush_loop, name="chat-history-flush", daemon=True)
+                self.flusher.start()
+            if sync:
+                # Group commit: tunggu fsync berikutnya yang mencakup catatan ini
+                if not self.durable:
+                    self._commit()
+                while self.committed < ticket:
+                    self.flushed.wait()
+        return position
+
+    def _write(self):
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.written += len(self.buffer)
+            self.buffer = bytearray()
+        self.file.flush()
+
+    def _commit(self):
+        self._write()
+        if self.durable:
+            os.fsync(self.file.fileno())
+        self.committed = self.appended
+        self.flushed.notify_all()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.commit_interval)
+            with self.lock:
+                if self.closed:
+                    return
+                if self.committed < self.appended:
+                    self._commit()
+
+    def _rotate(self):
+        self._commit()
+        self.file.close()
+        self.segment_id += 1
+        self.file = open(self._segment_path(self.segment_id), "ab")
+        self.written = 0
+
+    def flush(self):
+        with self.lock:
+            self._commit()
+
+    def count(self, a, b):
+        positions = self.index.get(conversation_key(a, b))
+        return len(positions) if positions else 0
+
+    def _map(self, segment_id, end):
+        mapped = self.maps.get(segment_id)
+        if mapped is None or mapped[1] < end:
+            if mapped is not None:
+                mapped[0].close()
+            with open(self._segment_path(segment_id), "rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                mapped = (mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ), size)
+            self.maps[segment_id] = mapped
+        return mapped[0]
+
+    def _read(self, position):
+        segment_id, offset = position >> OFFSET_BITS, position & ((1 << OFFSET_BITS) - 1)
+        view = self._map(segment_id, offset + HEADER.size)
+        _, sent_at, sender_len, recipient_len, text_len = HEADER.unpack_from(view, offset)
+        end = offset + HEADER.size + sender_len + recipient_len + text_len
+        if end > len(view):
+            view = self._map(segment_id, end)
+        start = offset + HEADER.size
+        return {
+            "from": view[start:start + sender_len].decode(),
+            "to": view[start + sender_len:start + sender_len + recipient_len].decode(),
+            "text": view[start + sender_len + recipient_len:end].decode(),
+            "sent_at": sent_at,
+        }
+
+    def page(self, a, b, before=None, limit=50):
+        # Halaman mundur: pesan dengan nomor urut < before, urut dari yang terlama.
+        # Mengembalikan (pesan, kursor halaman sebelumnya atau None jika sudah di awal).
+        positions = self.index.get(conversation_key(a, b))
+        if not positions:
+            return [], None
+
+        end = len(positions) if before is None else max(0, min(before, len(positions)))
+        start = max(0, end - limit)
+        wanted = positions[start:end]
+        with self.lock:
+            # Catatan yang masih di buffer harus ditulis dulu agar bisa di-mmap
+            if wanted and wanted[-1] >> OFFSET_BITS == self.segment_id and (
+                wanted[-1] & ((1 << OFFSET_BITS) - 1)
+            ) >= self.written:
+                self._write()
+            messages = [self._read(position) for position in wanted]
+        return messages, (start or None)
+
+    def recent(self, a, b, limit=50):
+        return self.page(a, b, limit=limit)[0]
+
+    def compact(self, keep_last=1000):
+        # Tulis ulang semua segmen tersegel: hanya keep_last pesan terakhir per percakapan yang
+        # disimpan. Hasilnya memakai id segmen tersegel terkecil agar urutan tetap saat dibuka ulang.
+        with self.lock:
+            self._rotate()
+            sealed = [segment_id for segment_id in self._segment_ids() if segment_id < self.segment_id]
+            if not sealed:
+                return 0
+
+            keep = set()
+            for positions in self.index.values():
+                keep.update(p for p in positions[-keep_last:] if p >> OFFSET_BITS < self.segment_id)
+
+            target = sealed[0]
+            temporary = self._segment_path(target) + COMPACT_SUFFIX
+            removed = 0
+            with open(temporary, "wb") as output:
+                for segment_id in sealed:
+                    with open(self._segment_path(segment_id), "rb") as handle:
+                        data = handle.read()
+                    offset = 0
+                    while offset + HEADER.size <= len(data):
+                        _, _, sender_len, recipient_len, text_len = HEADER.unpack_from(data, offset)
+                        end = offset + HEADER.size + sender_len + recipient_len + text_len
+                        if _position(segment_id, offset) in keep:
+                            output.write(data[offset:end])
+                        else:
+                            removed += 1
+                        offset = end
+                output.flush()
+                os.fsync(output.fileno())
+
+            for mapped, _ in self.maps.values():
+                mapped.close()
+            self.maps = {}
+            # Manifest ditulis (dan di-fsync) sebelum segmen lama disentuh: crash di langkah mana pun
+            # setelah ini diselesaikan oleh _recover() saat log dibuka lagi
+            manifest = os.path.join(self.directory, MANIFEST)
+            with open(manifest + ".tmp", "w") as handle:
+                handle.write(" ".join(str(segment_id) for segment_id in sealed))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(manifest + ".tmp", manifest)
+            self._sync_directory()
+
+            self.file.close()
+            self._load()
+            return removed
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self._commit()
+            self.closed = True
+            self.file.close()
+            for mapped, _ in self.maps.values():
+                mapped.close()
+            self.maps = {}
+
+
+_default_history = None
+
+
+def default_history():
+    global _default_history
+    if _default_history is None:
+        _default_history = ChatHistoryLog(data_path("chat"))
+        atexit.register(_default_history.close)
+    return _default_history
@@ -0,0 +1,80 @@
+# Server TCP lokal pengganti gateway chat, protokol JSON per baris:
+#   -> {"login": "elder1"}
+#   -> {"to": "Diana", "text": "Hai!"}
+#   <- {"from": "Diana", "to": "elder1", "text": "...", "sent_at": ..., "seq": ...}
+# Jalankan dari DesignPattern/state: python -m chat_service.server [port]
+import asyncio
+import json
+import sys
+
+from chat_service.broker import ChatBroker
+
+
+class ChatServer:
+    def __init__(self, broker=None, host="127.0.0.1", port=8765):
+        self.broker = broker or ChatBroker()
+        self.host = host
+        self.port = port
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port, limit=2**16)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        await self.broker.close()
+
+    async def _handle(self, reader, writer):
+        device = None
+        forwarder = watcher = None
+        try:
+            hello = json.loads(await reader.readline() or b"{}")
+            user = hello.get("login")
+            if not user:
+                writer.write(b'{"error": "login diperlukan"}\n')
+                return
+
+            device = self.broker.connect(user, hello.get("device"))
+            forwarder = asyncio.create_task(self._forward(device, writer))
+            watcher = asyncio.create_task(self._close_on_disconnect(device, writer))
+            async for line in reader:
+                request = json.loads(line)
+                await self.broker.send(user, request["to"], request["text"], device=device)
+        except (ConnectionError, json.JSONDecodeError, KeyError):
+            pass
+        finally:
+            for task in (forwarder, watcher):
+                if task:
+                    task.cancel()
+            if device:
+                self.broker.disconnect(device)
+            writer.close()
+
+    @staticmethod
+    async def _close_on_disconnect(device, writer):
+        # Broker memutus perangkat (mis. konsumen lambat): putus juga socket-nya supaya klien tahu dan
+        # bisa menyambung ulang. abort(), bukan close(): buffer tulis klien lambat tidak akan pernah kosong.
+        await device.closed.wait()
+        writer.transport.abort()
+
+    @staticmethod
+    async def _forward(device, writer):
+        while device.connected:
+            message = await device.receive()
+            writer.write(json.dumps(message.to_dict()).encode() + b"\n")
+            # Tulis berkelompok: drain hanya saat antrean perangkat sudah kosong
+            if device.queue.empty():
+                await writer.drain()
+
+
+async def serve(port):
+    server = await ChatServer(port=port).start()
+    print(f"💬 Server chat berjalan di {server.host}:{server.port}")
+    await server.server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8765))
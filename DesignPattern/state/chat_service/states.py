@@ -1,22 +1,42 @@
+from render import Message
+from chat_service.views import ConversationView, SentView
+
+RECENT_MESSAGES = 50
+
+
 class ChatState:
-    def __init__(self, context):
-        self.context = context
+    __slots__ = ()
 
-    def handle(self):
+    def handle(self, context):
         raise NotImplementedError("Harus diimplementasikan oleh subclass")
 
 class ChatStartState(ChatState):
-    def handle(self):
-        if self.context.friend_name:
-            print(f"\n👵 Memulai obrolan dengan {self.context.friend_name}...")
-            print("💬 Kamu bisa mulai mengetik pesanmu.")
-            self.context.set_state(ChatSendMessageState(self.context))
-        else:
-            print("⚠️ Harap masukkan nama teman untuk memulai chat.")
+    def handle(self, context):
+        if not context.friend_name:
+            return Message("chat.no_friend", "⚠️ Harap masukkan nama teman untuk memulai chat.")
+
+        recent = context.history.recent(context.username, context.friend_name, RECENT_MESSAGES)
+        context.set_state(context.send_message_state)
+        context.events.emit(context, "chat.started", friend=context.friend_name)
+        return ConversationView(friend=context.friend_name, recent=recent, style=context.display.style())
 
 class ChatSendMessageState(ChatState):
-    def handle(self):
-        if self.context.message:
-            print(f"📤 Mengirim pesan ke {self.context.friend_name}: {self.context.message}")
-        else:
-            print("✍️ Belum ada pesan untuk dikirim.")
+    def handle(self, context):
+        if not context.message:
+            return Message("chat.no_message", "✍️ Belum ada pesan untuk dikirim.")
+
+        message = context.broker.send(context.username, context.friend_name, context.message)
+        context.history.append(
+            context.username, context.friend_name, context.message, message.sent_at, sync=True
+        )
+        context.events.emit(context, "chat.sent", friend=context.friend_name, seq=message.seq)
+        context.notification_hub.push(
+            context.friend_name, "chat", f"💬 {context.username}: '{context.message}'"
+        )
+        return SentView(
+            friend=context.friend_name,
+            text=context.message,
+            sent_at=message.sent_at,
+            online=context.broker.is_online(context.friend_name),
+            style=context.display.style(),
+        )
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from render import View
+
+
+class ConversationView(View):
+    kind = "chat.conversation"
+
+    def lines(self):
+        lines = [f"\n👵 Memulai obrolan dengan {self['friend']}..."]
+        if self['recent']:
+            lines.append(f"📜 {len(self['recent'])} pesan terakhir:")
+            for message in self['recent']:
+                sent_at = datetime.fromtimestamp(message["sent_at"]).strftime("%d/%m %H:%M")
+                lines.append(f"   [{sent_at}] {message['from']}: {message['text']}")
+        lines.append("💬 Kamu bisa mulai mengetik pesanmu.")
+        return lines
+
+
+class SentView(View):
+    kind = "chat.sent"
+
+    def lines(self):
+        status = "✅ Pesan terkirim." if self['online'] else (
+            f"🕓 {self['friend']} sedang offline, pesan akan diterima saat online."
+        )
+        return [f"📤 Mengirim pesan ke {self['friend']}: {self['text']}", status]
@@ -0,0 +1,111 @@
+import struct
+from datetime import datetime
+
+# Encoding biner ringkas bersama untuk snapshot sesi dan log kejadian: tag 1 byte + varint
+# (int zigzag, panjang string/list/dict). Hanya tipe data sederhana yang didukung.
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _TUPLE, _DICT, _DATETIME = range(10)
+_DOUBLE = struct.Struct("<d")
+
+
+class CodecError(ValueError):
+    pass
+
+
+def write_varint(out, number):
+    while number > 0x7F:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def read_varint(data, pos):
+    number = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, pos
+        shift += 7
+
+
+def write_str(out, text):
+    raw = text.encode("utf-8")
+    write_varint(out, len(raw))
+    out += raw
+
+
+def read_str(data, pos):
+    size, pos = read_varint(data, pos)
+    return data[pos:pos + size].decode("utf-8"), pos + size
+
+
+def encode_value(out, value):
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)      # zigzag
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        write_str(out, value)
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST if isinstance(value, list) else _TUPLE)
+        write_varint(out, len(value))
+        for item in value:
+            encode_value(out, item)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        write_varint(out, len(value))
+        for key, item in value.items():
+            write_str(out, key)
+            encode_value(out, item)
+    elif isinstance(value, datetime):
+        out.append(_DATETIME)
+        write_str(out, value.isoformat())
+    else:
+        raise CodecError(f"Tipe {type(value).__name__} tidak bisa disimpan.")
+
+
+def decode_value(data, pos):
+    tag = data[pos]
+    pos += 1
+    if tag == _NONE:
+        return None, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _INT:
+        number, pos = read_varint(data, pos)
+        return (number >> 1) if not number & 1 else -((number + 1) >> 1), pos
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+    if tag == _STR:
+        return read_str(data, pos)
+    if tag in (_LIST, _TUPLE):
+        count, pos = read_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = decode_value(data, pos)
+            items.append(item)
+        return (items if tag == _LIST else tuple(items)), pos
+    if tag == _DICT:
+        count, pos = read_varint(data, pos)
+        items = {}
+        for _ in range(count):
+            key, pos = read_str(data, pos)
+            items[key], pos = decode_value(data, pos)
+        return items, pos
+    if tag == _DATETIME:
+        text, pos = read_str(data, pos)
+        return datetime.fromisoformat(text), pos
+    raise CodecError(f"Tag tidak dikenal: {tag}")
@@ -0,0 +1,53 @@
+from geo import GeoGrid
+
+COMMUNITIES = [
+    {
+        "id": 1,
+        "name": "Klub Berkebun",
+        "photo": "🌱",
+        "description": "Tempat untuk para pecinta tanaman berbagi tips dan cerita.",
+        "members": 12,
+        "lat": -6.2297,
+        "lon": 106.8295
+    },
+    {
+        "id": 2,
+        "name": "Kelompok Baca Buku",
+        "photo": "📚",
+        "description": "Bergabung dengan sesama pembaca dan diskusikan buku favoritmu.",
+        "members": 8,
+        "lat": -6.1865,
+        "lon": 106.8341
+    },
+    {
+        "id": 3,
+        "name": "Teman Jalan Kaki",
+        "photo": "🚶",
+        "description": "Cari teman jalan kaki di sekitar lingkunganmu.",
+        "members": 15,
+        "lat": -6.1683,
+        "lon": 106.8316
+    }
+]
+
+
+def list_communities():
+    return [dict(community) for community in COMMUNITIES]
+
+
+def get_community(community_id):
+    for community in COMMUNITIES:
+        if community["id"] == community_id:
+            return dict(community)
+    return None
+
+
+_default_places = None
+
+
+def default_places():
+    global _default_places
+    if _default_places is None:
+        _default_places = GeoGrid()
+        _default_places.bulk_load((c["id"], c["lat"], c["lon"]) for c in COMMUNITIES)
+    return _default_places
@@ -1,19 +1,56 @@
-from community_service.states import BrowseCommunityState, JoinCommunityState
+from render import default_renderer
+from events import default_event_log
+from metrics import instrumented
+from console import default_input
+from notifications_service.inbox import default_hub
+from community_service.catalog import default_places
+from community_service.membership import default_membership
+from dashboard_service.store import default_dashboard_store
+from search import default_search_index
+from services import LazyState
 
+@instrumented
 class CommunityContext:
-    def __init__(self, username=""):
+    browse_community_state = LazyState("community_service.states:BrowseCommunityState")
+    join_community_state = LazyState("community_service.states:JoinCommunityState")
+
+    __slots__ = ("username", "input_provider", "renderer", "notification_hub", "location", "places",
+                 "search_index", "communities", "joined", "selected_community", "membership", "dashboards", "events", "state")
+    SNAPSHOT_FIELDS = ("location", "joined", "selected_community")
+    SERVICE = "community"
+
+    def __init__(self, username="", notification_hub=None, location=None, places=None, search_index=None,
+                 input_provider=None, renderer=None, events=None, membership=None, dashboards=None):
         self.username = username
+        self.input_provider = input_provider if input_provider is not None else default_input()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        self.notification_hub = notification_hub if notification_hub is not None else default_hub()
+        self.membership = membership if membership is not None else default_membership()
+        self.dashboards = dashboards if dashboards is not None else default_dashboard_store()
+        self.location = location      # (lat, lon) pengguna, None = lokasi bawaan
+        self.places = places if places is not None else default_places()
+        self.search_index = search_index if search_index is not None else default_search_index()
         self.communities = []
         self.joined = False
         self.selected_community = None
 
-        self.browse_community_state = BrowseCommunityState(self)
-        self.join_community_state = JoinCommunityState(self)
-
         self.state = self.browse_community_state
 
     def set_state(self, state):
+        self.events.transition(self, state)
         self.state = state
 
-    def request(self):
-        self.state.handle()
+    def show(self, view):
+        self.renderer.render(view)
+
+    def ask(self, prompt=""):
+        # Output yang tertunda harus tampil sebelum prompt
+        self.renderer.flush()
+        return self.input_provider.ask(prompt)
+
+    def request(self, **options):
+        view = self.state.handle(self, **options)
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
@@ -0,0 +1,48 @@
+import threading
+
+
+class Membership:
+    # Keanggotaan komunitas dua arah: anggota per komunitas dan komunitas per pengguna
+    def __init__(self):
+        self.members = {}           # id komunitas -> set pengguna
+        self.user_communities = {}  # pengguna -> set id komunitas
+        self.lock = threading.Lock()
+
+    def join(self, community_id, user):
+        # True bila pengguna baru bergabung, False bila sudah menjadi anggota
+        with self.lock:
+            members = self.members.setdefault(community_id, set())
+            if user in members:
+                return False
+            members.add(user)
+            self.user_communities.setdefault(user, set()).add(community_id)
+            return True
+
+    def leave(self, community_id, user):
+        with self.lock:
+            members = self.members.get(community_id)
+            if not members or user not in members:
+                return False
+            members.discard(user)
+            self.user_communities[user].discard(community_id)
+            return True
+
+    def is_member(self, community_id, user):
+        return user in self.members.get(community_id, ())
+
+    def count(self, community_id):
+        return len(self.members.get(community_id, ()))
+
+    def communities_for(self, user):
+        with self.lock:
+            return set(self.user_communities.get(user, ()))
+
+
+_default_membership = None
+
+
+def default_membership():
+    global _default_membership
+    if _default_membership is None:
+        _default_membership = Membership()
+    return _default_membership
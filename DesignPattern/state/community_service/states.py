@@ -1,72 +1,73 @@
 from abc import ABC, abstractmethod
 
+from geo import DEFAULT_LOCATION
+from search import ranked
+from render import Message
+from community_service.catalog import list_communities
+from community_service.views import CommunityListView, CommunityDetailView, JoinView
+
+NEARBY_RADIUS_KM = 5
+NEARBY_LIMIT = 10
+
+
+def nearby_communities(context, radius_km=NEARBY_RADIUS_KM, limit=NEARBY_LIMIT):
+    # Komunitas terdekat dari lokasi pengguna, lengkap dengan jaraknya
+    lat, lon = context.location or DEFAULT_LOCATION
+    by_id = {community['id']: community for community in list_communities()}
+    found = []
+    for distance, community_id in context.places.within(lat, lon, radius_km)[:limit]:
+        community = by_id[community_id]
+        community['distance_km'] = distance
+        found.append(community)
+    return found
+
 class DashboardState(ABC):
-    def __init__(self, context):
-        self.context = context
+    __slots__ = ()
 
     @abstractmethod
-    def handle(self):
+    def handle(self, context, **options):
         pass
 
 class BrowseCommunityState(DashboardState):
-    def handle(self):
-        print("\n🧑‍🤝‍🧑 Jelajahi Komunitas:\n")
-        self.context.communities = [
-            {
-                "id": 1,
-                "name": "Klub Berkebun",
-                "photo": "🌱",
-                "description": "Tempat untuk para pecinta tanaman berbagi tips dan cerita.",
-                "members": 12
-            },
-            {
-                "id": 2,
-                "name": "Kelompok Baca Buku",
-                "photo": "📚",
-                "description": "Bergabung dengan sesama pembaca dan diskusikan buku favoritmu.",
-                "members": 8
-            },
-            {
-                "id": 3,
-                "name": "Teman Jalan Kaki",
-                "photo": "🚶",
-                "description": "Cari teman jalan kaki di sekitar lingkunganmu.",
-                "members": 15
-            }
-        ]
+    def handle(self, context, nearby=False, radius_km=NEARBY_RADIUS_KM, limit=NEARBY_LIMIT, query=None, **options):
+        if nearby:
+            context.communities = nearby_communities(context, radius_km, limit)
+        else:
+            context.communities = list_communities()
+        if query:
+            context.communities = ranked(context.search_index, query, "community", context.communities)
 
-        for idx, community in enumerate(self.context.communities, 1):
-            print(f"[{idx}] {community['photo']} {community['name']} - {community['members']} anggota")
+        listing = CommunityListView(nearby=nearby, radius_km=radius_km, query=query, communities=context.communities)
+        if not context.communities:
+            return listing
+        context.show(listing)
 
-        choice = input("\nPilih komunitas untuk lihat detail (1-3): ")
-        if choice.isdigit() and 1 <= int(choice) <= len(self.context.communities):
-            selected = self.context.communities[int(choice) - 1]
-            self.context.selected_community = selected
-            self.context.set_state(self.context.join_community_state)
-        else:
-            print("❗ Pilihan tidak valid, kembali ke dashboard.")
+        choice = context.ask(f"\nPilih komunitas untuk lihat detail (1-{len(context.communities)}): ")
+        if choice.isdigit() and 1 <= int(choice) <= len(context.communities):
+            selected = context.communities[int(choice) - 1]
+            context.selected_community = selected
+            context.events.emit(context, "community.selected", community_id=selected['id'])
+            context.set_state(context.join_community_state)
+            return None
+        return Message("community.invalid_choice", "❗ Pilihan tidak valid, kembali ke dashboard.")
 
 class JoinCommunityState(DashboardState):
-    def handle(self):
-        community = self.context.selected_community
-        print(f"\n📄 Detail Komunitas:\n")
-        print(f"{community['photo']} {community['name']}")
-        print(f"📃 Deskripsi: {community['description']}")
-        print(f"👥 Jumlah Anggota: {community['members']}")
+    def handle(self, context, **options):
+        community = context.selected_community
+        context.show(CommunityDetailView(community=community))
 
-        join = input("\nApakah kamu ingin bergabung dengan komunitas ini? (y/n): ").lower()
-        if join == "y":
-            if not self.context.joined:
-                self.context.joined = True
-                print(f"✅ Kamu berhasil bergabung dengan {community['name']}!")
-                print("💬 Masuk ke obrolan grup komunitas...\n")
+        join = context.ask("\nApakah kamu ingin bergabung dengan komunitas ini? (y/n): ").lower()
+        if join != "y":
+            return JoinView(community=community, status="declined")
+        # Keanggotaan dicatat per komunitas oleh Membership; context.joined hanya menandai bahwa
+        # pengguna pernah bergabung di sesi ini
+        if not context.membership.join(community['id'], context.username):
+            return JoinView(community=community, status="already_joined")
 
-                # Simulasi obrolan grup
-                print(f"[Grup {community['name']}]")
-                print("👤 Admin: Selamat datang di grup!")
-                print("👵 Nenek Sue: Tidak sabar membagikan tips berkebun saya!")
-                print("👴 Kakek Rick: Ayo tanam tomat bersama 🌿")
-            else:
-                print("⚠️ Kamu sudah bergabung dengan komunitas.")
-        else:
-            print("↩️ Kembali tanpa bergabung.")
+        context.joined = True
+        context.events.emit(context, "community.joined", community_id=community['id'])
+        context.dashboards.joined(context.username, community['id'])
+        context.notification_hub.push(
+            context.username, "community", f"👥 Selamat datang di {community['name']}! Yuk sapa anggota lainnya."
+        )
+        return JoinView(community=community, status="joined")
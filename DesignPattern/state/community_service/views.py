@@ -0,0 +1,53 @@
+from render import View
+
+
+class CommunityListView(View):
+    kind = "community.list"
+
+    def lines(self):
+        if self.get('query'):
+            lines = [f"\n🔎 Hasil pencarian komunitas '{self['query']}':\n"]
+        else:
+            lines = ["\n🧑‍🤝‍🧑 Komunitas di Sekitarmu:\n" if self['nearby'] else "\n🧑‍🤝‍🧑 Jelajahi Komunitas:\n"]
+        if not self['communities']:
+            if self.get('query'):
+                lines.append(f"📭 Tidak ada komunitas yang cocok dengan '{self['query']}'.")
+            else:
+                lines.append(f"📭 Tidak ada komunitas dalam radius {self['radius_km']} km.")
+        for idx, community in enumerate(self['communities'], 1):
+            distance = f" ({community['distance_km']:.1f} km)" if 'distance_km' in community else ""
+            lines.append(f"[{idx}] {community['photo']} {community['name']} - {community['members']} anggota{distance}")
+        return lines
+
+
+class CommunityDetailView(View):
+    kind = "community.detail"
+
+    def lines(self):
+        community = self['community']
+        return [
+            "\n📄 Detail Komunitas:\n",
+            f"{community['photo']} {community['name']}",
+            f"📃 Deskripsi: {community['description']}",
+            f"👥 Jumlah Anggota: {community['members']}",
+        ]
+
+
+class JoinView(View):
+    kind = "community.join"
+
+    def lines(self):
+        community = self['community']
+        if self['status'] == "declined":
+            return ["↩️ Kembali tanpa bergabung."]
+        if self['status'] == "already_joined":
+            return ["⚠️ Kamu sudah bergabung dengan komunitas."]
+        return [
+            f"✅ Kamu berhasil bergabung dengan {community['name']}!",
+            "💬 Masuk ke obrolan grup komunitas...\n",
+            # Simulasi obrolan grup
+            f"[Grup {community['name']}]",
+            "👤 Admin: Selamat datang di grup!",
+            "👵 Nenek Sue: Tidak sabar membagikan tips berkebun saya!",
+            "👴 Kakek Rick: Ayo tanam tomat bersama 🌿",
+        ]
@@ -0,0 +1,46 @@
+import sys
+from collections import deque
+
+# Sumber input untuk semua state: konsol untuk pemakaian biasa, skrip untuk uji beban/otomasi
+
+
+class ConsoleInput:
+    def ask(self, prompt=""):
+        return input(prompt)
+
+
+class ScriptedInput:
+    # Jawaban diambil berurutan. Jika habis: pakai `default`, atau EOFError seperti input().
+    # Prompt tetap dicetak seperti input(); echo=True ikut mencetak jawabannya.
+    def __init__(self, answers=(), default=None, echo=False):
+        self.answers = deque(answers)
+        self.default = default
+        self.echo = echo
+        self.asked = 0
+
+    def feed(self, *answers):
+        self.answers.extend(answers)
+
+    def remaining(self):
+        return len(self.answers)
+
+    def ask(self, prompt=""):
+        self.asked += 1
+        if self.answers:
+            answer = self.answers.popleft()
+        elif self.default is not None:
+            answer = self.default
+        else:
+            raise EOFError(f"Jawaban skrip habis pada prompt: {prompt.strip()!r}")
+        sys.stdout.write(f"{prompt}{answer}\n" if self.echo else prompt)
+        return answer
+
+
+_default_input = None
+
+
+def default_input():
+    global _default_input
+    if _default_input is None:
+        _default_input = ConsoleInput()
+    return _default_input
@@ -1,8 +1,31 @@
-from dashboard_service.states import ViewDashboardState, ViewProfileState, SettingsState
+from render import default_renderer
+from events import default_event_log
+from metrics import instrumented
+from console import default_input
+from dashboard_service.store import default_dashboard_store
+from services import LazyState
+from settings_service.store import default_settings_store
 
+@instrumented
 class DashboardContext:
-    def __init__(self, username=""):
+    dashboard_state = LazyState("dashboard_service.states:ViewDashboardState")
+    profile_state = LazyState("dashboard_service.states:ViewProfileState")
+    settings_state = LazyState("dashboard_service.states:SettingsState")
+
+    __slots__ = ("username", "input_provider", "renderer", "full_name", "dob", "photo_url", "hobbies",
+                 "dashboards", "display", "events", "state")
+    SNAPSHOT_FIELDS = ("full_name", "dob", "photo_url", "hobbies")
+    SERVICE = "dashboard"
+
+    def __init__(self, username="", input_provider=None, renderer=None, events=None, dashboards=None,
+                 settings=None):
         self.username = username
+        self.input_provider = input_provider if input_provider is not None else default_input()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        self.dashboards = dashboards if dashboards is not None else default_dashboard_store()
+        # Ukuran font dan tema terbaru, diperbarui SettingsStore saat pengguna mengubahnya
+        self.display = (settings if settings is not None else default_settings_store()).live(username)
 
         # Default values
         self.full_name = "Unknown"
@@ -10,14 +33,22 @@ class DashboardContext:
         self.photo_url = "https://example.com/photo.jpg"
         self.hobbies = ["Walking", "Gardening"]
 
-        self.dashboard_state = ViewDashboardState(self)
-        self.profile_state = ViewProfileState(self)
-        self.settings_state = SettingsState(self)
-
         self.state = self.dashboard_state
 
     def set_state(self, state):
+        self.events.transition(self, state)
         self.state = state
 
+    def show(self, view):
+        self.renderer.render(view)
+
+    def ask(self, prompt=""):
+        # Output yang tertunda harus tampil sebelum prompt
+        self.renderer.flush()
+        return self.input_provider.ask(prompt)
+
     def request(self):
-        self.state.handle()
+        view = self.state.handle(self)
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
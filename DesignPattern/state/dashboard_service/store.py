@@ -0,0 +1,122 @@
+import threading
+
+from activities_service.booking import default_booking_engine
+from activities_service.catalog import ACTIVITIES
+from community_service.catalog import COMMUNITIES
+from community_service.membership import default_membership
+from friends_service.graph import default_graph, FRIEND, REQUEST
+
+
+def community_label(community):
+    return community["name"]
+
+
+def activity_label(activity):
+    return f"{activity['name']} — {activity['time']}"
+
+
+class DashboardEntry:
+    # Isi dasbor satu pengguna, siap ditampilkan. Field berupa tuple yang diganti utuh saat berubah
+    # (copy-on-write), jadi pembaca tidak perlu lock dan selalu melihat daftar yang konsisten.
+    __slots__ = ("communities", "activities", "friends")
+
+    def __init__(self, communities=(), activities=(), friends=()):
+        self.communities = communities
+        self.activities = activities
+        self.friends = friends
+
+
+def _added(items, item):
+    return items if item in items else items + (item,)
+
+
+def _removed(items, item):
+    return tuple(value for value in items if value != item) if item in items else items
+
+
+class DashboardStore:
+    # Dasbor per pengguna yang dimaterialisasi dari data teman, keanggotaan komunitas dan pesanan
+    # kegiatan. Dibangun dari sumber saat pertama dibaca, lalu diperbarui per kejadian (gabung,
+    # pesan, batal, tambah teman) sehingga membuka dasbor cukup satu lookup dict.
+    def __init__(self, graph=None, booking_engine=None, membership=None, communities=None, activities=None):
+        self.graph = graph if graph is not None else default_graph()
+        self.booking_engine = booking_engine if booking_engine is not None else default_booking_engine()
+        self.membership = membership if membership is not None else default_membership()
+        self.community_labels = {c["id"]: community_label(c) for c in (communities if communities is not None
+                                                                        else COMMUNITIES)}
+        self.activity_labels = {a["id"]: activity_label(a) for a in (activities if activities is not None
+                                                                      else ACTIVITIES)}
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, username):
+        entry = self.entries.get(username)
+        if entry is None:
+            with self.lock:
+                entry = self.entries.get(username)
+                if entry is None:
+                    entry = self.entries[username] = self.build(username)
+        return entry
+
+    def build(self, username):
+        # Hitung penuh dari ketiga sumber (jalur lambat; dipakai sekali per pengguna)
+        communities = self.membership.communities_for(username)
+        bookings = self.booking_engine.bookings_for(username)
+        friends = self.graph.neighbors(FRIEND, username)
+        requested = [name for name in self.graph.neighbors(REQUEST, username) if name not in friends]
+        return DashboardEntry(
+            self._labels(self.community_labels, communities),
+            self._labels(self.activity_labels, bookings),
+            tuple(friends + requested),
+        )
+
+    @staticmethod
+    def _labels(labels, ids):
+        # Urut id (= urutan katalog); id yang tidak ada di katalog dilewati
+        return tuple(labels[item] for item in sorted(ids) if item in labels)
+
+    def _update(self, username, field, change, item):
+        # Pengguna yang dasbornya belum pernah dibangun dilewati: build() nanti membaca sumber yang
+        # sudah berubah. Perubahan bersifat idempoten, jadi aman bila build() dan update berpapasan.
+        if item is None:
+            return
+        with self.lock:
+            entry = self.entries.get(username)
+            if entry is not None:
+                setattr(entry, field, change(getattr(entry, field), item))
+
+    def joined(self, username, community_id):
+        self._update(username, "communities", _added, self.community_labels.get(community_id))
+
+    def left(self, username, community_id):
+        self._update(username, "communities", _removed, self.community_labels.get(community_id))
+
+    def booked(self, username, activity_id):
+        self._update(username, "activities", _added, self.activity_labels.get(activity_id))
+
+    def cancelled(self, username, activity_id):
+        self._update(username, "activities", _removed, self.activity_labels.get(activity_id))
+
+    def friend_added(self, username, friend):
+        self._update(username, "friends", _added, friend)
+
+    def friend_removed(self, username, friend):
+        self._update(username, "friends", _removed, friend)
+
+    def forget(self, username):
+        # Buang dasbor yang dimaterialisasi; dibangun ulang dari sumber saat dibuka lagi
+        with self.lock:
+            self.entries.pop(username, None)
+
+
+_default_store = None
+
+
+def default_dashboard_store():
+    global _default_store
+    if _default_store is None:
+        _default_store = DashboardStore()
+    return _default_store
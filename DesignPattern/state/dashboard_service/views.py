@@ -0,0 +1,42 @@
+from render import View
+
+
+class DashboardView(View):
+    kind = "dashboard.home"
+
+    def lines(self):
+        lines = [
+            f"\n👋 Halo, {self['username'].capitalize()}! Selamat datang di SilverConnect 🌿",
+            "Dasbor personal Anda untuk kesejahteraan lansia dan koneksi sosial:\n",
+            # Tombol atas
+            "🔘 [ Komunitas ]    🔘 [ Aktivitas ]    🔘 [ Teman ]\n",
+            "🧑‍🤝‍🧑 Komunitas Anda:",
+        ]
+        lines += self.items(self['communities'], "Belum bergabung dengan komunitas.")
+        lines.append("🎯 Aktivitas Anda:")
+        lines += self.items(self['activities'], "Belum ada kegiatan yang dipesan.")
+        lines.append("👥 Teman Anda:")
+        lines += self.items(self['friends'], "Belum ada teman.")
+        lines.append("📋 Opsi:")
+        lines += [f"[{index}] {option}" for index, option in enumerate(self['options'], 1)]
+        return lines
+
+
+    @staticmethod
+    def items(names, empty):
+        lines = [f"- {name}" for name in names] or [f"- ({empty})"]
+        lines[-1] += "\n"
+        return lines
+
+
+class ProfileView(View):
+    kind = "dashboard.profile"
+
+    def lines(self):
+        return [
+            f"[Dasbor] Menampilkan profil pengguna '{self['username']}'",
+            f"👤 Nama Lengkap: {self['full_name']}",
+            f"📅 Tanggal Lahir: {self['dob']}",
+            f"📸 URL Foto: {self['photo_url']}",
+            f"🎨 Hobi: {', '.join(self['hobbies'])}",
+        ]
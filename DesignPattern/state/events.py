@@ -0,0 +1,294 @@
+import atexit
+import os
+import struct
+import threading
+import time
+import zlib
+
+from codec import encode_value, decode_value
+from storage import data_path
+from services import LazyState
+
+# Log kejadian append-only: setiap perpindahan state context dan kejadian domain (daftar akun,
+# gabung komunitas, pesan kegiatan, suka profil, ...) dicatat sebagai catatan biner bersegmen.
+# Penulis hanya menambah ke buffer; thread latar menulis buffer per batch dan fsync sekali untuk
+# banyak catatan (group commit). Pemanggil yang butuh jaminan memakai sync=True.
+
+# crc32, nomor urut, waktu, panjang teks, panjang payload. Teks = pengguna, layanan, nama kejadian
+# (dan untuk perpindahan state: state asal, state tujuan) dipisah SEPARATOR; payload = codec.
+HEADER = struct.Struct("<IQdHI")
+SEPARATOR = "\x1f"
+SEGMENT_SUFFIX = ".events"
+TRANSITION = "state"
+
+
+class Event:
+    __slots__ = ("seq", "at", "username", "service", "name", "data")
+
+    def __init__(self, seq, at, username, service, name, data):
+        self.seq = seq
+        self.at = at
+        self.username = username
+        self.service = service
+        self.name = name
+        self.data = data
+
+    def to_dict(self):
+        return {
+            "seq": self.seq,
+            "at": self.at,
+            "username": self.username,
+            "service": self.service,
+            "name": self.name,
+            "data": self.data,
+        }
+
+
+_state_names = {}
+
+
+def state_names(cls):
+    # Kelas state -> nama atributnya di kelas context, dicari sekali per kelas context. Setiap kelas
+    # state dipakai satu atribut saja; LazyState yang belum dibuat cukup dimuat kelasnya.
+    names = _state_names.get(cls)
+    if names is None:
+        names = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if name.endswith("_state"):
+                    names[value.state_class if isinstance(value, LazyState) else type(value)] = name
+        _state_names[cls] = names
+    return names
+
+
+def encode_body(username, service, name, data):
+    # (teks, payload); data perpindahan state cukup disimpan sebagai teks, tanpa codec
+    if name == TRANSITION:
+        return encode_transition(username, service, data["from"], data["to"]), b""
+    text = SEPARATOR.join((username or "", service, name)).encode("utf-8")
+    if data is None:
+        return text, b""
+    payload = bytearray()
+    encode_value(payload, data)
+    return text, payload
+
+
+def encode_transition(username, service, source, target):
+    return SEPARATOR.join((username or "", service, TRANSITION, source or "", target or "")).encode("utf-8")
+
+
+_CRC = struct.Struct("<I")
+_TAIL = struct.Struct(HEADER.format[:1] + HEADER.format[2:])
+
+
+def encode_record(seq, at, text, payload):
+    tail = _TAIL.pack(seq, at, len(text), len(payload))
+    body = text + payload
+    return _CRC.pack(zlib.crc32(body, zlib.crc32(tail))) + tail + body
+
+
+def scan_records(data, offset=0):
+    # (offset awal, offset akhir, header) untuk setiap catatan utuh; berhenti di catatan rusak/terpotong
+    view = memoryview(data)
+    size = len(data)
+    while offset + HEADER.size <= size:
+        header = HEADER.unpack_from(data, offset)
+        end = offset + HEADER.size + header[3] + header[4]
+        if end > size or zlib.crc32(view[offset + 4:end]) != header[0]:
+            return
+        yield offset, end, header
+        offset = end
+
+
+def decode_events(data, offset=0):
+    for start, end, (_, seq, at, text_length, payload_length) in scan_records(data, offset):
+        pos = start + HEADER.size
+        fields = str(data[pos:pos + text_length], "utf-8").split(SEPARATOR)
+        username, service, name = fields[0] or None, fields[1], fields[2]
+        if name == TRANSITION:
+            payload = {"from": fields[3] or None, "to": fields[4] or None}
+        elif payload_length:
+            payload = decode_value(data, pos + text_length)[0]
+        else:
+            payload = None
+        yield Event(seq, at, username, service, name, payload), end
+
+
+class EventLog:
+    def __init__(self, directory, segment_bytes=64 * 2**20, commit_interval=0.005, durable=True,
+                 batch_bytes=2**20):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.commit_interval = commit_interval
+        self.durable = durable
+        self.batch_bytes = batch_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.flushed = threading.Condition(self.lock)
+        self.wakeup = threading.Condition(self.lock)
+        self.buffer = bytearray()
+        self.waiting = 0       # penulis sync=True yang sedang menunggu fsync
+        self.commits = 0       # jumlah fsync (untuk melihat efek group commit)
+        self.flusher = None
+        self.closed = False
+
+        segment_ids = self._segment_ids() or [1]
+        self.segment_id = segment_ids[-1]
+        self.seq = self._recover(segment_ids)
+        self.committed = self.seq     # nomor urut terakhir yang sudah di-fsync
+        self.file = open(self._segment_path(self.segment_id), "ab")
+        self.written = self.file.tell()
+
+    def _segment_ids(self):
+        names = (name for name in os.listdir(self.directory) if name.endswith(SEGMENT_SUFFIX))
+        return sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in names)
+
+    def _segment_path(self, segment_id):
+        return os.path.join(self.directory, f"{segment_id:08d}{SEGMENT_SUFFIX}")
+
+    def _recover(self, segment_ids):
+        # Nomor urut terakhir; cukup membaca header segmen aktif. Ekor yang terpotong (crash saat
+        # menulis) dibuang. Segmen aktif yang kosong: lihat segmen sebelumnya.
+        for segment_id in reversed(segment_ids):
+            path = self._segment_path(segment_id)
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as handle:
+                data = handle.read()
+            seq, offset = 0, 0
+            for _, offset, header in scan_records(data):
+                seq = header[1]
+            if offset < len(data):
+                with open(path, "r+b") as handle:
+                    handle.truncate(offset)
+            if seq:
+                return seq
+        return 0
+
+    def append(self, username, service, name, data=None, at=None, sync=False):
+        text, payload = encode_body(username, service, name, data)
+        return self._append(text, payload, at if at is not None else time.time(), sync)
+
+    def _append(self, text, payload, at, sync):
+        with self.lock:
+            if self.closed:
+                raise ValueError("Log kejadian sudah ditutup.")
+            self.seq += 1
+            ticket = self.seq
+            record = encode_record(ticket, at, text, payload)
+            if self.written + len(self.buffer) + len(record) > self.segment_bytes and self.written + len(self.buffer):
+                self._rotate()
+            self.buffer += record
+            if len(self.buffer) >= self.batch_bytes:
+                self._write()
+
+            if self.flusher is None:
+                self.flusher = threading.Thread(target=self._flush_loop, name="event-log-flush", daemon=True)
+                self.flusher.start()
+            if sync:
+                # Group commit: bangunkan thread flush, lalu tunggu fsync yang mencakup catatan ini.
+                # Penulis yang datang selama fsync berjalan ikut fsync berikutnya.
+                if not self.durable:
+                    self._commit()
+                self.waiting += 1
+                self.wakeup.notify()
+                while self.committed < ticket:
+                    self.flushed.wait()
+                self.waiting -= 1
+        return ticket
+
+    def emit(self, context, name, **data):
+        return self.append(context.username, context.SERVICE, name, data or None)
+
+    def transition(self, context, state):
+        names = state_names(type(context))
+        text = encode_transition(context.username, context.SERVICE, names.get(type(context.state)), names.get(type(state)))
+        return self._append(text, b"", time.time(), False)
+
+    def _write(self):
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.written += len(self.buffer)
+            self.buffer = bytearray()
+        self.file.flush()
+
+    def _commit(self):
+        self._write()
+        if self.durable:
+            os.fsync(self.file.fileno())
+            self.commits += 1
+        self.committed = self.seq
+        self.flushed.notify_all()
+
+    def _flush_loop(self):
+        # Fsync paling lambat setiap commit_interval, atau segera bila ada penulis sync=True.
+        # Fsync berjalan di luar lock (pada salinan fd) agar penulis lain tidak ikut menunggu disk.
+        with self.lock:
+            while not self.closed:
+                if not self.waiting or self.committed >= self.seq:
+                    self.wakeup.wait(self.commit_interval)
+                if self.closed:
+                    return
+                if self.committed >= self.seq:
+                    continue
+                self._write()
+                target = self.seq
+                if not self.durable:
+                    self.committed = target
+                    self.flushed.notify_all()
+                    continue
+                descriptor = os.dup(self.file.fileno())
+                self.lock.release()
+                try:
+                    os.fsync(descriptor)
+                finally:
+                    os.close(descriptor)
+                    self.lock.acquire()
+                self.commits += 1
+                if target > self.committed:
+                    self.committed = target
+                    self.flushed.notify_all()
+
+    def _rotate(self):
+        self._commit()
+        self.file.close()
+        self.segment_id += 1
+        self.file = open(self._segment_path(self.segment_id), "ab")
+        self.written = 0
+
+    def flush(self):
+        with self.lock:
+            self._commit()
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self._commit()
+            self.closed = True
+            self.file.close()
+            self.wakeup.notify_all()
+
+
+def read_events(directory, since=0):
+    # Semua kejadian dengan nomor urut > since, berurutan dari segmen terlama
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(SEGMENT_SUFFIX):
+            continue
+        with open(os.path.join(directory, name), "rb") as handle:
+            data = handle.read()
+        for event, _ in decode_events(data):
+            if event.seq > since:
+                yield event
+
+
+_default_log = None
+
+
+def default_event_log():
+    global _default_log
+    if _default_log is None:
+        _default_log = EventLog(data_path("events"))
+        atexit.register(_default_log.close)
+    return _default_log
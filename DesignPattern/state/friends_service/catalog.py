@@ -0,0 +1,64 @@
+from geo import GeoGrid
+from friends_service.index import FriendIndex
+from friends_service.recommend import HobbyRecommender
+
+PROFILES = [
+    {
+        "name": "Charlie",
+        "photo": "charlie.jpg",
+        "interest": ["Gaming", "Reading"],
+        "description": "A passionate gamer and bookworm.",
+        "age": 25,
+        "mode": "pertemanan",
+        "lat": -6.1951,
+        "lon": 106.8230
+    },
+    {
+        "name": "Diana",
+        "photo": "diana.jpg",
+        "interest": ["Cooking", "Yoga"],
+        "description": "Loves healthy living and great food.",
+        "age": 28,
+        "mode": "cinta",
+        "lat": -6.1805,
+        "lon": 106.8284
+    },
+    {
+        "name": "Eve",
+        "photo": "eve.jpg",
+        "interest": ["Reading", "Yoga"],
+        "description": "Quiet and thoughtful person.",
+        "age": 30,
+        "mode": "pertemanan",
+        "lat": -6.2615,
+        "lon": 106.7810
+    }
+]
+
+
+# Indeks profil dibagi semua sesi; pembaruan minat/lokasi langsung terlihat oleh semua pengguna
+_default_friend_index = None
+_default_recommender = None
+_default_places = None
+
+
+def default_friend_index():
+    global _default_friend_index
+    if _default_friend_index is None:
+        _default_friend_index = FriendIndex(PROFILES)
+    return _default_friend_index
+
+
+def default_recommender():
+    global _default_recommender
+    if _default_recommender is None:
+        _default_recommender = HobbyRecommender(PROFILES)
+    return _default_recommender
+
+
+def default_places():
+    global _default_places
+    if _default_places is None:
+        _default_places = GeoGrid()
+        _default_places.bulk_load((profile["name"], profile["lat"], profile["lon"]) for profile in PROFILES)
+    return _default_places
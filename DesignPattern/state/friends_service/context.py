@@ -1,43 +1,89 @@
-from friends_service.states import SearchFriendsState, ChatState, FriendDetailState
+from render import default_renderer
+from events import default_event_log
+from metrics import instrumented
+from friends_service.catalog import default_friend_index, default_recommender, default_places
+from friends_service.graph import default_graph, FRIEND, LIKE, REQUEST
+from friends_service.matchmaking import default_matchmaker
+from notifications_service.inbox import default_hub
+from search import default_search_index, profile_document
+from dashboard_service.store import default_dashboard_store
+from services import LazyState
 
+@instrumented
 class FriendContext:
-    def __init__(self, username=""):
+    search_friends_state = LazyState("friends_service.states:SearchFriendsState")
+    chat_state = LazyState("friends_service.states:ChatState")
+    friend_detail_state = LazyState("friends_service.states:FriendDetailState")
+    recommend_friends_state = LazyState("friends_service.states:RecommendFriendsState")
+
+    __slots__ = ("username", "notification_hub", "renderer", "hobbies", "mode", "location", "graph",
+                 "friend_index", "recommender", "places", "search_index", "dashboards", "matchmaker", "events",
+                 "state")
+    SNAPSHOT_FIELDS = ("hobbies", "mode", "location")
+    SERVICE = "friends"
+
+    def __init__(self, username="", graph=None, hobbies=None, mode=None, notification_hub=None,
+                 location=None, friend_index=None, recommender=None, places=None, search_index=None,
+                 renderer=None, events=None, dashboards=None, matchmaker=None):
         self.username = username
-        self.friends = ["Alice", "Bob"]
-        self.potential_friends = [
-            {
-                "name": "Charlie",
-                "photo": "charlie.jpg",
-                "interest": ["Gaming", "Reading"],
-                "description": "A passionate gamer and bookworm.",
-                "age": 25
-            },
-            {
-                "name": "Diana",
-                "photo": "diana.jpg",
-                "interest": ["Cooking", "Yoga"],
-                "description": "Loves healthy living and great food.",
-                "age": 28
-            },
-            {
-                "name": "Eve",
-                "photo": "eve.jpg",
-                "interest": ["Reading", "Yoga"],
-                "description": "Quiet and thoughtful person.",
-                "age": 30
-            }
-        ]
-        self.added_friends = []
-        self.liked_friends = []
-
-        self.search_friends_state = SearchFriendsState(self)
-        self.chat_state = ChatState(self)
-        self.friend_detail_state = FriendDetailState(self)
+        self.notification_hub = notification_hub if notification_hub is not None else default_hub()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        self.hobbies = list(hobbies or [])
+        self.mode = mode
+        self.location = location      # (lat, lon) pengguna
+        self.dashboards = dashboards if dashboards is not None else default_dashboard_store()
+        self.graph = graph if graph is not None else default_graph()
+        self.friend_index = friend_index if friend_index is not None else default_friend_index()
+        self.recommender = recommender if recommender is not None else default_recommender()
+        self.places = places if places is not None else default_places()
+        self.search_index = search_index if search_index is not None else default_search_index()
+        self.matchmaker = matchmaker if matchmaker is not None else default_matchmaker()
 
         self.state = self.search_friends_state
 
+    @property
+    def friends(self):
+        return self.graph.neighbors(FRIEND, self.username)
+
+    @property
+    def added_friends(self):
+        return self.graph.neighbors(REQUEST, self.username)
+
+    @property
+    def liked_friends(self):
+        return self.graph.neighbors(LIKE, self.username)
+
     def set_state(self, state):
+        self.events.transition(self, state)
         self.state = state
 
-    def request(self, friend_name=None, interest_filter=None, action=None):
-        self.state.handle(friend_name=friend_name, interest_filter=interest_filter, action=action)
+    def show(self, view):
+        self.renderer.render(view)
+
+    def update_interests(self, name, interests):
+        self.recommender.update_interests(name, interests)
+        self.matchmaker.update_interests(name, interests)
+        updated = self.friend_index.update_interests(name, interests)
+        profile = self.friend_index.get(name)
+        if profile is not None:
+            self.search_index.update(*profile_document(profile))
+        return updated
+
+    def update_location(self, name, lat, lon):
+        self.places.move(name, lat, lon)
+
+    def nearby(self, radius_km=5, limit=10):
+        # Profil terdekat dari lokasi pengguna: [(jarak_km, profil)]
+        if self.location is None:
+            return []
+        lat, lon = self.location
+        found = [(distance, name) for distance, name in self.places.within(lat, lon, radius_km)
+                 if name != self.username]
+        return [(distance, self.friend_index.get(name)) for distance, name in found[:limit]]
+
+    def request(self, friend_name=None, interest_filter=None, action=None, **options):
+        view = self.state.handle(self, friend_name=friend_name, interest_filter=interest_filter, action=action, **options)
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
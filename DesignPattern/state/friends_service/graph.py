@@ -0,0 +1,235 @@
+from array import array
+
+FRIEND = 0
+LIKE = 1
+REQUEST = 2
+KINDS = (FRIEND, LIKE, REQUEST)
+
+_EMPTY = 0
+_DELETED = (1 << 64) - 1
+_ID_BITS = 31
+_MAX_ID = (1 << _ID_BITS) - 1
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+class EdgeSet:
+    # Hash set open addressing di atas array('Q'): 8 byte per slot, tanpa objek per edge.
+    # Kunci disimpan sebagai key + 1 supaya 0 bisa dipakai sebagai slot kosong.
+    MAX_LOAD = 0.7
+
+    def __init__(self, capacity=1024):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.slots = array("Q", bytes(8 * size))
+        self.mask = size - 1
+        self.shift = 64 - (size.bit_length() - 1)
+        self.count = 0
+        self.used = 0   # slot terisi + tombstone
+
+    def __len__(self):
+        return self.count
+
+    def _probe(self, key):
+        stored = key + 1
+        slots = self.slots
+        mask = self.mask
+        index = ((stored * _HASH_MULTIPLIER) & _MASK64) >> self.shift
+        first_deleted = -1
+        while True:
+            value = slots[index]
+            if value == stored:
+                return index, True
+            if value == _EMPTY:
+                return (index if first_deleted < 0 else first_deleted), False
+            if value == _DELETED and first_deleted < 0:
+                first_deleted = index
+            index = (index + 1) & mask
+
+    def __contains__(self, key):
+        stored = key + 1
+        slots = self.slots
+        mask = self.mask
+        index = ((stored * _HASH_MULTIPLIER) & _MASK64) >> self.shift
+        while True:
+            value = slots[index]
+            if value == stored:
+                return True
+            if value == _EMPTY:
+                return False
+            index = (index + 1) & mask
+
+    def add(self, key):
+        index, found = self._probe(key)
+        if found:
+            return False
+        if self.slots[index] == _EMPTY:
+            self.used += 1
+        self.slots[index] = key + 1
+        self.count += 1
+        if self.used > self.MAX_LOAD * len(self.slots):
+            self._resize()
+        return True
+
+    def discard(self, key):
+        index, found = self._probe(key)
+        if not found:
+            return False
+        self.slots[index] = _DELETED
+        self.count -= 1
+        return True
+
+    def _resize(self):
+        old = self.slots
+        count = self.count
+        # Gandakan kapasitas, kecuali slot penuh karena tombstone saja
+        capacity = len(old) * 2 if count > self.MAX_LOAD * len(old) / 2 else len(old)
+        self.__init__(capacity)
+
+        slots = self.slots
+        mask = self.mask
+        shift = self.shift
+        for value in old:
+            if value == _EMPTY or value == _DELETED:
+                continue
+            index = ((value * _HASH_MULTIPLIER) & _MASK64) >> shift
+            while slots[index] != _EMPTY:
+                index = (index + 1) & mask
+            slots[index] = value
+        self.count = self.used = count
+
+    def nbytes(self):
+        return self.slots.itemsize * len(self.slots)
+
+
+class SocialGraph:
+    def __init__(self):
+        self.ids = {}       # nama -> id integer
+        self.names = []     # id -> nama
+        self.edges = EdgeSet()
+        self.adjacency = {kind: [] for kind in KINDS}   # kind -> [array('I') | None per id]
+
+    def intern(self, name):
+        user_id = self.ids.get(name)
+        if user_id is None:
+            user_id = len(self.names)
+            if user_id > _MAX_ID:
+                raise OverflowError("Jumlah pengguna melebihi kapasitas graf.")
+            self.ids[name] = user_id
+            self.names.append(name)
+            for lists in self.adjacency.values():
+                lists.append(None)
+        return user_id
+
+    def __len__(self):
+        return len(self.names)
+
+    @staticmethod
+    def _key(kind, source, target):
+        return (kind << (2 * _ID_BITS)) | (source << _ID_BITS) | target
+
+    def _link(self, kind, source, target):
+        if not self.edges.add(self._key(kind, source, target)):
+            return False
+        lists = self.adjacency[kind]
+        if lists[source] is None:
+            lists[source] = array("I")
+        lists[source].append(target)
+        return True
+
+    def _unlink(self, kind, source, target):
+        if not self.edges.discard(self._key(kind, source, target)):
+            return False
+        self.adjacency[kind][source].remove(target)
+        return True
+
+    def add(self, kind, source, target):
+        a, b = self.intern(source), self.intern(target)
+        added = self._link(kind, a, b)
+        if kind == FRIEND:
+            self._link(kind, b, a)
+        return added
+
+    def remove(self, kind, source, target):
+        a, b = self.ids.get(source), self.ids.get(target)
+        if a is None or b is None:
+            return False
+        removed = self._unlink(kind, a, b)
+        if kind == FRIEND:
+            self._unlink(kind, b, a)
+        return removed
+
+    def has(self, kind, source, target):
+        a, b = self.ids.get(source), self.ids.get(target)
+        if a is None or b is None:
+            return False
+        return self._key(kind, a, b) in self.edges
+
+    def _neighbor_ids(self, kind, name):
+        user_id = self.ids.get(name)
+        if user_id is None:
+            return ()
+        return self.adjacency[kind][user_id] or ()
+
+    def neighbors(self, kind, name):
+        names = self.names
+        return [names[i] for i in self._neighbor_ids(kind, name)]
+
+    def degree(self, kind, name):
+        return len(self._neighbor_ids(kind, name))
+
+    def mutual_friends(self, a, b):
+        a_id, b_id = self.ids.get(a), self.ids.get(b)
+        if a_id is None or b_id is None:
+            return []
+
+        friends = self.adjacency[FRIEND]
+        # Iterasi sisi yang lebih kecil, cek keanggotaan di sisi lain lewat EdgeSet
+        if len(friends[a_id] or ()) > len(friends[b_id] or ()):
+            a_id, b_id = b_id, a_id
+        edges = self.edges
+        return [self.names[i] for i in friends[a_id] or () if self._key(FRIEND, b_id, i) in edges]
+
+    def mutual_friend_count(self, a, b):
+        return len(self.mutual_friends(a, b))
+
+    def friends_of_friends(self, name, limit=None):
+        user_id = self.ids.get(name)
+        if user_id is None:
+            return []
+
+        friends = self.adjacency[FRIEND]
+        direct = friends[user_id] or ()
+        edges = self.edges
+        counts = {}
+        for friend in direct:
+            for candidate in friends[friend] or ():
+                if candidate == user_id or self._key(FRIEND, user_id, candidate) in edges:
+                    continue
+                counts[candidate] = counts.get(candidate, 0) + 1
+
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.names[i], count) for i, count in ranked]
+
+    def edge_count(self):
+        return len(self.edges)
+
+
+# Pertemanan contoh untuk akun demo, dimasukkan sekali saat graf bawaan dibuat
+DEMO_FRIENDS = {"elder1": ("Alice", "Bob")}
+
+_default_graph = None
+
+
+def default_graph():
+    global _default_graph
+    if _default_graph is None:
+        graph = SocialGraph()
+        for username, friends in DEMO_FRIENDS.items():
+            for name in friends:
+                graph.add(FRIEND, username, name)
+        _default_graph = graph
+    return _default_graph
@@ -0,0 +1,139 @@
+import heapq
+
+AGE_BUCKET_SIZE = 5
+
+
+def _key(interest):
+    return interest.strip().casefold()
+
+
+class FriendIndex:
+    def __init__(self, profiles=()):
+        self.ids = {}           # nama -> id internal
+        self.profiles = []      # id -> profil (None jika sudah dihapus)
+        self.ages = []          # id -> usia
+        self.postings = {}      # minat -> set id
+        self.age_buckets = {}   # (usia // AGE_BUCKET_SIZE) -> set id
+        self.active = set()
+
+        for profile in profiles:
+            self.add(profile)
+
+    def __len__(self):
+        return len(self.active)
+
+    def get(self, name):
+        doc_id = self.ids.get(name)
+        if doc_id is None:
+            return None
+        return self.profiles[doc_id]
+
+    def add(self, profile):
+        if profile["name"] in self.ids:
+            self.remove(profile["name"])
+
+        doc_id = len(self.profiles)
+        self.ids[profile["name"]] = doc_id
+        self.profiles.append(profile)
+        self.ages.append(profile["age"])
+        self.active.add(doc_id)
+
+        for interest in profile["interest"]:
+            self.postings.setdefault(_key(interest), set()).add(doc_id)
+        self.age_buckets.setdefault(profile["age"] // AGE_BUCKET_SIZE, set()).add(doc_id)
+        return doc_id
+
+    def remove(self, name):
+        doc_id = self.ids.pop(name, None)
+        if doc_id is None:
+            return False
+
+        profile = self.profiles[doc_id]
+        for interest in profile["interest"]:
+            self._discard(self.postings, _key(interest), doc_id)
+        self._discard(self.age_buckets, profile["age"] // AGE_BUCKET_SIZE, doc_id)
+        self.profiles[doc_id] = None
+        self.active.discard(doc_id)
+        return True
+
+    def update_interests(self, name, interests):
+        doc_id = self.ids.get(name)
+        if doc_id is None:
+            return False
+
+        profile = self.profiles[doc_id]
+        old_keys = {_key(i) for i in profile["interest"]}
+        new_keys = {_key(i) for i in interests}
+        for key in old_keys - new_keys:
+            self._discard(self.postings, key, doc_id)
+        for key in new_keys - old_keys:
+            self.postings.setdefault(key, set()).add(doc_id)
+
+        profile["interest"] = list(interests)
+        return True
+
+    def update_age(self, name, age):
+        doc_id = self.ids.get(name)
+        if doc_id is None:
+            return False
+
+        profile = self.profiles[doc_id]
+        self._discard(self.age_buckets, profile["age"] // AGE_BUCKET_SIZE, doc_id)
+        self.age_buckets.setdefault(age // AGE_BUCKET_SIZE, set()).add(doc_id)
+        profile["age"] = age
+        self.ages[doc_id] = age
+        return True
+
+    def search(self, all_of=(), any_of=(), min_age=None, max_age=None, offset=0, limit=20):
+        candidates = self._match_interests(all_of, any_of)
+        if min_age is not None or max_age is not None:
+            candidates = self._match_age(candidates, min_age, max_age)
+        if candidates is None:
+            candidates = self.active
+
+        # Urutan hasil stabil (urutan pendaftaran), cukup ambil halaman yang diminta
+        page = heapq.nsmallest(offset + limit, candidates)[offset:]
+        return len(candidates), [self.profiles[doc_id] for doc_id in page]
+
+    def _match_interests(self, all_of, any_of):
+        result = None
+
+        if all_of:
+            sets = sorted((self.postings.get(_key(i), set()) for i in all_of), key=len)
+            result = sets[0].intersection(*sets[1:])
+
+        if any_of:
+            union = set().union(*(self.postings.get(_key(i), set()) for i in any_of))
+            result = union if result is None else result & union
+
+        return result
+
+    def _match_age(self, candidates, min_age, max_age):
+        low = min_age if min_age is not None else 0
+        high = max_age if max_age is not None else 200
+        ages = self.ages
+
+        # Sudah ada kandidat dari minat: cek usia satu per satu; selain itu gabungkan bucket usia
+        if candidates is not None:
+            return {doc_id for doc_id in candidates if low <= ages[doc_id] <= high}
+
+        result = set()
+        for bucket in range(low // AGE_BUCKET_SIZE, high // AGE_BUCKET_SIZE + 1):
+            ids = self.age_buckets.get(bucket)
+            if not ids:
+                continue
+            bucket_low = bucket * AGE_BUCKET_SIZE
+            bucket_high = bucket_low + AGE_BUCKET_SIZE - 1
+            if low <= bucket_low and bucket_high <= high:
+                result |= ids
+            else:
+                result.update(doc_id for doc_id in ids if low <= ages[doc_id] <= high)
+        return result
+
+    @staticmethod
+    def _discard(table, key, doc_id):
+        ids = table.get(key)
+        if ids is not None:
+            ids.discard(doc_id)
+            if not ids:
+                del table[key]
@@ -0,0 +1,422 @@
+import bisect
+import concurrent.futures
+import heapq
+import math
+import os
+import threading
+
+from geo import DEFAULT_LOCATION
+from search import tokenize
+from friends_service.catalog import PROFILES
+
+# Perjodohan untuk pengguna mode "cinta". Kecocokan dua profil dihitung dari hobi, usia dan kata kunci
+# cerita; setiap pengguna mendapat TOP_K kandidat terbaik, dan pasangan dipilih hanya dari kandidat
+# yang saling memilih. Profil tidak punya dua sisi (bukan graf bipartit), jadi pasangan dipilih
+# serakah dari skor tertinggi: karena skornya simetris, hasilnya stabil (tidak ada dua orang yang
+# sama-sama lebih suka satu sama lain daripada pasangannya masing-masing).
+#
+# Pengguna dibagi per wilayah (sel REGION_DEGREES derajat); job malam memproses setiap wilayah di
+# process pool, dan perubahan satu profil cukup diperbaiki di sekitar pengguna itu.
+
+MODE = "cinta"
+REGION_DEGREES = 0.5        # ~55 km
+TOP_K = 10
+WINDOW = 8                  # tetangga di kiri dan kanan pada posting setiap hobi yang dinilai
+MAX_KEYWORDS = 12
+AGE_WINDOW = 10             # selisih usia di atas ini tidak dipasangkan
+HOBBY_WEIGHT = 0.5
+STORY_WEIGHT = 0.3
+AGE_WEIGHT = 0.2
+UNKNOWN_AGE = 0.5           # nilai komponen usia bila salah satu usia belum diisi
+PARALLEL_MIN = 20_000       # di bawah ini job malam berjalan di proses sendiri
+REPAIR_LIMIT = 64           # pengguna yang boleh dipasangkan ulang per perubahan profil
+
+
+def _key(hobby):
+    return hobby.strip().casefold()
+
+
+def region_of(lat, lon):
+    return math.floor(lat / REGION_DEGREES), math.floor(lon / REGION_DEGREES)
+
+
+def keywords(story):
+    return list(dict.fromkeys(tokenize(story or "")))[:MAX_KEYWORDS]
+
+
+def candidate_row(profile):
+    # Profil teman (interest, description) maupun akun lansia (hobbies, story)
+    lat = profile.get("lat", DEFAULT_LOCATION[0])
+    lon = profile.get("lon", DEFAULT_LOCATION[1])
+    return (
+        profile.get("name") or profile.get("username"),
+        region_of(lat, lon),
+        profile.get("age"),
+        tuple(profile.get("interest") or profile.get("hobbies") or ()),
+        profile.get("story") or profile.get("description") or "",
+    )
+
+
+def _posting_key(age, position):
+    # Posting urut usia lalu posisi; usia kosong di depan
+    return (age or 0) << 32 | position
+
+
+POSITION_MASK = (1 << 32) - 1
+
+
+class RegionShard:
+    # Profil satu wilayah: hobi dan kata kunci cerita sebagai bitset int, plus posting per hobi yang
+    # diurutkan menurut usia. Kandidat seseorang adalah WINDOW tetangga di kiri dan kanannya pada
+    # posting setiap hobinya: usianya dekat, dan hubungan "saling melihat" ini simetris sehingga
+    # kandidat yang saling memilih tetap banyak di wilayah sebesar apa pun.
+    def __init__(self, rows=()):
+        self.positions = {}
+        self.names = []
+        self.ages = []
+        self.keys = []
+        self.hobby_masks = []
+        self.story_masks = []
+        self.hobby_sizes = []
+        self.story_sizes = []
+        self.hobby_bits = {}
+        self.story_bits = {}
+        self.hobby_postings = {}    # bit -> [_posting_key] urut
+        # Posisi mengikuti urutan usia, jadi kandidat seseorang berada di dekat posisinya (lihat match)
+        for row in sorted(rows, key=lambda row: row[2] or 0):
+            self.add(row, bulk=True)
+        for posting in self.hobby_postings.values():
+            posting.sort()
+
+    def __len__(self):
+        return len(self.positions)
+
+    @staticmethod
+    def _encode(values, bits):
+        mask = 0
+        for value in values:
+            bit = bits.get(value)
+            if bit is None:
+                bit = bits[value] = len(bits)
+            mask |= 1 << bit
+        return mask
+
+    def add(self, row, bulk=False):
+        # bulk=True: posting diurutkan sekali oleh pemanggil setelah semua baris masuk
+        name, _, age, hobbies, story = row
+        self.remove(name)
+        position = len(self.names)
+        key = _posting_key(age, position)
+        hobby_mask = self._encode([_key(hobby) for hobby in hobbies], self.hobby_bits)
+        story_mask = self._encode(keywords(story), self.story_bits)
+        self.positions[name] = position
+        self.names.append(name)
+        self.ages.append(age)
+        self.keys.append(key)
+        self.hobby_masks.append(hobby_mask)
+        self.story_masks.append(story_mask)
+        self.hobby_sizes.append(hobby_mask.bit_count())
+        self.story_sizes.append(story_mask.bit_count())
+        for bit in _bits(hobby_mask):
+            posting = self.hobby_postings.get(bit)
+            if posting is None:
+                posting = self.hobby_postings[bit] = []
+            if bulk:
+                posting.append(key)
+            else:
+                bisect.insort(posting, key)
+        return position
+
+    def remove(self, name):
+        position = self.positions.pop(name, None)
+        if position is None:
+            return False
+        # Slot dikosongkan, bukan dihapus, agar posisi pengguna lain tetap
+        key = self.keys[position]
+        for bit in _bits(self.hobby_masks[position]):
+            posting = self.hobby_postings[bit]
+            del posting[bisect.bisect_left(posting, key)]
+        self.names[position] = None
+        self.hobby_masks[position] = self.story_masks[position] = 0
+        self.hobby_sizes[position] = self.story_sizes[position] = 0
+        return True
+
+    def candidates(self, position, window=WINDOW):
+        key = self.keys[position]
+        found = set()
+        for bit in _bits(self.hobby_masks[position]):
+            posting = self.hobby_postings[bit]
+            index = bisect.bisect_left(posting, key)
+            found.update(posting[max(0, index - window):index + window + 1])
+        found.discard(key)
+        return [key & POSITION_MASK for key in found]
+
+    def scored(self, position, window=WINDOW, after=False):
+        # [(skor, posisi)] kandidat pengguna ini. Skor = bobot Jaccard hobi + Jaccard kata kunci cerita
+        # + kedekatan usia; kandidat selalu berbagi minimal satu hobi. after=True hanya kandidat
+        # berposisi lebih besar, agar setiap pasangan dinilai sekali saja.
+        ages = self.ages
+        hobby_masks, story_masks = self.hobby_masks, self.story_masks
+        hobby_sizes, story_sizes = self.hobby_sizes, self.story_sizes
+        hobbies, story, age = hobby_masks[position], story_masks[position], ages[position]
+        hobby_size, story_size = hobby_sizes[position], story_sizes[position]
+        scored = []
+        for other in self.candidates(position, window):
+            if after and other < position:
+                continue
+            other_age = ages[other]
+            if age is None or other_age is None:
+                closeness = UNKNOWN_AGE
+            else:
+                gap = age - other_age if age > other_age else other_age - age
+                if gap > AGE_WINDOW:
+                    continue
+                closeness = 1 - gap / AGE_WINDOW
+            common = (hobbies & hobby_masks[other]).bit_count()
+            score = AGE_WEIGHT * closeness + HOBBY_WEIGHT * common / (hobby_size + hobby_sizes[other] - common)
+            words = (story & story_masks[other]).bit_count()
+            if words:
+                score += STORY_WEIGHT * words / (story_size + story_sizes[other] - words)
+            scored.append((score, other))
+        return scored
+
+    def top(self, name, k=TOP_K, window=WINDOW):
+        # [(skor, nama)] terbaik untuk pengguna ini, urut menurun
+        position = self.positions.get(name)
+        if position is None:
+            return []
+        names = self.names
+        return [(score, names[other]) for score, other in sorted(self.scored(position, window), reverse=True)[:k]]
+
+    def match(self, k=TOP_K, window=WINDOW):
+        # Pasangan seluruh wilayah: [(nama, nama, skor)]. Kandidat bersifat simetris, jadi setiap
+        # pasangan dinilai sekali: skornya dititipkan ke kandidat berposisi lebih besar dan TOP_K
+        # seseorang selesai saat posisinya diproses. Karena posisi urut usia, titipan yang menunggu
+        # hanya sebanyak pengguna seusia, bukan seluruh wilayah.
+        pending, tops = {}, {}
+        for position in sorted(self.positions.values()):
+            scored = self.scored(position, window, after=True)
+            for score, other in scored:
+                waiting = pending.get(other)
+                if waiting is None:
+                    pending[other] = [(score, position)]
+                else:
+                    waiting.append((score, position))
+            waiting = pending.pop(position, None)
+            if waiting:
+                scored += waiting
+            tops[position] = sorted(scored, reverse=True)[:k]
+
+        chosen = {position: {other for _, other in top} for position, top in tops.items()}
+        edges = [
+            (-score, position, other) for position, top in tops.items() for score, other in top
+            if position < other and position in chosen[other]
+        ]
+        edges.sort()
+        names, matched, pairs = self.names, set(), []
+        for negative, position, other in edges:
+            if position not in matched and other not in matched:
+                matched.add(position)
+                matched.add(other)
+                pairs.append((names[position], names[other], -negative))
+        return pairs
+
+
+def _bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _match_region(rows, k, window):
+    return RegionShard(rows).match(k, window)
+
+
+class Matchmaker:
+    def __init__(self, profiles=(), k=TOP_K, window=WINDOW):
+        self.k = k
+        self.window = window
+        self.regions = {}       # wilayah -> {nama: baris profil}
+        self.region_for = {}    # nama -> wilayah
+        self.shards = {}        # wilayah -> RegionShard, dibangun saat perbaikan inkremental pertama
+        self.matches = {}       # nama -> (pasangan, skor)
+        self.changed = None     # nama yang berubah selama run() berjalan
+        self.lock = threading.RLock()
+        for profile in profiles:
+            self._put(candidate_row(profile))
+
+    def __len__(self):
+        return len(self.region_for)
+
+    def match_for(self, name):
+        return self.matches.get(name)
+
+    def _put(self, row):
+        name, region = row[0], row[1]
+        old = self.region_for.get(name)
+        if old is not None and old != region:
+            self._drop(name)
+        self.regions.setdefault(region, {})[name] = row
+        self.region_for[name] = region
+        shard = self.shards.get(region)
+        if shard is not None:
+            shard.add(row)
+
+    def _drop(self, name):
+        region = self.region_for.pop(name, None)
+        if region is None:
+            return None
+        rows = self.regions[region]
+        del rows[name]
+        if not rows:
+            del self.regions[region]
+        shard = self.shards.get(region)
+        if shard is not None:
+            shard.remove(name)
+        return region
+
+    def _shard(self, region):
+        shard = self.shards.get(region)
+        if shard is None:
+            shard = self.shards[region] = RegionShard(self.regions.get(region, {}).values())
+        return shard
+
+    def update(self, profile):
+        # Profil baru atau berubah (hobi, usia, cerita, lokasi): pasangan lama dilepas dan diperbaiki
+        # di sekitarnya saja. Profil yang keluar dari mode cinta dihapus.
+        if profile.get("mode") != MODE:
+            return self.remove(profile.get("name") or profile.get("username"))
+        row = candidate_row(profile)
+        with self.lock:
+            old = self.region_for.get(row[0])
+            if old == row[1] and self.regions[old][row[0]] == row:
+                # Profil disimpan ulang tanpa perubahan: pasangan tetap sama
+                return
+            self._put(row)
+            self._changed(row[0])
+            seeds = self._unmatch(row[0])
+            if old is not None and old != row[1]:
+                # Mantan pasangan tetap di wilayah lama
+                self._repair(old, seeds - {row[0]})
+                seeds = {row[0]}
+            self._repair(row[1], seeds)
+        return True
+
+    def update_interests(self, name, hobbies):
+        with self.lock:
+            region = self.region_for.get(name)
+            if region is None:
+                return False
+            _, _, age, _, story = self.regions[region][name]
+            self._put((name, region, age, tuple(hobbies), story))
+            self._changed(name)
+            self._repair(region, self._unmatch(name))
+        return True
+
+    def remove(self, name):
+        with self.lock:
+            region = self._drop(name)
+            if region is None:
+                return False
+            self._changed(name)
+            self._repair(region, self._unmatch(name) - {name})
+        return True
+
+    def _changed(self, name):
+        if self.changed is not None:
+            self.changed.add(name)
+
+    def _unmatch(self, name):
+        current = self.matches.pop(name, None)
+        if current is None:
+            return {name}
+        self.matches.pop(current[0], None)
+        return {name, current[0]}
+
+    def _repair(self, region, seeds):
+        # Perbaikan lokal: pasangan yang saling memilih diproses dari skor tertinggi; pasangan diterima
+        # bila keduanya masih sendiri atau sama-sama mendapat skor lebih baik daripada pasangannya
+        # sekarang. Orang yang ditinggalkan ikut dicarikan pasangan, sampai REPAIR_LIMIT pengguna.
+        shard = self._shard(region)
+        matches, tops, queued, heap = self.matches, {}, set(), []
+
+        def top(name):
+            found = tops.get(name)
+            if found is None:
+                found = tops[name] = shard.top(name, self.k, self.window)
+            return found
+
+        def push(name):
+            if name in queued or len(queued) >= REPAIR_LIMIT:
+                return
+            queued.add(name)
+            for score, other in top(name):
+                if any(candidate == name for _, candidate in top(other)):
+                    heapq.heappush(heap, (-score, name, other))
+
+        for name in sorted(seeds):
+            push(name)
+        while heap:
+            negative, name, other = heapq.heappop(heap)
+            score = -negative
+            mine, theirs = matches.get(name), matches.get(other)
+            if mine is not None and (mine[0] == other or mine[1] >= score):
+                continue
+            if theirs is not None and theirs[1] >= score:
+                continue
+            for current in (mine, theirs):
+                if current is not None:
+                    matches.pop(current[0], None)
+                    push(current[0])
+            matches[name] = (other, score)
+            matches[other] = (name, score)
+
+    def run(self, workers=None):
+        # Job malam: hitung ulang semua wilayah. Wilayah terbesar dikirim lebih dulu agar pekerja
+        # tidak menunggu satu wilayah besar di akhir. Perubahan profil selama job berjalan
+        # diperbaiki ulang setelah hasilnya dipasang.
+        with self.lock:
+            regions = sorted((list(rows.values()) for rows in self.regions.values()), key=len, reverse=True)
+            self.changed = set()
+        workers = workers or os.cpu_count() or 1
+        total = sum(len(rows) for rows in regions)
+        matches = {}
+        if workers == 1 or total < PARALLEL_MIN:
+            results = (_match_region(rows, self.k, self.window) for rows in regions)
+            for pairs in results:
+                self._collect(matches, pairs)
+        else:
+            pool_class = concurrent.futures.ProcessPoolExecutor
+            with pool_class(max_workers=workers) as pool:
+                count = len(regions)
+                for pairs in pool.map(_match_region, regions, [self.k] * count, [self.window] * count):
+                    self._collect(matches, pairs)
+
+        with self.lock:
+            changed, self.changed = self.changed, None
+            self.matches = matches
+            self.shards = {}
+            for name in changed:
+                for partner in self._unmatch(name):
+                    region = self.region_for.get(partner)
+                    if region is not None:
+                        self._repair(region, {partner})
+        return len(matches) // 2
+
+    @staticmethod
+    def _collect(matches, pairs):
+        for name, other, score in pairs:
+            matches[name] = (other, score)
+            matches[other] = (name, score)
+
+
+_default_matchmaker = None
+
+
+def default_matchmaker():
+    global _default_matchmaker
+    if _default_matchmaker is None:
+        _default_matchmaker = Matchmaker(profile for profile in PROFILES if profile.get("mode") == MODE)
+        _default_matchmaker.run(workers=1)
+    return _default_matchmaker
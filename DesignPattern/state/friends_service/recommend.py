@@ -0,0 +1,157 @@
+import concurrent.futures
+import heapq
+import os
+
+DEFAULT_MODE = "pertemanan"
+
+
+def _key(hobby):
+    return hobby.strip().casefold()
+
+
+def jaccard(common, size, query_size):
+    union = size + query_size - common
+    return common / union if union else 0.0
+
+
+def cosine(common, size, query_size):
+    denominator = (size * query_size) ** 0.5
+    return common / denominator if denominator else 0.0
+
+
+METRICS = {"jaccard": jaccard, "cosine": cosine}
+
+
+class HobbyRecommender:
+    # Setiap hobi mendapat satu bit; profil disimpan sebagai bitset int sehingga
+    # irisan hobi semua kandidat dihitung dengan AND + bit_count dalam satu lintasan.
+    def __init__(self, profiles=(), metric="jaccard"):
+        self.metric = METRICS[metric]
+        self.vocabulary = {}
+        self.positions = {}   # nama -> posisi
+        self.names = []
+        self.masks = []
+        self.sizes = []
+        self.modes = []
+        self.profiles = []
+
+        for profile in profiles:
+            self.add(profile)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def encode(self, hobbies, grow=False):
+        mask = 0
+        vocabulary = self.vocabulary
+        for hobby in hobbies:
+            key = _key(hobby)
+            bit = vocabulary.get(key)
+            if bit is None:
+                if not grow:
+                    continue
+                bit = vocabulary[key] = len(vocabulary)
+            mask |= 1 << bit
+        return mask
+
+    @staticmethod
+    def query_size(hobbies):
+        # Hobi yang belum dimiliki kandidat mana pun tetap dihitung di gabungan
+        return len({_key(hobby) for hobby in hobbies})
+
+    def add(self, profile):
+        mask = self.encode(profile["interest"], grow=True)
+        position = self.positions.get(profile["name"])
+        if position is None:
+            position = len(self.names)
+            self.positions[profile["name"]] = position
+            self.names.append(profile["name"])
+            self.masks.append(mask)
+            self.sizes.append(mask.bit_count())
+            self.modes.append(profile.get("mode", DEFAULT_MODE))
+            self.profiles.append(profile)
+        else:
+            self.masks[position] = mask
+            self.sizes[position] = mask.bit_count()
+            self.modes[position] = profile.get("mode", DEFAULT_MODE)
+            self.profiles[position] = profile
+        return position
+
+    def update_interests(self, name, hobbies):
+        position = self.positions.get(name)
+        if position is None:
+            return False
+        mask = self.encode(hobbies, grow=True)
+        self.masks[position] = mask
+        self.sizes[position] = mask.bit_count()
+        return True
+
+    def remove(self, name):
+        position = self.positions.pop(name, None)
+        if position is None:
+            return False
+        # Slot dikosongkan, bukan dihapus, agar posisi kandidat lain tetap
+        self.masks[position] = 0
+        self.sizes[position] = 0
+        self.modes[position] = None
+        return True
+
+    def scores(self, hobbies):
+        query = self.encode(hobbies)
+        query_size = self.query_size(hobbies)
+        metric = self.metric
+        return [
+            metric((mask & query).bit_count(), size, query_size)
+            for mask, size in zip(self.masks, self.sizes)
+        ]
+
+    def recommend(self, hobbies, mode=None, k=10, exclude=()):
+        query = self.encode(hobbies)
+        if not query:
+            return []
+
+        query_size = self.query_size(hobbies)
+        metric = self.metric
+        modes = self.modes
+        exclude = {self.positions[name] for name in exclude if name in self.positions}
+
+        candidates = (
+            (metric(common, size, query_size), -position)
+            for position, (mask, size) in enumerate(zip(self.masks, self.sizes))
+            if (common := (mask & query).bit_count())
+            and (mode is None or modes[position] == mode)
+            and position not in exclude
+        )
+        return [(score, self.profiles[-negative]) for score, negative in heapq.nlargest(k, candidates)]
+
+
+_worker_recommender = None
+
+
+def _init_worker(recommender):
+    global _worker_recommender
+    _worker_recommender = recommender
+
+
+def _recommend_chunk(users, k):
+    recommender = _worker_recommender
+    return [
+        (name, [(score, profile["name"]) for score, profile in recommender.recommend(hobbies, mode, k, exclude=(name,))])
+        for name, hobbies, mode in users
+    ]
+
+
+def recommend_all(recommender, users, k=10, workers=None, chunk_size=1000):
+    # Job malam: hitung ulang rekomendasi semua pengguna di process pool.
+    # users berisi tuple (nama, hobi, mode); hasil: nama -> [(skor, nama kandidat)]
+    users = list(users)
+    chunks = [users[i:i + chunk_size] for i in range(0, len(users), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    results = {}
+    # Atribut ProcessPoolExecutor baru memuat multiprocessing saat diakses, bukan saat modul diimpor
+    pool_class = concurrent.futures.ProcessPoolExecutor
+    with pool_class(max_workers=workers, initializer=_init_worker, initargs=(recommender,)) as pool:
+        for chunk in pool.map(_recommend_chunk, chunks, [k] * len(chunks)):
+            results.update(chunk)
+    return results
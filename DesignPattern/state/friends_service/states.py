@@ -1,80 +1,126 @@
 from abc import ABC, abstractmethod
 
+from geo import distance_km
+from render import Message
+from friends_service.graph import FRIEND, LIKE, REQUEST
+from friends_service.views import SearchResultsView, RecommendationsView, FriendDetailView
+
 class FriendState(ABC):
-    def __init__(self, context):
-        self.context = context
+    __slots__ = ()
 
     @abstractmethod
-    def handle(self, friend_name=None, interest_filter=None, action=None):
+    def handle(self, context, friend_name=None, interest_filter=None, action=None, **options):
         pass
 
 
 class SearchFriendsState(FriendState):
-    def handle(self, friend_name=None, interest_filter=None, action=None):
-        print("[Teman] Menampilkan orang yang mungkin Anda kenal:")
-        filtered = self.context.potential_friends
-        if interest_filter:
-            filtered = [p for p in filtered if interest_filter in p["interest"]]
-            print(f"[Filter] Menampilkan pengguna dengan minat: {interest_filter}")
-
-        if not filtered:
-            print("Tidak ada pengguna yang ditemukan dengan minat tersebut.")
-        else:
-            for person in filtered:
-                print(f"- {person['name']} | Minat: {', '.join(person['interest'])}")
-
-       
-        self.context.set_state(self.context.friend_detail_state)
+    def handle(self, context, friend_name=None, interest_filter=None, action=None, **options):
+        interests = [interest_filter] if isinstance(interest_filter, str) else list(interest_filter or [])
+        match = options.get("match", "all")
+        min_age = options.get("min_age")
+        max_age = options.get("max_age")
+        page = max(1, options.get("page", 1))
+        page_size = options.get("page_size", 20)
+
+        total, filtered = context.friend_index.search(
+            all_of=interests if match == "all" else (),
+            any_of=interests if match == "any" else (),
+            min_age=min_age,
+            max_age=max_age,
+            offset=(page - 1) * page_size,
+            limit=page_size,
+        )
+
+        context.set_state(context.friend_detail_state)
+        return SearchResultsView(
+            interests=interests, match=match, min_age=min_age, max_age=max_age,
+            people=filtered, total=total, page=page, page_size=page_size,
+        )
+
+
+class RecommendFriendsState(FriendState):
+    def handle(self, context, friend_name=None, interest_filter=None, action=None, **options):
+        if not context.hobbies:
+            return RecommendationsView(status="no_hobbies", recommendations=[])
+
+        username = context.username
+        exclude = {username, *context.friends, *context.added_friends}
+        recommendations = context.recommender.recommend(
+            context.hobbies,
+            mode=context.mode,
+            k=options.get("limit", 10),
+            exclude=exclude,
+        )
+
+        view = RecommendationsView(
+            status="ok",
+            recommendations=[
+                {"name": person['name'], "interest": person['interest'], "score": score}
+                for score, person in recommendations
+            ],
+        )
+        if context.mode == "cinta":
+            # Pasangan dari perjodohan (saling memilih), bukan sekadar kemiripan hobi
+            match = context.matchmaker.match_for(username)
+            view.data["match"] = {"name": match[0], "score": match[1]} if match else None
+        context.set_state(context.friend_detail_state)
+        return view
 
 
 class FriendDetailState(FriendState):
-    def handle(self, friend_name=None, interest_filter=None, action=None):
+    def handle(self, context, friend_name=None, interest_filter=None, action=None, **options):
         if not friend_name:
-            print("[Teman] Silakan masukkan nama untuk melihat detail.")
-            return
+            return Message("friends.no_name", "[Teman] Silakan masukkan nama untuk melihat detail.")
 
-        match = next((p for p in self.context.potential_friends if p["name"] == friend_name), None)
+        match = context.friend_index.get(friend_name)
         if not match:
-            print(f"[Teman] Tidak ditemukan detail untuk {friend_name}.")
-            return
-
-        print(f"\n=== Detail untuk {match['name']} ===")
-        print(f"Foto: {match['photo']}")
-        print(f"Nama: {match['name']}")
-        print(f"Usia: {match['age']}")
-        print(f"Minat: {', '.join(match['interest'])}")
-        print(f"Deskripsi: {match['description']}")
-
-        if match['name'] in self.context.added_friends:
-            print("Status: Sudah menjadi teman Anda ✅")
+            return Message("friends.not_found", f"[Teman] Tidak ditemukan detail untuk {friend_name}.")
+
+        graph = context.graph
+        username = context.username
+        distance = None
+        if context.location and 'lat' in match:
+            distance = distance_km(*context.location, match['lat'], match['lon'])
+
+        if graph.has(FRIEND, username, match['name']) or graph.has(REQUEST, username, match['name']):
+            status = "friend"
+        elif action == "add":
+            graph.add(REQUEST, username, match['name'])
+            context.events.emit(context, "friends.request_sent", friend=match['name'])
+            context.dashboards.friend_added(username, match['name'])
+            context.notification_hub.push(
+                match['name'], "friend", f"🤝 {username} mengirim permintaan pertemanan kepadamu."
+            )
+            status = "request_sent"
         else:
-            if action == "add":
-                self.context.added_friends.append(match['name'])
-                print(f"✅ Permintaan pertemanan dikirim ke {match['name']}!")
-            else:
-                print("Aksi: [Tambah Teman]")
+            status = None
 
+        liked = None
         if action == "like":
-            if match['name'] not in self.context.liked_friends:
-                self.context.liked_friends.append(match['name'])
-                print(f"❤️ Anda menyukai {match['name']}!")
-            else:
-                print(f"❤️ Anda sudah menyukai {match['name']} sebelumnya.")
-
-        if action == "chat":
-            print(f"[Obrolan] Anda memulai percakapan dengan {match['name']}...")
-            print(f"[Obrolan] Anda: Hai {match['name']}! Senang bisa terhubung.")
-
-        print("Aksi tersedia: [Tambah Teman], [Like], [Chat]")
-        
-
-        self.context.set_state(self.context.search_friends_state)
+            liked = graph.add(LIKE, username, match['name'])
+            if liked:
+                context.events.emit(context, "friends.liked", friend=match['name'])
+                context.notification_hub.push(match['name'], "friend", f"❤️ {username} menyukai profilmu.")
+
+        context.set_state(context.search_friends_state)
+        return FriendDetailView(
+            profile=match,
+            mutual_friends=graph.mutual_friend_count(username, match['name']),
+            distance_km=distance,
+            status=status,
+            liked=liked,
+            chat=action == "chat",
+        )
 
 
 class ChatState(FriendState):
-    def handle(self, friend_name=None, interest_filter=None, action=None):
-        if not self.context.friends:
-            print("[Teman] Tidak ada teman untuk diajak mengobrol.")
-            return
-        print(f"[Teman] Pengguna '{self.context.username}' sedang mengobrol dengan '{self.context.friends[0]}'...")
-        print(f"[Teman] Pesan terkirim: Hai {self.context.friends[0]}!")
+    def handle(self, context, friend_name=None, interest_filter=None, action=None, **options):
+        if not context.friends:
+            return Message("friends.no_friends", "[Teman] Tidak ada teman untuk diajak mengobrol.")
+        friend = context.friends[0]
+        return Message(
+            "friends.chat",
+            f"[Teman] Pengguna '{context.username}' sedang mengobrol dengan '{friend}'...\n"
+            f"[Teman] Pesan terkirim: Hai {friend}!",
+            friend=friend,
+        )
@@ -0,0 +1,86 @@
+from render import View
+
+
+class SearchResultsView(View):
+    kind = "friends.search"
+
+    def lines(self):
+        lines = ["[Teman] Menampilkan orang yang mungkin Anda kenal:"]
+        if self['interests']:
+            separator = " dan " if self['match'] == "all" else " atau "
+            lines.append(f"[Filter] Menampilkan pengguna dengan minat: {separator.join(self['interests'])}")
+        min_age, max_age = self['min_age'], self['max_age']
+        if min_age is not None or max_age is not None:
+            lines.append(f"[Filter] Usia: {min_age if min_age is not None else '-'} s/d {max_age if max_age is not None else '-'}")
+
+        if not self['people']:
+            lines.append("Tidak ada pengguna yang ditemukan dengan minat tersebut.")
+        else:
+            lines += [f"- {person['name']} | Minat: {', '.join(person['interest'])}" for person in self['people']]
+            total, page_size = self['total'], self['page_size']
+            if total > page_size:
+                pages = (total + page_size - 1) // page_size
+                lines.append(f"[Halaman] {self['page']} dari {pages} ({total} pengguna)")
+        return lines
+
+
+class RecommendationsView(View):
+    kind = "friends.recommendations"
+
+    def lines(self):
+        lines = ["[Teman] Orang yang mungkin Anda kenal berdasarkan hobi Anda:"]
+        if self['status'] == "no_hobbies":
+            lines.append("Lengkapi hobi di profil Anda untuk mendapatkan rekomendasi.")
+        elif not self['recommendations']:
+            lines.append("Belum ada rekomendasi yang cocok dengan hobi Anda.")
+        else:
+            lines += [
+                f"- {item['name']} | Minat: {', '.join(item['interest'])} | Kecocokan: {item['score']:.0%}"
+                for item in self['recommendations']
+            ]
+        if "match" in self.data:
+            match = self['match']
+            if match:
+                lines.append(f"💞 Pasangan yang cocok untukmu: {match['name']} (kecocokan {match['score']:.0%})")
+            else:
+                lines.append("💞 Belum ada pasangan yang saling cocok untukmu saat ini.")
+        return lines
+
+
+class FriendDetailView(View):
+    kind = "friends.detail"
+
+    def lines(self):
+        profile = self['profile']
+        lines = [
+            f"\n=== Detail untuk {profile['name']} ===",
+            f"Foto: {profile['photo']}",
+            f"Nama: {profile['name']}",
+            f"Usia: {profile['age']}",
+            f"Minat: {', '.join(profile['interest'])}",
+            f"Deskripsi: {profile['description']}",
+        ]
+        if self['mutual_friends']:
+            lines.append(f"Teman bersama: {self['mutual_friends']}")
+        if self['distance_km'] is not None:
+            lines.append(f"Jarak: {self['distance_km']:.1f} km")
+
+        status = self['status']
+        if status == "friend":
+            lines.append("Status: Sudah menjadi teman Anda ✅")
+        elif status == "request_sent":
+            lines.append(f"✅ Permintaan pertemanan dikirim ke {profile['name']}!")
+        else:
+            lines.append("Aksi: [Tambah Teman]")
+
+        if self['liked'] is True:
+            lines.append(f"❤️ Anda menyukai {profile['name']}!")
+        elif self['liked'] is False:
+            lines.append(f"❤️ Anda sudah menyukai {profile['name']} sebelumnya.")
+
+        if self['chat']:
+            lines.append(f"[Obrolan] Anda memulai percakapan dengan {profile['name']}...")
+            lines.append(f"[Obrolan] Anda: Hai {profile['name']}! Senang bisa terhubung.")
+
+        lines.append("Aksi tersedia: [Tambah Teman], [Like], [Chat]")
+        return lines
@@ -0,0 +1,162 @@
+import math
+from array import array
+
+# Indeks spasial bersama untuk komunitas, kegiatan, dan profil pengguna
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 110.574
+
+# Lokasi bawaan (Monas, Jakarta Pusat) bila pengguna belum mengisi lokasi
+DEFAULT_LOCATION = (-6.1754, 106.8272)
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    # Haversine
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GeoGrid:
+    # Grid seragam lintang/bujur (mirip geohash dengan presisi tetap). Setiap sel menyimpan slot
+    # titik di dalamnya; query radius hanya membuka sel di kotak pembatas, dan k-terdekat membuka
+    # sel cincin demi cincin dari sel pusat sampai jarak ke cincin berikutnya melebihi hasil ke-k.
+    def __init__(self, cell_degrees=0.01):
+        self.cell = cell_degrees
+        self.lats = array("d")
+        self.lons = array("d")
+        self.keys = []
+        self.slots = {}        # key -> slot
+        self.cells = {}        # (baris, kolom) -> list slot
+        self.free = []
+        self.bounds = None     # (baris min, baris maks, kolom min, kolom maks) sel terisi
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def _cell(self, lat, lon):
+        return math.floor(lat / self.cell), math.floor(lon / self.cell)
+
+    def _grow(self, row, col):
+        if self.bounds is None:
+            self.bounds = (row, row, col, col)
+        else:
+            low_row, high_row, low_col, high_col = self.bounds
+            self.bounds = (min(low_row, row), max(high_row, row), min(low_col, col), max(high_col, col))
+
+    def add(self, key, lat, lon):
+        if key in self.slots:
+            self.remove(key)
+        if self.free:
+            slot = self.free.pop()
+            self.lats[slot], self.lons[slot], self.keys[slot] = lat, lon, key
+        else:
+            slot = len(self.keys)
+            self.lats.append(lat)
+            self.lons.append(lon)
+            self.keys.append(key)
+        self.slots[key] = slot
+        cell = self._cell(lat, lon)
+        self.cells.setdefault(cell, []).append(slot)
+        self._grow(*cell)
+
+    def bulk_load(self, points):
+        for key, lat, lon in points:
+            self.add(key, lat, lon)
+
+    def remove(self, key):
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return False
+        cell = self._cell(self.lats[slot], self.lons[slot])
+        members = self.cells[cell]
+        members.remove(slot)
+        if not members:
+            del self.cells[cell]
+        self.keys[slot] = None
+        self.free.append(slot)
+        return True
+
+    def move(self, key, lat, lon):
+        self.add(key, lat, lon)
+
+    def location(self, key):
+        slot = self.slots[key]
+        return self.lats[slot], self.lons[slot]
+
+    def _lon_km(self, lat):
+        # Lebar satu derajat bujur menyusut ke arah kutub
+        return max(1e-6, 111.320 * math.cos(math.radians(min(89.9, abs(lat)))))
+
+    def within(self, lat, lon, radius_km):
+        # Semua titik dalam radius, urut dari yang terdekat: [(jarak_km, key)]
+        if not self.slots:
+            return []
+        dlat = radius_km / KM_PER_DEGREE
+        dlon = radius_km / self._lon_km(abs(lat) + dlat)
+        low_row, high_row = self._cell(lat - dlat, lon)[0], self._cell(lat + dlat, lon)[0]
+        low_col, high_col = self._cell(lat, lon - dlon)[1], self._cell(lat, lon + dlon)[1]
+
+        lats, lons, keys, cells = self.lats, self.lons, self.keys, self.cells
+        found = []
+        for row in range(low_row, high_row + 1):
+            for col in range(low_col, high_col + 1):
+                for slot in cells.get((row, col), ()):
+                    distance = distance_km(lat, lon, lats[slot], lons[slot])
+                    if distance <= radius_km:
+                        found.append((distance, keys[slot]))
+        found.sort(key=lambda item: item[0])
+        return found
+
+    def nearest(self, lat, lon, k=5, max_km=None):
+        # k titik terdekat: [(jarak_km, key)]
+        if not self.slots or k <= 0:
+            return []
+        row, col = self._cell(lat, lon)
+        low_row, high_row, low_col, high_col = self.bounds
+        max_ring = max(row - low_row, high_row - row, col - low_col, high_col - col, 0)
+
+        lats, lons, keys, cells = self.lats, self.lons, self.keys, self.cells
+        best = []
+        for ring in range(max_ring + 1):
+            if 8 * ring > len(cells):
+                # Grid jarang dan lebar: cincin ini punya lebih banyak sel daripada seluruh sel terisi,
+                # jadi pindai sel terisi yang belum dikunjungi secara langsung lalu berhenti
+                for (cell_row, cell_col), members in cells.items():
+                    if max(abs(cell_row - row), abs(cell_col - col)) >= ring:
+                        for slot in members:
+                            best.append((distance_km(lat, lon, lats[slot], lons[slot]), keys[slot]))
+                break
+            for cell in self._ring(row, col, ring):
+                for slot in cells.get(cell, ()):
+                    best.append((distance_km(lat, lon, lats[slot], lons[slot]), keys[slot]))
+            if len(best) >= k:
+                best.sort(key=lambda item: item[0])
+                del best[k:]
+            # Titik yang belum dilihat ada di cincin ring+1 ke atas, minimal sejauh `ring` sel penuh
+            edge = abs(lat) + (ring + 1) * self.cell
+            reach = ring * self.cell * min(KM_PER_DEGREE, self._lon_km(edge))
+            if len(best) == k and best[-1][0] <= reach:
+                break
+            if max_km is not None and reach > max_km:
+                break
+        best.sort(key=lambda item: item[0])
+        if max_km is not None:
+            best = [item for item in best if item[0] <= max_km]
+        return best[:k]
+
+    @staticmethod
+    def _ring(row, col, ring):
+        if ring == 0:
+            yield row, col
+            return
+        for c in range(col - ring, col + ring + 1):
+            yield row - ring, c
+            yield row + ring, c
+        for r in range(row - ring + 1, row + ring):
+            yield r, col - ring
+            yield r, col + ring
@@ -1,26 +1,24 @@
-from auth_service.context import AuthContext
-from friends_service.context import FriendContext
-from community_service.context import CommunityContext
-from activities_service.context import ActivityContext
-from dashboard_service.context import DashboardContext
-from notifications_service.context import NotificationContext
-from settings_service.context import SettingsContext
-from chat_service.context import ChatContext
+from services import default_registry
 
 
-def main():
+def main(input_provider=None):
+    # input_provider: sumber jawaban untuk semua prompt (default: konsol), mis. ScriptedInput.
+    # Layanan dimuat lewat registry saat pertama dipakai, bukan saat main.py diimpor.
+    services = default_registry()
     print("===========================================")
     print(" Silver Connect - Your Companion Through")
     print("               The Golden Years")
     print("===========================================\n")
 
     print("=== Daftar Akun ===")
-    new_user = AuthContext(
+    new_user = services.create(
+        "auth",
         username="elder1",
         password="pass123",
         confirm_password="pass123",
         email="elder1@example.com",
-        full_name="Elder One"
+        full_name="Elder One",
+        input_provider=input_provider
     )
     new_user.set_state(new_user.signup_state)
     new_user.request()
@@ -33,18 +31,22 @@ def main():
     new_user.request()
 
     print("\n=== Lupa Password ===")
-    forgot_user = AuthContext(
+    forgot_user = services.create(
+        "auth",
         username="elder1",
-        email="elder1@example.com"
+        email="elder1@example.com",
+        input_provider=input_provider
     )
     forgot_user.set_state(forgot_user.forgot_password_state)
     forgot_user.request()
 
     print("\n=== Authorisasi ===")
-    auth = AuthContext(
+    auth = services.create(
+        "auth",
         username="elder1",
-        password="pass123",
-        email="elder1@example.com"
+        password=forgot_user.password,
+        email="elder1@example.com",
+        input_provider=input_provider
     )
     auth.set_state(auth.login_state)
     auth.request()
@@ -52,7 +54,7 @@ def main():
     auth.request()
 
     print("\n=== Dashboard Pengguna ===")
-    dashboard = DashboardContext(username=auth.username)
+    dashboard = services.create("dashboard", username=auth.username, input_provider=input_provider)
     dashboard.request()
     dashboard.set_state(dashboard.profile_state)
     dashboard.request()
@@ -60,13 +62,13 @@ def main():
     dashboard.request()
 
     print("\n=== Pengaturan ===")
-    settings = SettingsContext(username=auth.username)
+    settings = services.create("settings", username=auth.username, input_provider=input_provider)
     settings.request()
     settings.set_state(settings.theme_state)
     settings.request()
 
     print("\n=== Teman ===")
-    friends = FriendContext(username=auth.username)
+    friends = services.create("friends", username=auth.username, hobbies=new_user.hobbies, mode=new_user.mode)
     friends.request(interest_filter="Yoga")
     friends.request(friend_name="Diana")
     friends.request(friend_name="Diana", action="add")
@@ -76,27 +78,34 @@ def main():
     friends.request(interest_filter="Gaming")
     friends.request(friend_name="Charlie", action="like")
 
+    friends.set_state(friends.recommend_friends_state)
+    friends.request()
+
 
     print("\n=== Chat ===")
-    chat = ChatContext(username=auth.username)
+    chat = services.create("chat", username=auth.username)
     chat.request(friend_name="Diana")
     chat.request(message="Hai Diana, bagaimana kabarmu hari ini?")
 
     print("\n=== Komunitas ===")
-    community = CommunityContext(username=auth.username)
+    community = services.create("community", username=auth.username, input_provider=input_provider)
     community.set_state(community.browse_community_state)
     community.request()
     community.request()
 
     print("\n=== Aktivitas ===")
-    activities = ActivityContext(username=auth.username)
+    activities = services.create("activities", username=auth.username, input_provider=input_provider)
     activities.set_state(activities.find_activity_state)
     activities.request()
     activities.request()
 
     print("\n=== Notifikasi ===")
-    notifications = NotificationContext(username=auth.username)
+    notifications = services.create("notifications", username=auth.username)
     notifications.request()
 
+    print("\n=== Dashboard Setelah Beraktivitas ===")
+    dashboard.set_state(dashboard.dashboard_state)
+    dashboard.request()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,241 @@
+import bisect
+import functools
+import os
+import threading
+import time
+
+# Instrumentasi request() setiap context: jumlah panggilan, histogram latensi, error, dan
+# perpindahan state (dari -> ke) per layanan, diekspor sebagai teks Prometheus. request() hanya
+# dibungkus selama metrik menyala; saat dimatikan kelas context memakai request() aslinya lagi,
+# jadi tidak ada biaya sama sekali. Nyalakan dengan SILVERCONNECT_METRICS=1 atau
+# default_metrics().enable().
+
+METRICS_ENV = "SILVERCONNECT_METRICS"
+PREFIX = "silverconnect_state"
+# Batas atas bucket latensi dalam detik (+Inf ditambahkan saat ekspor)
+BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+           0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class StateStats:
+    __slots__ = ("counts", "total")
+
+    def __init__(self, size):
+        self.counts = [0] * size        # per bucket (tidak kumulatif); indeks terakhir = +Inf
+        self.total = 0.0
+
+
+class Shard:
+    # Hitungan milik satu thread: ditulis tanpa lock, digabung saat ekspor
+    __slots__ = ("stats", "errors", "edges")
+
+    def __init__(self):
+        self.stats = {}         # (layanan, objek state) -> StateStats
+        self.errors = {}        # (layanan, objek state, jenis error) -> jumlah
+        self.edges = {}         # (layanan, objek state asal, objek state tujuan) -> jumlah
+
+
+def state_label(state):
+    return type(state).__name__ if state is not None else "None"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class Metrics:
+    def __init__(self, enabled=False, buckets=BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.shards = []
+        self.expected = ()      # exception alur normal (mis. menunggu jawaban prompt), bukan error
+        self.classes = {}       # kelas context -> request() asli
+        self.dumper = None
+        self.dumping = threading.Event()
+
+    def enable(self):
+        self.enabled = True
+        for cls, request in self.classes.items():
+            cls.request = self._timed(request)
+
+    def disable(self):
+        self.enabled = False
+        for cls, request in self.classes.items():
+            cls.request = request
+
+    def instrument(self, cls):
+        self.classes[cls] = cls.request
+        if self.enabled:
+            cls.request = self._timed(cls.request)
+        return cls
+
+    def _timed(self, request):
+        # Mengukur state yang sedang aktif saat request dimulai; jalur normal menulis langsung ke
+        # shard thread ini (sama dengan observe(), tanpa panggilan tambahan)
+        observe, shard_of, buckets, clock = self.observe, self._shard, self.buckets, time.perf_counter
+        locate = bisect.bisect_left
+
+        @functools.wraps(request)
+        def timed_request(context, *args, **options):
+            source = context.state
+            started = clock()
+            try:
+                view = request(context, *args, **options)
+            except BaseException as error:
+                kind = None if isinstance(error, self.expected) else type(error).__name__
+                observe(context.SERVICE, source, clock() - started, context.state, kind)
+                raise
+            seconds = clock() - started
+            shard = shard_of()
+            key = (context.SERVICE, source)
+            stats = shard.stats.get(key)
+            if stats is None:
+                stats = shard.stats[key] = StateStats(len(buckets) + 1)
+            stats.counts[locate(buckets, seconds)] += 1
+            stats.total += seconds
+            target = context.state
+            if target is not source:
+                key = (context.SERVICE, source, target)
+                shard.edges[key] = shard.edges.get(key, 0) + 1
+            return view
+        return timed_request
+
+    def expect(self, *exception_types):
+        self.expected += exception_types
+
+    def reset(self):
+        with self.lock:
+            for shard in self.shards:
+                shard.stats, shard.errors, shard.edges = {}, {}, {}
+
+    def _shard(self):
+        shard = getattr(self.local, "shard", None)
+        if shard is None:
+            # Pertama kali thread ini mencatat
+            shard = self.local.shard = Shard()
+            with self.lock:
+                self.shards.append(shard)
+        return shard
+
+    def observe(self, service, source, seconds, target=None, error=None):
+        # source/target: objek state sebelum dan sesudah request; label dibuat saat ekspor
+        shard = self._shard()
+        key = (service, source)
+        stats = shard.stats.get(key)
+        if stats is None:
+            stats = shard.stats[key] = StateStats(len(self.buckets) + 1)
+        stats.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        stats.total += seconds
+        if error is not None:
+            key = (service, source, error)
+            shard.errors[key] = shard.errors.get(key, 0) + 1
+        if target is not source:
+            key = (service, source, target)
+            shard.edges[key] = shard.edges.get(key, 0) + 1
+
+    def snapshot(self):
+        # Gabungan semua shard menurut label: (stats, errors, edges)
+        stats, errors, edges = {}, {}, {}
+        with self.lock:
+            shards = list(self.shards)
+        for shard in shards:
+            # dict.copy() atomik terhadap thread lain (GIL), iterasi langsung tidak
+            for (service, source), item in shard.stats.copy().items():
+                key = (service, state_label(source))
+                merged = stats.get(key)
+                if merged is None:
+                    merged = stats[key] = StateStats(len(self.buckets) + 1)
+                merged.counts = [a + b for a, b in zip(merged.counts, list(item.counts))]
+                merged.total += item.total
+            for (service, source, error), count in shard.errors.copy().items():
+                key = (service, state_label(source), error)
+                errors[key] = errors.get(key, 0) + count
+            for (service, source, target), count in shard.edges.copy().items():
+                key = (service, state_label(source), state_label(target))
+                edges[key] = edges.get(key, 0) + count
+        return stats, errors, edges
+
+    def render(self):
+        merged, errors, edges = self.snapshot()
+        stats = [(key, item.counts, item.total, sum(item.counts)) for key, item in sorted(merged.items())]
+        errors = sorted(errors.items())
+        edges = sorted(edges.items())
+
+        lines = [
+            f"# HELP {PREFIX}_requests_total Jumlah panggilan request() per state.",
+            f"# TYPE {PREFIX}_requests_total counter",
+        ]
+        lines += [f"{PREFIX}_requests_total{_labels(service=service, state=state)} {calls}"
+                  for (service, state), _, _, calls in stats]
+
+        lines += [
+            f"# HELP {PREFIX}_latency_seconds Latensi request() per state.",
+            f"# TYPE {PREFIX}_latency_seconds histogram",
+        ]
+        bounds = [repr(bound) for bound in self.buckets] + ["+Inf"]
+        for (service, state), counts, total, calls in stats:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(f"{PREFIX}_latency_seconds_bucket{_labels(service=service, state=state, le=bound)} {cumulative}")
+            lines.append(f"{PREFIX}_latency_seconds_sum{_labels(service=service, state=state)} {total!r}")
+            lines.append(f"{PREFIX}_latency_seconds_count{_labels(service=service, state=state)} {calls}")
+
+        lines += [
+            f"# HELP {PREFIX}_errors_total Exception yang keluar dari request() per state.",
+            f"# TYPE {PREFIX}_errors_total counter",
+        ]
+        lines += [f"{PREFIX}_errors_total{_labels(service=service, state=state, error=error)} {count}"
+                  for (service, state, error), count in errors]
+
+        lines += [
+            f"# HELP {PREFIX}_transitions_total Perpindahan state yang terjadi di dalam request().",
+            f"# TYPE {PREFIX}_transitions_total counter",
+        ]
+        lines += [f'{PREFIX}_transitions_total{_labels(service=service, **{"from": source, "to": target})} {count}'
+                  for (service, source, target), count in edges]
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        # Tulis atomik (cocok untuk textfile collector node_exporter)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(self.render())
+        os.replace(temporary, path)
+
+    def start_dump(self, path, interval=15):
+        if self.dumper is not None:
+            return
+        self.dumping.clear()
+
+        def loop():
+            while not self.dumping.wait(interval):
+                self.dump(path)
+            self.dump(path)
+
+        self.dumper = threading.Thread(target=loop, name="metrics-dump", daemon=True)
+        self.dumper.start()
+
+    def stop_dump(self):
+        if self.dumper is not None:
+            self.dumping.set()
+            self.dumper.join()
+            self.dumper = None
+
+
+_default_metrics = Metrics(enabled=os.environ.get(METRICS_ENV) == "1")
+
+
+def default_metrics():
+    return _default_metrics
+
+
+def instrumented(cls):
+    # Dekorator kelas context
+    return _default_metrics.instrument(cls)
@@ -0,0 +1,26 @@
+import random
+
+WELLNESS_TIPS = [
+    "🧘 Tips Hari Ini: Peregangan ringan setiap pagi membantu meningkatkan keseimbangan.",
+    "🍵 Tips Kesehatan: Tetap terhidrasi dan minum teh herbal untuk menenangkan tubuh.",
+    "🌞 Jangan lupa berjemur 10 menit di bawah sinar matahari untuk Vitamin D!"
+]
+
+EVENT_ANNOUNCEMENTS = [
+    "🎉 Perayaan Ulang Tahun Bulanan Jumat ini jam 16:00 – bergabunglah di Aula!",
+    "🎤 Malam Unjuk Bakat: Tunjukkan hobi atau keahlianmu Sabtu jam 18:00!",
+    "🎶 Musik langsung di halaman besok pagi – ajak teman juga ya!"
+]
+
+INSPIRATION_QUOTES = [
+    "🕊️ 'Kamu tidak pernah terlalu tua untuk menetapkan tujuan baru atau bermimpi lagi.' – C.S. Lewis",
+    "🌟 'Usia hanyalah angka yang menunjukkan berapa lama dunia telah menikmati kehadiranmu!'",
+    "❤️ 'Senyuman adalah riasan terbaik yang bisa dipakai siapa pun – terutama kamu.'"
+]
+
+
+def publish_daily(hub, rng=random):
+    # Pengumuman harian untuk semua pengguna: satu dari tiap kategori
+    hub.broadcast("wellness", rng.choice(WELLNESS_TIPS))
+    hub.broadcast("event", rng.choice(EVENT_ANNOUNCEMENTS))
+    hub.broadcast("inspiration", rng.choice(INSPIRATION_QUOTES))
@@ -1,16 +1,37 @@
-from notifications_service.states import CheckNotificationState
+from render import default_renderer
+from events import default_event_log
+from metrics import instrumented
+from notifications_service.inbox import default_hub
+from activities_service.reminders import default_reminders
+from services import LazyState
 
+@instrumented
 class NotificationContext:
-    def __init__(self, username=""):
+    check_notification_state = LazyState("notifications_service.states:CheckNotificationState")
+
+    __slots__ = ("username", "notifications", "notification_hub", "renderer", "reminders", "events", "state")
+    SNAPSHOT_FIELDS = ()
+    SERVICE = "notifications"
+
+    def __init__(self, username="", notification_hub=None, renderer=None, events=None, reminders=None):
         self.username = username
         self.notifications = []
-
-        self.check_notification_state = CheckNotificationState(self)
+        self.notification_hub = notification_hub if notification_hub is not None else default_hub()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        self.reminders = reminders if reminders is not None else default_reminders()
 
         self.state = self.check_notification_state
 
     def set_state(self, state):
+        self.events.transition(self, state)
         self.state = state
 
-    def request(self):
-        self.state.handle()
+    def show(self, view):
+        self.renderer.render(view)
+
+    def request(self, categories=None):
+        view = self.state.handle(self, categories=categories)
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
@@ -0,0 +1,182 @@
+import threading
+import time
+
+from notifications_service.announcements import publish_daily
+
+CATEGORIES = ("chat", "activity", "community", "friend", "wellness", "event", "inspiration")
+
+
+class Notification:
+    __slots__ = ("category", "text", "created_at")
+
+    def __init__(self, category, text, created_at):
+        self.category = category
+        self.text = text
+        self.created_at = created_at
+
+
+class RingBuffer:
+    # Menyimpan `capacity` item terakhir; list tumbuh sampai kapasitas lalu ditimpa melingkar.
+    # Nomor urut item diturunkan dari posisinya, jadi satu Notification bisa dibagi ke banyak ring.
+    __slots__ = ("capacity", "items", "next_seq")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.items = []
+        self.next_seq = 0
+
+    def append(self, item):
+        overwritten = None
+        if len(self.items) < self.capacity:
+            self.items.append(item)
+        else:
+            slot = self.next_seq % self.capacity
+            overwritten = self.items[slot]
+            self.items[slot] = item
+        self.next_seq += 1
+        return overwritten
+
+    def oldest_seq(self):
+        return max(0, self.next_seq - self.capacity)
+
+    def since(self, seq):
+        capacity, items = self.capacity, self.items
+        return [(i, items[i % capacity]) for i in range(max(seq, self.oldest_seq()), self.next_seq)]
+
+
+class ReadState:
+    # Posisi baca: satu kursor dasar, plus kursor per kategori setelah pembacaan terfilter
+    __slots__ = ("base", "categories")
+
+    def __init__(self, base=0):
+        self.base = base
+        self.categories = None
+
+    def position(self, category):
+        if self.categories:
+            return self.categories.get(category, self.base)
+        return self.base
+
+    def lowest(self):
+        return self.base
+
+    def mark(self, next_seq, categories=None):
+        if categories is None:
+            self.base = next_seq
+            self.categories = None
+        else:
+            if self.categories is None:
+                self.categories = {}
+            for category in categories:
+                self.categories[category] = next_seq
+
+
+class Inbox:
+    __slots__ = ("ring", "personal", "announcements", "unread")
+
+    def __init__(self, capacity, broadcast_seq):
+        self.ring = RingBuffer(capacity)
+        self.personal = ReadState()
+        self.announcements = ReadState(broadcast_seq)
+        self.unread = {}    # kategori -> jumlah notifikasi pribadi belum dibaca
+
+
+class NotificationHub:
+    # Inbox per pengguna dibuat saat pertama dipakai. Pengumuman ke semua pengguna ditulis
+    # sekali ke ring bersama dan digabungkan saat inbox dibaca, jadi biaya fan-out O(1).
+    def __init__(self, inbox_capacity=100, broadcast_capacity=1000):
+        self.inbox_capacity = inbox_capacity
+        self.broadcasts = RingBuffer(broadcast_capacity)
+        self.inboxes = {}
+        self.lock = threading.Lock()
+
+    def _inbox(self, user):
+        inbox = self.inboxes.get(user)
+        if inbox is None:
+            # Pengguna baru tetap melihat pengumuman yang masih ada di ring
+            inbox = self.inboxes[user] = Inbox(self.inbox_capacity, self.broadcasts.oldest_seq())
+        return inbox
+
+    @staticmethod
+    def _push(inbox, item):
+        ring = inbox.ring
+        overwritten = ring.append(item)
+        inbox.unread[item.category] = inbox.unread.get(item.category, 0) + 1
+        if overwritten is not None:
+            # Notifikasi belum dibaca yang tertimpa ikut hilang dari hitungan
+            seq = ring.next_seq - 1 - ring.capacity
+            if seq >= inbox.personal.position(overwritten.category):
+                inbox.unread[overwritten.category] -= 1
+
+    def push(self, user, category, text):
+        item = Notification(category, text, time.time())
+        with self.lock:
+            self._push(self._inbox(user), item)
+
+    def push_many(self, users, category, text):
+        # Fan-out tertarget (mis. anggota komunitas): satu objek Notification dibagi ke semua inbox
+        item = Notification(category, text, time.time())
+        with self.lock:
+            for user in users:
+                self._push(self._inbox(user), item)
+
+    def broadcast(self, category, text):
+        with self.lock:
+            self.broadcasts.append(Notification(category, text, time.time()))
+
+    def unread_count(self, user, categories=None):
+        with self.lock:
+            inbox = self._inbox(user)
+            personal = sum(
+                count for category, count in inbox.unread.items() if categories is None or category in categories
+            )
+            read_state = inbox.announcements
+            announcements = sum(
+                1 for seq, item in self.broadcasts.since(read_state.lowest())
+                if seq >= read_state.position(item.category) and (categories is None or item.category in categories)
+            )
+            return personal + announcements
+
+    def _collect(self, inbox, cursor, categories):
+        streams = ((inbox.ring, inbox.personal), (self.broadcasts, inbox.announcements))
+        items = []
+        for index, (ring, read_state) in enumerate(streams):
+            start = cursor[index] if cursor else read_state.lowest()
+            items += [
+                item for seq, item in ring.since(start)
+                if (cursor or seq >= read_state.position(item.category))
+                and (categories is None or item.category in categories)
+            ]
+        items.sort(key=lambda item: item.created_at)
+        return items, (inbox.ring.next_seq, self.broadcasts.next_seq)
+
+    def read(self, user, cursor=None, categories=None):
+        # Tanpa kursor: semua yang belum dibaca. Dengan kursor (seq pribadi, seq pengumuman) dari
+        # pembacaan sebelumnya: semua yang masuk sesudahnya. Status baca tidak diubah.
+        with self.lock:
+            return self._collect(self._inbox(user), cursor, categories)
+
+    def check(self, user, categories=None):
+        # "Sejak pemeriksaan terakhir": kembalikan notifikasi baru lalu tandai sudah dibaca
+        with self.lock:
+            inbox = self._inbox(user)
+            items, (personal_seq, broadcast_seq) = self._collect(inbox, None, categories)
+            inbox.personal.mark(personal_seq, categories)
+            inbox.announcements.mark(broadcast_seq, categories)
+            if categories is None:
+                inbox.unread.clear()
+            else:
+                for category in categories:
+                    inbox.unread.pop(category, None)
+        return items
+
+
+_default_hub = None
+
+
+def default_hub():
+    global _default_hub
+    if _default_hub is None:
+        _default_hub = NotificationHub()
+        publish_daily(_default_hub)
+    return _default_hub
@@ -0,0 +1,14 @@
+from render import View
+
+
+class NotificationsView(View):
+    kind = "notifications.inbox"
+
+    def lines(self):
+        lines = [f"\n🔔 Memeriksa notifikasi untuk pengguna '{self['username']}'...\n"]
+        if not self['items']:
+            lines.append("📭 Tidak ada notifikasi baru.")
+        else:
+            lines.append(f"📬 Kamu memiliki {self['unread']} notifikasi baru:\n")
+            lines += [f" - {item['text']}" for item in self['items']]
+        return lines
@@ -0,0 +1,89 @@
+import json
+import sys
+
+# State mengembalikan view model terstruktur; renderer mengubahnya menjadi teks konsol atau JSON
+# dan menulis satu respons dalam satu kali write.
+
+
+class View:
+    kind = "view"
+
+    def __init__(self, **data):
+        self.data = data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def lines(self):
+        return []
+
+    def to_dict(self):
+        return {"view": self.kind, **self.data}
+
+
+class Message(View):
+    # Pesan singkat satu baris; `code` untuk klien API, `text` untuk konsol
+    kind = "message"
+
+    def __init__(self, code, text, **data):
+        super().__init__(code=code, text=text, **data)
+
+    def lines(self):
+        return [self.data["text"]]
+
+
+class Screen(View):
+    # Beberapa view yang ditampilkan sebagai satu respons
+    kind = "screen"
+
+    def __init__(self, *views):
+        super().__init__()
+        self.views = [view for view in views if view is not None]
+
+    def add(self, view):
+        if view is not None:
+            self.views.append(view)
+        return view
+
+    def lines(self):
+        return [line for view in self.views for line in view.lines()]
+
+    def to_dict(self):
+        return {"view": self.kind, "views": [view.to_dict() for view in self.views]}
+
+
+class ConsoleRenderer:
+    # stream=None: pakai sys.stdout saat flush, agar redirect_stdout tetap berlaku
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.buffer = []
+
+    def render(self, view):
+        if view is not None:
+            self.buffer.extend(view.lines())
+
+    def flush(self):
+        if self.buffer:
+            text = "\n".join(self.buffer) + "\n"
+            self.buffer = []
+            (self.stream or sys.stdout).write(text)
+
+
+class JsonRenderer(ConsoleRenderer):
+    # Satu objek JSON per baris untuk setiap view
+    def render(self, view):
+        if view is not None:
+            self.buffer.append(json.dumps(view.to_dict(), ensure_ascii=False, default=str))
+
+
+_default_renderer = None
+
+
+def default_renderer():
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = ConsoleRenderer()
+    return _default_renderer
@@ -0,0 +1,155 @@
+import argparse
+import time
+from collections import Counter, defaultdict
+
+from events import TRANSITION, read_events
+from storage import data_path
+from activities_service.booking import BOOKED, WAITLISTED
+from activities_service.catalog import get_activity
+from community_service.catalog import get_community
+from sessions import DEFAULT_FACTORIES
+
+# Membangun ulang dari log kejadian: ringkasan agregat (anggota komunitas, peserta kegiatan, suka,
+# perpindahan state) atau context pengguna (state terakhir + field yang diubah kejadian domain).
+#
+#   python replay.py [--dir DIREKTORI] [--since SEQ] [--user NAMA]
+
+
+class Aggregates:
+    def __init__(self):
+        self.events = 0
+        self.last_seq = 0
+        self.by_name = Counter()
+        self.edges = Counter()                  # (layanan, dari, ke) -> jumlah
+        self.users = set()
+        self.members = defaultdict(set)         # id komunitas -> pengguna
+        self.bookings = defaultdict(set)        # id kegiatan -> pengguna terdaftar
+        self.waitlists = defaultdict(set)       # id kegiatan -> pengguna di daftar tunggu
+        self.likes = Counter()                  # nama profil -> jumlah suka
+
+    def apply(self, event):
+        self.events += 1
+        self.last_seq = event.seq
+        name, data = event.name, event.data
+        if name == TRANSITION:
+            self.edges[event.service, data["from"], data["to"]] += 1
+            return
+        self.by_name[name] += 1
+        if name == "auth.signed_up":
+            self.users.add(event.username)
+        elif name == "community.joined":
+            self.members[data["community_id"]].add(event.username)
+        elif name == "activities.booked":
+            if data["status"] == BOOKED:
+                self.bookings[data["activity_id"]].add(event.username)
+            elif data["status"] == WAITLISTED:
+                self.waitlists[data["activity_id"]].add(event.username)
+        elif name == "activities.cancelled":
+            # Pembatalan bisa dari peserta atau dari pengguna yang masih di daftar tunggu
+            self.bookings[data["activity_id"]].discard(event.username)
+            self.waitlists[data["activity_id"]].discard(event.username)
+            promoted = data.get("promoted")
+            if promoted:
+                self.waitlists[data["activity_id"]].discard(promoted)
+                self.bookings[data["activity_id"]].add(promoted)
+        elif name == "friends.liked":
+            self.likes[data["friend"]] += 1
+
+    def summary(self):
+        return {
+            "events": self.events,
+            "last_seq": self.last_seq,
+            "signups": len(self.users),
+            "domain_events": dict(self.by_name.most_common()),
+            "community_members": {community_id: len(users) for community_id, users in sorted(self.members.items())},
+            "activity_bookings": {activity_id: len(users) for activity_id, users in sorted(self.bookings.items())},
+            "activity_waitlists": {activity_id: len(users) for activity_id, users in sorted(self.waitlists.items())},
+            "most_liked": self.likes.most_common(5),
+            "top_transitions": [
+                (f"{service}: {source} → {target}", count) for (service, source, target), count in self.edges.most_common(10)
+            ],
+        }
+
+
+def _selected_community(context, data):
+    context.selected_community = get_community(data["community_id"])
+
+
+def _selected_activity(context, data):
+    context.selected_activity = get_activity(data["activity_id"])
+
+
+# Kejadian domain yang mengubah field context: nama kejadian -> fungsi(context, data). Pengaturan
+# (settings.*) tidak diputar ulang: nilainya sudah tersimpan di SettingsStore.
+FIELD_UPDATES = {
+    "auth.signed_up": lambda context, data: (setattr(context, "email", data["email"]),
+                                             setattr(context, "full_name", data["full_name"])),
+    "auth.profile_completed": lambda context, data: (setattr(context, "mode", data["mode"]),
+                                                     setattr(context, "hobbies", data["hobbies"]),
+                                                     setattr(context, "story", data["story"])),
+    "auth.onboarded": lambda context, data: setattr(context, "profile_completed", True),
+    "chat.started": lambda context, data: setattr(context, "friend_name", data["friend"]),
+    "community.selected": _selected_community,
+    "community.joined": lambda context, data: setattr(context, "joined", True),
+    "activities.selected": _selected_activity,
+}
+
+
+def rebuild_contexts(events, username=None, factories=None):
+    # {pengguna: {layanan: context}}; username membatasi ke satu pengguna
+    factories = factories if factories is not None else DEFAULT_FACTORIES
+    sessions = {}
+    for event in events:
+        if username is not None and event.username != username:
+            continue
+        if event.username is None or event.service not in factories:
+            continue
+        contexts = sessions.get(event.username)
+        if contexts is None:
+            contexts = sessions[event.username] = {}
+        context = contexts.get(event.service)
+        if context is None:
+            context = contexts[event.service] = factories[event.service](event.username)
+
+        if event.name == TRANSITION:
+            target = event.data["to"]
+            # State yang sudah diganti nama atau dihapus: pertahankan state sebelumnya, seperti load_session
+            context.state = getattr(type(context), target, context.state) if target else None
+        else:
+            update = FIELD_UPDATES.get(event.name)
+            if update is not None:
+                update(context, event.data)
+    return sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay log kejadian Silverconnect")
+    parser.add_argument("--dir", default=None, help="direktori log (bawaan: data lokal/events)")
+    parser.add_argument("--since", type=int, default=0, help="mulai setelah nomor urut ini")
+    parser.add_argument("--user", default=None, help="bangun ulang context satu pengguna")
+    args = parser.parse_args()
+    directory = args.dir or data_path("events")
+
+    started = time.perf_counter()
+    if args.user:
+        contexts = rebuild_contexts(read_events(directory, args.since), username=args.user).get(args.user, {})
+        for service, context in contexts.items():
+            fields = {field: getattr(context, field) for field in type(context).SNAPSHOT_FIELDS}
+            state = type(context.state).__name__ if context.state is not None else None
+            print(f"{service:<14} state={state} {fields}")
+        if not contexts:
+            print(f"Tidak ada kejadian untuk pengguna '{args.user}'.")
+        return
+
+    aggregates = Aggregates()
+    for event in read_events(directory, args.since):
+        aggregates.apply(event)
+    elapsed = time.perf_counter() - started
+    for key, value in aggregates.summary().items():
+        print(f"{key}: {value}")
+    print(f"Replay {aggregates.events:,} kejadian dalam {elapsed:.2f} s "
+          f"({aggregates.events / elapsed if elapsed else 0:,.0f} kejadian/detik)")
+
+
+if __name__ == "__main__":
+    main()
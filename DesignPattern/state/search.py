@@ -0,0 +1,367 @@
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from array import array
+
+from activities_service.catalog import ACTIVITIES
+from community_service.catalog import COMMUNITIES
+from friends_service.catalog import PROFILES
+
+# Pencarian teks bersama untuk komunitas, kegiatan, dan profil: indeks terbalik dengan peringkat
+# BM25, stemming ringan bahasa Indonesia, dan pelengkapan otomatis berdasarkan awalan kata.
+
+STOPWORDS = frozenset("""
+    yang dan di ke dari untuk dengan ini itu atau pada adalah dalam akan para juga sama tidak ada
+    bisa sudah agar oleh sebagai karena setiap kamu anda kami kita saya aku dia mereka nya pun
+    a an the and of to is in for with
+""".split())
+
+_WORD = re.compile(r"[0-9a-z]+")
+_VOWELS = "aeiou"
+_PARTICLES = ("lah", "kah", "tah", "pun")
+_POSSESSIVES = ("nya", "ku", "mu")
+_SUFFIXES = ("kan", "an", "i")
+MIN_STEM = 4
+
+
+def normalize(text):
+    # Huruf kecil tanpa diakritik: "Kafé" -> "kafe"
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def words(text):
+    return _WORD.findall(normalize(text))
+
+
+def _strip_suffix(word, suffixes):
+    for suffix in suffixes:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            return word[:-len(suffix)]
+    return word
+
+
+def _strip_prefix(word):
+    # Awalan umum dengan peluluhan sederhana: menulis -> tulis, menyapu -> sapu, pembaca -> baca
+    head, rest = word[:3], word[3:]
+    if word.startswith(("meng", "peng")) and len(word) - 4 >= 3:
+        return word[4:]
+    if word.startswith(("meny", "peny")) and len(word) > 4 and word[4] in _VOWELS:
+        return "s" + word[4:]
+    if head in ("mem", "pem") and len(rest) >= 3:
+        return rest if rest[0] in "bfpv" else word[2:]
+    if head in ("men", "pen") and len(rest) >= 3:
+        return "t" + rest if rest[0] in _VOWELS else rest
+    if head in ("bel", "pel") and rest.startswith("ajar"):
+        return rest
+    if head in ("ber", "per", "ter") and len(rest) >= MIN_STEM:
+        return rest
+    if word[:2] in ("me", "pe", "be", "di", "ke", "se") and len(word) - 2 >= MIN_STEM:
+        return word[2:]
+    return word
+
+
+_stems = {}
+
+
+def stem(word):
+    # Stemmer ringan (turunan Nazief-Adriani/Tala): partikel, kata ganti milik, awalan, akhiran.
+    # Tidak sempurna, tetapi dipakai sama persis saat indeks dan query sehingga kesalahannya simetris.
+    root = _stems.get(word)
+    if root is None:
+        root = word
+        if len(word) > MIN_STEM and not word.isdigit():
+            root = _strip_suffix(root, _PARTICLES)
+            root = _strip_suffix(root, _POSSESSIVES)
+            root = _strip_suffix(root, _SUFFIXES)
+            root = _strip_prefix(root)
+        if len(_stems) < 1_000_000:
+            _stems[word] = root
+    return root
+
+
+def tokenize(text):
+    return [stem(word) for word in words(text) if word not in STOPWORDS]
+
+
+class SearchIndex:
+    # Dokumen: key (mis. ("activity", 1)), judul, dan isi. Posting disimpan per term sebagai dua
+    # array (id dokumen, frekuensi). Hapus/ubah dokumen memakai tombstone (panjang dokumen = 0)
+    # dan posting dibersihkan oleh compact() saat dokumen mati sudah terlalu banyak.
+    # Indeks dipakai bersama oleh gateway (tulis dari worker pool, baca dari event loop): semua
+    # operasi memegang self.lock, karena satu penulisan mengubah beberapa array berturut-turut.
+    K1 = 1.2
+    B = 0.75
+    TITLE_BOOST = 2
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ids = {}                   # key -> id dokumen
+        self.keys = []                  # id dokumen -> key (None bila sudah dihapus)
+        self.lengths = array("I")       # id dokumen -> jumlah token (0 = dihapus)
+        self.total_length = 0
+        self.dead = 0
+
+        self.terms = {}                 # stem -> id term
+        self.postings = []              # id term -> (array id dokumen, array frekuensi)
+        self.df = array("I")            # id term -> jumlah dokumen hidup
+
+        self.vocabulary = {}            # kata asli -> id kata (untuk pelengkapan otomatis)
+        self.word_names = []
+        self.word_df = array("I")
+        self.sorted_words = []
+        self.words_dirty = False
+
+        # Term dan kata milik setiap dokumen, agar df bisa dikurangi saat dokumen dihapus
+        self.doc_terms = array("I")
+        self.doc_words = array("I")
+        self.term_spans = array("I")    # per dokumen: awal, jumlah (berpasangan)
+        self.word_spans = array("I")
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, key):
+        return key in self.ids
+
+    def _term_id(self, term):
+        term_id = self.terms.get(term)
+        if term_id is None:
+            term_id = self.terms[term] = len(self.postings)
+            self.postings.append((array("I"), array("H")))
+            self.df.append(0)
+        return term_id
+
+    def _word_id(self, word):
+        word_id = self.vocabulary.get(word)
+        if word_id is None:
+            word_id = self.vocabulary[word] = len(self.word_names)
+            self.word_names.append(word)
+            self.word_df.append(0)
+            self.words_dirty = True
+        return word_id
+
+    def add(self, key, title, body=""):
+        with self.lock:
+            return self._add(key, title, body)
+
+    def _add(self, key, title, body):
+        if key in self.ids:
+            self._remove(key)
+        doc = len(self.keys)
+        self.ids[key] = doc
+        self.keys.append(key)
+
+        counts = {}
+        surface = set()
+        length = 0
+        for text, weight in ((title, self.TITLE_BOOST), (body, 1)):
+            for word in words(text):
+                if word in STOPWORDS:
+                    continue
+                surface.add(word)
+                root = stem(word)
+                counts[root] = counts.get(root, 0) + weight
+                length += weight
+
+        self.term_spans.extend((len(self.doc_terms), len(counts)))
+        for term, count in counts.items():
+            term_id = self._term_id(term)
+            doc_ids, frequencies = self.postings[term_id]
+            doc_ids.append(doc)
+            frequencies.append(min(count, 0xFFFF))
+            self.df[term_id] += 1
+            self.doc_terms.append(term_id)
+
+        self.word_spans.extend((len(self.doc_words), len(surface)))
+        for word in surface:
+            word_id = self._word_id(word)
+            self.word_df[word_id] += 1
+            self.doc_words.append(word_id)
+
+        self.lengths.append(length)
+        self.total_length += length
+        return doc
+
+    def bulk_load(self, documents):
+        with self.lock:
+            for key, title, body in documents:
+                self._add(key, title, body)
+
+    def update(self, key, title, body=""):
+        return self.add(key, title, body)
+
+    def remove(self, key):
+        with self.lock:
+            return self._remove(key)
+
+    def _remove(self, key):
+        doc = self.ids.pop(key, None)
+        if doc is None:
+            return False
+        start, count = self.term_spans[2 * doc], self.term_spans[2 * doc + 1]
+        for term_id in self.doc_terms[start:start + count]:
+            self.df[term_id] -= 1
+        start, count = self.word_spans[2 * doc], self.word_spans[2 * doc + 1]
+        for word_id in self.doc_words[start:start + count]:
+            self.word_df[word_id] -= 1
+        self.total_length -= self.lengths[doc]
+        self.lengths[doc] = 0
+        self.keys[doc] = None
+        self.dead += 1
+        if self.dead > max(1024, len(self.ids)):
+            self._compact()
+        return True
+
+    def compact(self):
+        with self.lock:
+            self._compact()
+
+    def _compact(self):
+        # Buang dokumen yang sudah dihapus (juga versi lama dari update) dan beri nomor ulang dokumen
+        # yang tersisa dengan urutan tetap, supaya keys, lengths, dan span tidak terus tumbuh
+        keys, lengths = self.keys, self.lengths
+        remap = array("I", bytes(4 * len(keys)))
+        new_keys, new_lengths = [], array("I")
+        doc_terms, doc_words = array("I"), array("I")
+        term_spans, word_spans = array("I"), array("I")
+        for doc, key in enumerate(keys):
+            if key is None:
+                continue
+            remap[doc] = len(new_keys)
+            new_keys.append(key)
+            new_lengths.append(lengths[doc])
+            for source, spans, target, new_spans in (
+                (self.doc_terms, self.term_spans, doc_terms, term_spans),
+                (self.doc_words, self.word_spans, doc_words, word_spans),
+            ):
+                start, count = spans[2 * doc], spans[2 * doc + 1]
+                new_spans.extend((len(target), count))
+                target.extend(source[start:start + count])
+
+        for index, (doc_ids, frequencies) in enumerate(self.postings):
+            live = [(remap[doc], tf) for doc, tf in zip(doc_ids, frequencies) if keys[doc] is not None]
+            self.postings[index] = (array("I", [doc for doc, _ in live]), array("H", [tf for _, tf in live]))
+
+        self.ids = {key: doc for doc, key in enumerate(new_keys)}
+        self.keys, self.lengths = new_keys, new_lengths
+        self.doc_terms, self.doc_words = doc_terms, doc_words
+        self.term_spans, self.word_spans = term_spans, word_spans
+        self.dead = 0
+
+    def search(self, query, limit=10, kind=None):
+        # [(skor, key)] terurut dari skor tertinggi; kind membatasi jenis dokumen (key[0])
+        with self.lock:
+            return self._search(query, limit, kind)
+
+    def _search(self, query, limit, kind):
+        live = len(self.ids)
+        if not live:
+            return []
+        query_terms = {}
+        for term in tokenize(query):
+            term_id = self.terms.get(term)
+            if term_id is not None and self.df[term_id]:
+                query_terms[term_id] = query_terms.get(term_id, 0) + 1
+        if not query_terms:
+            return []
+
+        k1 = self.K1
+        base = k1 * (1 - self.B)
+        per_length = k1 * self.B * live / self.total_length
+        lengths = self.lengths
+        keys = self.keys
+        if len(query_terms) == 1:
+            # Satu term: skor langsung dari posting tanpa dict akumulator (kata umum punya jutaan posting)
+            (term_id, repeats), = query_terms.items()
+            df = self.df[term_id]
+            weight = repeats * (k1 + 1) * math.log(1 + (live - df + 0.5) / (df + 0.5))
+            doc_ids, frequencies = self.postings[term_id]
+            candidates = (
+                (weight * tf / (tf + base + per_length * lengths[doc]), doc)
+                for doc, tf in zip(doc_ids, frequencies)
+                if lengths[doc] and (kind is None or keys[doc][0] == kind)
+            )
+            return [(score, keys[doc]) for score, doc in heapq.nlargest(limit, candidates)]
+
+        scores = {}
+        get = scores.get
+        for term_id, repeats in query_terms.items():
+            df = self.df[term_id]
+            weight = repeats * (k1 + 1) * math.log(1 + (live - df + 0.5) / (df + 0.5))
+            doc_ids, frequencies = self.postings[term_id]
+            for doc, tf in zip(doc_ids, frequencies):
+                length = lengths[doc]
+                if length:
+                    scores[doc] = get(doc, 0.0) + weight * tf / (tf + base + per_length * length)
+
+        if kind is not None:
+            candidates = ((score, doc) for doc, score in scores.items() if keys[doc][0] == kind)
+        else:
+            candidates = ((score, doc) for doc, score in scores.items())
+        return [(score, keys[doc]) for score, doc in heapq.nlargest(limit, candidates)]
+
+    def complete(self, prefix, limit=8):
+        # Saran untuk kata terakhir yang sedang diketik, diurutkan dari yang paling banyak dipakai
+        typed = words(prefix)
+        if not typed or not prefix[-1:].isalnum():
+            return []
+        with self.lock:
+            return self._complete(typed, limit)
+
+    def _complete(self, typed, limit):
+        head, partial = typed[:-1], typed[-1]
+        if self.words_dirty:
+            self.sorted_words = sorted(self.vocabulary)
+            self.words_dirty = False
+        start = bisect.bisect_left(self.sorted_words, partial)
+        end = bisect.bisect_left(self.sorted_words, partial + "\uffff", start)
+        vocabulary, word_df = self.vocabulary, self.word_df
+        ranked = heapq.nsmallest(
+            limit,
+            ((-word_df[vocabulary[word]], word) for word in self.sorted_words[start:end]
+             if word_df[vocabulary[word]]),
+        )
+        return [" ".join(head + [word]) for _, word in ranked]
+
+
+def ranked(index, query, kind, items):
+    # Saring dan urutkan daftar katalog (dict dengan "id") menurut hasil pencarian
+    by_id = {item["id"]: item for item in items}
+    hits = index.search(query, limit=max(len(by_id), 1), kind=kind)
+    return [by_id[key[1]] for _, key in hits if key[1] in by_id]
+
+
+def community_document(community):
+    return ("community", community["id"]), community["name"], community.get("description", "")
+
+
+def activity_document(activity):
+    body = " ".join((activity.get("description", ""), activity.get("location", "")))
+    return ("activity", activity["id"]), activity["name"], body
+
+
+def profile_document(profile):
+    # Profil teman (description) maupun akun lansia (story) dengan minatnya
+    interests = profile.get("interest") or profile.get("hobbies") or []
+    body = " ".join([profile.get("description") or profile.get("story") or "", *interests])
+    name = profile.get("name") or profile.get("username")
+    return ("profile", name), profile.get("full_name") or name, body
+
+
+_default_index = None
+
+
+def default_search_index():
+    global _default_index
+    if _default_index is None:
+        _default_index = SearchIndex()
+        _default_index.bulk_load(community_document(community) for community in COMMUNITIES)
+        _default_index.bulk_load(activity_document(activity) for activity in ACTIVITIES)
+        _default_index.bulk_load(profile_document(profile) for profile in PROFILES)
+    return _default_index
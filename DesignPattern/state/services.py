@@ -0,0 +1,103 @@
+import importlib
+import threading
+
+# Registry layanan: context dicari lewat nama layanan dan modulnya baru diimpor saat pertama
+# dipakai, jadi proses yang hanya butuh auth dan chat tidak ikut memuat enam layanan lainnya.
+# State context juga dibuat saat pertama diakses (LazyState), bukan saat kelasnya didefinisikan.
+
+# Nama layanan (= SERVICE pada kelas context) -> "modul:Kelas"
+SERVICES = {
+    "auth": "auth_service.context:AuthContext",
+    "dashboard": "dashboard_service.context:DashboardContext",
+    "settings": "settings_service.context:SettingsContext",
+    "friends": "friends_service.context:FriendContext",
+    "chat": "chat_service.context:ChatContext",
+    "community": "community_service.context:CommunityContext",
+    "activities": "activities_service.context:ActivityContext",
+    "notifications": "notifications_service.context:NotificationContext",
+}
+
+
+class UnknownServiceError(KeyError):
+    pass
+
+
+def load(target):
+    module, _, name = target.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+class ServiceRegistry:
+    def __init__(self, services=None):
+        self.services = dict(services if services is not None else SERVICES)
+        self.classes = {}       # nama layanan -> kelas context yang sudah dimuat
+
+    def names(self):
+        return list(self.services)
+
+    def register(self, name, target):
+        self.services[name] = target
+        self.classes.pop(name, None)
+
+    def loaded(self):
+        return list(self.classes)
+
+    def context_class(self, name):
+        cls = self.classes.get(name)
+        if cls is None:
+            target = self.services.get(name)
+            if target is None:
+                raise UnknownServiceError(name)
+            # import_module sudah aman dipanggil dari banyak thread
+            cls = self.classes[name] = load(target)
+        return cls
+
+    def create(self, name, username="", **options):
+        return self.context_class(name)(username=username, **options)
+
+
+_state_lock = threading.Lock()
+
+
+class LazyState:
+    # Atribut state pada kelas context. Akses pertama (state awal di __init__ atau transisi pertama
+    # ke state ini) mengimpor kelasnya dan membuat objeknya, lalu objek itu menggantikan descriptor
+    # ini di kelas: akses berikutnya atribut kelas biasa, tanpa biaya tambahan.
+    __slots__ = ("target", "owner", "name")
+
+    def __init__(self, target):
+        self.target = target
+        self.owner = None
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    @property
+    def state_class(self):
+        return load(self.target)
+
+    def __get__(self, instance, owner=None):
+        state_class = self.state_class      # impor di luar lock
+        with _state_lock:
+            # Thread lain mungkin sudah lebih dulu membuatnya: semua harus memakai objek yang sama
+            state = vars(self.owner)[self.name]
+            if state is self:
+                state = state_class()
+                setattr(self.owner, self.name, state)
+        return state
+
+
+_default_registry = None
+
+
+def default_registry():
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ServiceRegistry()
+    return _default_registry
+
+
+def create_context(name, username="", **options):
+    return default_registry().create(name, username, **options)
@@ -0,0 +1,267 @@
+import functools
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from codec import CodecError, encode_value, decode_value, write_varint, read_varint, write_str, read_str
+from events import state_names
+from storage import data_path
+from activities_service.catalog import get_activity
+from community_service.catalog import get_community
+from services import SERVICES, create_context
+
+# Sesi pengguna = kumpulan context per layanan. Sesi yang jarang dipakai dikeluarkan dari memori
+# (LRU) dan disimpan sebagai snapshot biner ringkas: nama state + nilai SNAPSHOT_FIELDS context,
+# bukan pickle seluruh objek. Layanan bersama (hub, broker, mesin booking, indeks) tidak ikut disimpan.
+
+SNAPSHOT_VERSION = 1
+
+# Context layanan dibuat lewat registry, jadi modul layanan baru dimuat saat sesi pertama memakainya
+DEFAULT_FACTORIES = {name: functools.partial(create_context, name) for name in SERVICES}
+
+
+# Field yang berisi entri katalog cukup disimpan sebagai id-nya dan dibaca ulang dari katalog
+CATALOG_FIELDS = {
+    "selected_activity": get_activity,
+    "selected_community": get_community,
+}
+
+
+class SnapshotError(CodecError):
+    pass
+
+
+def state_name(context):
+    return state_names(type(context)).get(type(context.state)) if context.state is not None else None
+
+
+def dump_session(contexts):
+    out = bytearray([SNAPSHOT_VERSION])
+    write_varint(out, len(contexts))
+    for service, context in contexts.items():
+        fields = type(context).SNAPSHOT_FIELDS
+        write_str(out, service)
+        encode_value(out, state_name(context))
+        write_varint(out, len(fields))
+        for field in fields:
+            value = getattr(context, field)
+            if field in CATALOG_FIELDS and value is not None:
+                value = value["id"]
+            encode_value(out, value)
+    return bytes(out)
+
+
+def load_session(username, data, factories):
+    if not data or data[0] != SNAPSHOT_VERSION:
+        raise SnapshotError("Versi snapshot sesi tidak didukung.")
+    count, pos = read_varint(data, 1)
+    contexts = {}
+    for _ in range(count):
+        service, pos = read_str(data, pos)
+        state, pos = decode_value(data, pos)
+        field_count, pos = read_varint(data, pos)
+        values = []
+        for _ in range(field_count):
+            value, pos = decode_value(data, pos)
+            values.append(value)
+
+        factory = factories.get(service)
+        if factory is None:
+            continue
+        context = factory(username)
+        fields = type(context).SNAPSHOT_FIELDS
+        # Skema context berubah sejak snapshot dibuat: mulai dari context baru
+        if len(fields) == field_count:
+            for field, value in zip(fields, values):
+                if field in CATALOG_FIELDS and value is not None:
+                    value = CATALOG_FIELDS[field](value)
+                setattr(context, field, value)
+            if state is not None:
+                context.state = getattr(type(context), state, context.state)
+        contexts[service] = context
+    return contexts
+
+
+class SessionStore:
+    # Snapshot sesi di SQLite: satu baris per pengguna
+    SCHEMA = "CREATE TABLE IF NOT EXISTS sessions (username TEXT PRIMARY KEY, snapshot BLOB NOT NULL) WITHOUT ROWID"
+    UPSERT = "INSERT OR REPLACE INTO sessions (username, snapshot) VALUES (?, ?)"
+    SELECT = "SELECT snapshot FROM sessions WHERE username = ?"
+    DELETE = "DELETE FROM sessions WHERE username = ?"
+    COUNT = "SELECT COUNT(*), COALESCE(SUM(LENGTH(snapshot)), 0) FROM sessions"
+
+    def __init__(self, path=None):
+        self.path = path or data_path("sessions.db")
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(self.SCHEMA)
+
+    def save_many(self, rows):
+        with self.lock:
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.executemany(self.UPSERT, rows)
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def load(self, username):
+        with self.lock:
+            row = self.connection.execute(self.SELECT, (username,)).fetchone()
+        return row[0] if row else None
+
+    def delete(self, username):
+        with self.lock:
+            self.connection.execute(self.DELETE, (username,))
+
+    def stats(self):
+        # (jumlah snapshot, total byte)
+        with self.lock:
+            return self.connection.execute(self.COUNT).fetchone()
+
+    def close(self):
+        self.connection.close()
+
+
+class Session:
+    __slots__ = ("username", "contexts", "users")
+
+    def __init__(self, username, contexts=None):
+        self.username = username
+        self.contexts = contexts if contexts is not None else {}
+        self.users = 0                  # jumlah pemakai yang sedang memegang sesi (lihat acquire)
+
+
+class SessionManager:
+    def __init__(self, capacity=100_000, store=None, factories=None, spill_batch=256):
+        self.capacity = capacity
+        self.store = store if store is not None else SessionStore()
+        self.factories = factories if factories is not None else DEFAULT_FACTORIES
+        self.spill_batch = spill_batch
+        self.live = OrderedDict()       # username -> Session, urutan LRU (paling lama di depan)
+        self.pending = {}               # username -> snapshot yang belum ditulis ke store
+        self.lock = threading.RLock()
+        self.hits = self.restores = self.created = self.evictions = 0
+
+    def __len__(self):
+        return len(self.live)
+
+    def __contains__(self, username):
+        return username in self.live
+
+    def session(self, username):
+        with self.lock:
+            session = self._session(username)
+            self._shrink()
+            return session
+
+    def _session(self, username):
+        session = self.live.get(username)
+        if session is not None:
+            self.live.move_to_end(username)
+            self.hits += 1
+            return session
+
+        data = self.pending.pop(username, None)
+        if data is None:
+            data = self.store.load(username)
+        if data is not None:
+            session = Session(username, load_session(username, data, self.factories))
+            self.restores += 1
+        else:
+            session = Session(username)
+            self.created += 1
+        self.live[username] = session
+        return session
+
+    def get(self, username, service):
+        # Context layanan milik pengguna; dibuat saat pertama kali dipakai. Dibuat di bawah lock
+        # supaya dua request bersamaan tidak membuat dua context dan salah satunya hilang.
+        with self.lock:
+            session = self._session(username)
+            context = session.contexts.get(service)
+            if context is None:
+                factory = self.factories.get(service)
+                if factory is None:
+                    raise KeyError(f"Layanan '{service}' tidak dikenal.")
+                context = session.contexts[service] = factory(username)
+            self._shrink()
+            return context
+
+    def acquire(self, username):
+        # Sematkan sesi selama dipakai: sesi dengan users > 0 tidak dikeluarkan dari memori, jadi
+        # snapshot tidak diambil di tengah request dan perubahan state-nya tidak hilang
+        with self.lock:
+            session = self._session(username)
+            session.users += 1
+            self._shrink()
+            return session
+
+    def release(self, session):
+        with self.lock:
+            session.users -= 1
+            if not session.users:
+                self._shrink()
+
+    @contextmanager
+    def pinned(self, username):
+        session = self.acquire(username)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def _shrink(self):
+        while len(self.live) > self.capacity and self._evict():
+            pass
+
+    def _evict(self):
+        # Keluarkan sesi paling lama yang tidak sedang dipakai; False bila semuanya sedang dipakai
+        for username, session in self.live.items():
+            if not session.users:
+                break
+        else:
+            return False
+        del self.live[username]
+        self.evictions += 1
+        if session.contexts:
+            self.pending[username] = dump_session(session.contexts)
+            if len(self.pending) >= self.spill_batch:
+                self.flush()
+        return True
+
+    def discard(self, username):
+        with self.lock:
+            self.live.pop(username, None)
+            self.pending.pop(username, None)
+            self.store.delete(username)
+
+    def flush(self):
+        with self.lock:
+            if self.pending:
+                self.store.save_many(list(self.pending.items()))
+                self.pending.clear()
+
+    def close(self):
+        # Simpan semua sesi yang masih hidup agar bisa dipulihkan setelah restart
+        with self.lock:
+            while self.live:
+                username, session = self.live.popitem(last=False)
+                if session.contexts:
+                    self.pending[username] = dump_session(session.contexts)
+            self.flush()
+            self.store.close()
+
+
+_default_manager = None
+
+
+def default_session_manager():
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = SessionManager()
+    return _default_manager
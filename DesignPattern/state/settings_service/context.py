@@ -1,17 +1,58 @@
-from settings_service.states import FontSettingsState, ThemeSettingsState
+from render import default_renderer
+from events import default_event_log
+from metrics import instrumented
+from console import default_input
+from services import LazyState
+from settings_service.store import default_settings_store
 
+@instrumented
 class SettingsContext:
-    def __init__(self, username=""):
-        self.username = username
-        self.font_size = "Medium"
-        self.theme = "Light"
+    font_state = LazyState("settings_service.states:FontSettingsState")
+    theme_state = LazyState("settings_service.states:ThemeSettingsState")
+
+    __slots__ = ("username", "input_provider", "renderer", "settings", "events", "state")
+    # Pengaturan disimpan sendiri oleh SettingsStore, bukan lewat snapshot sesi
+    SNAPSHOT_FIELDS = ()
+    SERVICE = "settings"
 
-        self.font_state = FontSettingsState(self)
-        self.theme_state = ThemeSettingsState(self)
+    def __init__(self, username="", input_provider=None, renderer=None, events=None, settings=None):
+        self.username = username
+        self.input_provider = input_provider if input_provider is not None else default_input()
+        self.renderer = renderer if renderer is not None else default_renderer()
+        self.events = events if events is not None else default_event_log()
+        self.settings = settings if settings is not None else default_settings_store()
         self.state = self.font_state
 
+    @property
+    def font_size(self):
+        return self.settings.get(self.username, "font_size")
+
+    @font_size.setter
+    def font_size(self, value):
+        self.settings.set(self.username, "font_size", value)
+
+    @property
+    def theme(self):
+        return self.settings.get(self.username, "theme")
+
+    @theme.setter
+    def theme(self, value):
+        self.settings.set(self.username, "theme", value)
+
     def set_state(self, state):
+        self.events.transition(self, state)
         self.state = state
 
+    def show(self, view):
+        self.renderer.render(view)
+
+    def ask(self, prompt=""):
+        # Output yang tertunda harus tampil sebelum prompt
+        self.renderer.flush()
+        return self.input_provider.ask(prompt)
+
     def request(self):
-        self.state.handle()
+        view = self.state.handle(self)
+        self.renderer.render(view)
+        self.renderer.flush()
+        return view
@@ -1,29 +1,31 @@
 from abc import ABC, abstractmethod
 
+from render import Message
+from settings_service.store import FONT_SIZES, THEMES
+
 class SettingsState(ABC):
-    def __init__(self, context):
-        self.context = context
+    __slots__ = ()
 
     @abstractmethod
-    def handle(self):
+    def handle(self, context):
         pass
 
 class FontSettingsState(SettingsState):
-    def handle(self):
-        print(f"[Pengaturan] Ukuran font saat ini: {self.context.font_size}")
-        choice = input("Pilih ukuran font (Kecil / Sedang / Besar): ")
-        if choice in ["Kecil", "Sedang", "Besar"]:
-            self.context.font_size = choice
-            print(f"[✓] Ukuran font berhasil diubah menjadi {choice}")
-        else:
-            print("[!] Input tidak valid. Tidak ada perubahan yang dilakukan.")
+    def handle(self, context):
+        context.show(Message("settings.font", f"[Pengaturan] Ukuran font saat ini: {context.font_size}"))
+        choice = context.ask("Pilih ukuran font (Kecil / Sedang / Besar): ")
+        if choice in FONT_SIZES:
+            context.font_size = choice
+            context.events.emit(context, "settings.font_changed", font_size=choice)
+            return Message("settings.font_changed", f"[✓] Ukuran font berhasil diubah menjadi {choice}", font_size=choice)
+        return Message("settings.invalid", "[!] Input tidak valid. Tidak ada perubahan yang dilakukan.")
 
 class ThemeSettingsState(SettingsState):
-    def handle(self):
-        print(f"[Pengaturan] Tema saat ini: {self.context.theme}")
-        choice = input("Pilih tema (Terang / Gelap): ")
-        if choice in ["Terang", "Gelap"]:
-            self.context.theme = choice
-            print(f"[✓] Tema berhasil diubah ke mode {choice}.")
-        else:
-            print("[!] Input tidak valid. Tidak ada perubahan yang dilakukan.")
+    def handle(self, context):
+        context.show(Message("settings.theme", f"[Pengaturan] Tema saat ini: {context.theme}"))
+        choice = context.ask("Pilih tema (Terang / Gelap): ")
+        if choice in THEMES:
+            context.theme = choice
+            context.events.emit(context, "settings.theme_changed", theme=choice)
+            return Message("settings.theme_changed", f"[✓] Tema berhasil diubah ke mode {choice}.", theme=choice)
+        return Message("settings.invalid", "[!] Input tidak valid. Tidak ada perubahan yang dilakukan.")
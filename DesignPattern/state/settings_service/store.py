@@ -0,0 +1,202 @@
+import sqlite3
+import threading
+import weakref
+from types import MappingProxyType
+
+from storage import data_path
+
+# Pilihan yang sah untuk setiap pengaturan; nilai pertama di DEFAULTS dipakai pengguna baru
+FONT_SIZES = ("Kecil", "Sedang", "Besar")
+THEMES = ("Terang", "Gelap")
+CHOICES = {
+    "font_size": FONT_SIZES,
+    "theme": THEMES,
+}
+DEFAULTS = {
+    "font_size": "Sedang",
+    "theme": "Terang",
+}
+
+
+class InvalidSettingError(ValueError):
+    pass
+
+
+def validate(name, value):
+    choices = CHOICES.get(name)
+    if choices is None:
+        raise InvalidSettingError(f"Pengaturan '{name}' tidak dikenal.")
+    if value not in choices:
+        raise InvalidSettingError(f"Nilai '{value}' tidak valid untuk {name} (pilihan: {' / '.join(choices)}).")
+    return value
+
+
+class LiveSettings:
+    # Pengaturan satu pengguna yang selalu terbaru: store mengisi ulang atributnya saat pengaturan
+    # berubah, jadi renderer cukup membaca atribut tanpa bertanya ke store setiap kali tampil
+    __slots__ = tuple(CHOICES) + ("__weakref__",)
+
+    def style(self):
+        return {name: getattr(self, name) for name in CHOICES}
+
+
+class Subscription:
+    __slots__ = ("store", "user", "callback")
+
+    def __init__(self, store, user, callback):
+        self.store = store
+        self.user = user
+        self.callback = callback
+
+    def cancel(self):
+        self.store.unsubscribe(self)
+
+
+class SettingsStore:
+    # Pengaturan per pengguna berlapis di atas default bersama. Pengguna yang belum mengubah apa pun
+    # tidak punya entri sama sekali dan membaca mapping default yang sama; pengguna dengan override
+    # punya satu mapping lengkap yang diganti utuh saat berubah (copy-on-write), jadi pembaca tidak
+    # perlu lock. Override disimpan di SQLite, satu baris per (pengguna, pengaturan).
+    SCHEMA = ("CREATE TABLE IF NOT EXISTS settings (username TEXT NOT NULL, name TEXT NOT NULL, "
+              "value TEXT NOT NULL, PRIMARY KEY (username, name)) WITHOUT ROWID")
+    UPSERT = "INSERT OR REPLACE INTO settings (username, name, value) VALUES (?, ?, ?)"
+    DELETE = "DELETE FROM settings WHERE username = ? AND name = ?"
+    DELETE_USER = "DELETE FROM settings WHERE username = ?"
+    SELECT_ALL = "SELECT username, name, value FROM settings"
+
+    def __init__(self, path=None, defaults=None):
+        self.defaults = dict(DEFAULTS)
+        for name, value in (defaults or {}).items():
+            self.defaults[name] = validate(name, value)
+        self.default_view = MappingProxyType(self.defaults)
+        self.overrides = {}             # username -> mapping lengkap (default + override)
+        self.live_views = weakref.WeakValueDictionary()
+        self.listeners = ()             # (Subscription, ...) untuk semua pengguna
+        self.user_listeners = {}        # username -> (Subscription, ...)
+        self.lock = threading.Lock()
+
+        self.path = path or data_path("settings.db")
+        self.connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(self.SCHEMA)
+        self._load()
+
+    def _load(self):
+        stored = {}
+        for username, name, value in self.connection.execute(self.SELECT_ALL):
+            # Baris dengan pilihan yang sudah tidak berlaku diabaikan: pengguna kembali ke default
+            if value in CHOICES.get(name, ()) and value != self.defaults[name]:
+                stored.setdefault(username, dict(self.defaults))[name] = value
+        self.overrides = {username: MappingProxyType(values) for username, values in stored.items()}
+
+    def __len__(self):
+        # Jumlah pengguna yang punya override
+        return len(self.overrides)
+
+    def settings(self, username):
+        return self.overrides.get(username, self.default_view)
+
+    def get(self, username, name):
+        return self.overrides.get(username, self.default_view)[name]
+
+    def get_many(self, usernames):
+        # Baca massal untuk render (daftar teman, anggota komunitas): satu lookup dict per pengguna
+        overrides, default_view = self.overrides, self.default_view
+        return {username: overrides.get(username, default_view) for username in usernames}
+
+    def values(self, usernames, name):
+        overrides, default = self.overrides, self.defaults[name]
+        return [overrides[username][name] if username in overrides else default for username in usernames]
+
+    def set(self, username, name, value):
+        validate(name, value)
+        with self.lock:
+            current = self.overrides.get(username, self.default_view)
+            if current[name] == value:
+                return False
+            values = dict(current)
+            values[name] = value
+            if values == self.defaults:
+                del self.overrides[username]
+                self.connection.execute(self.DELETE_USER, (username,))
+            else:
+                self.overrides[username] = MappingProxyType(values)
+                if value == self.defaults[name]:
+                    self.connection.execute(self.DELETE, (username, name))
+                else:
+                    self.connection.execute(self.UPSERT, (username, name, value))
+            self._changed(username, name, value)
+        self._notify(username, name, value)
+        return True
+
+    def reset(self, username):
+        with self.lock:
+            current = self.overrides.pop(username, None)
+            if current is None:
+                return False
+            self.connection.execute(self.DELETE_USER, (username,))
+            changed = [(name, value) for name, value in self.defaults.items() if current[name] != value]
+            for name, value in changed:
+                self._changed(username, name, value)
+        for name, value in changed:
+            self._notify(username, name, value)
+        return True
+
+    def _changed(self, username, name, value):
+        # Dipanggil di dalam lock, supaya live() tidak membuat salinan dari mapping yang sudah lama
+        view = self.live_views.get(username)
+        if view is not None:
+            setattr(view, name, value)
+
+    def _notify(self, username, name, value):
+        # Di luar lock: pelanggan boleh membaca atau mengubah pengaturan lagi
+        for subscription in self.listeners + self.user_listeners.get(username, ()):
+            subscription.callback(username, name, value)
+
+    def live(self, username):
+        view = self.live_views.get(username)
+        if view is None:
+            with self.lock:
+                view = self.live_views.get(username)
+                if view is None:
+                    view = LiveSettings()
+                    for name, value in self.settings(username).items():
+                        setattr(view, name, value)
+                    self.live_views[username] = view
+        return view
+
+    def subscribe(self, callback, username=None):
+        # callback(username, nama, nilai) dipanggil setelah setiap perubahan; username=None berarti
+        # semua pengguna. Daftar pelanggan diganti utuh, jadi _notify membacanya tanpa lock.
+        subscription = Subscription(self, username, callback)
+        with self.lock:
+            if username is None:
+                self.listeners += (subscription,)
+            else:
+                self.user_listeners[username] = self.user_listeners.get(username, ()) + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            if subscription.user is None:
+                self.listeners = tuple(s for s in self.listeners if s is not subscription)
+                return
+            remaining = tuple(s for s in self.user_listeners.get(subscription.user, ()) if s is not subscription)
+            if remaining:
+                self.user_listeners[subscription.user] = remaining
+            else:
+                self.user_listeners.pop(subscription.user, None)
+
+    def close(self):
+        self.connection.close()
+
+
+_default_store = None
+
+
+def default_settings_store():
+    global _default_store
+    if _default_store is None:
+        _default_store = SettingsStore()
+    return _default_store
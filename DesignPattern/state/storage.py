@@ -0,0 +1,12 @@
+import os
+import tempfile
+
+# Lokasi data lokal bersama untuk semua service; bisa diganti lewat SILVERCONNECT_DATA
+DATA_ENV = "SILVERCONNECT_DATA"
+
+
+def data_path(*parts):
+    base = os.environ.get(DATA_ENV) or os.path.join(tempfile.gettempdir(), "silverconnect")
+    path = os.path.join(base, *parts)
+    os.makedirs(os.path.dirname(path) if os.path.splitext(path)[1] else path, exist_ok=True)
+    return path
@@ -0,0 +1,155 @@
+# Uji beban lokal untuk gateway: menjalankan main.py sebagai subproses, lalu banyak koneksi
+# keep-alive mengirim request secara pipelined. Melaporkan request/detik dan latensi ekor.
+#
+#   python SoftwareArchitecture/loadtest.py [--connections 32] [--pipeline 4] [--duration 10]
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# (bobot, metode, path, body) — campuran request seorang lansia yang sedang aktif
+WORKLOAD = [
+    (20, "GET", "/dashboard", None),
+    (15, "GET", "/friends?interest=Yoga", None),
+    (15, "GET", "/friends/Diana", None),
+    (10, "GET", "/friends/recommendations", None),
+    (15, "GET", "/notifications", None),
+    (10, "GET", "/activities", None),
+    (5, "GET", "/communities", None),
+    (5, "POST", "/chat/Diana", {"text": "Halo Diana, apa kabar?"}),
+    (5, "GET", "/settings", None),
+]
+
+
+def encode(method, path, token, body=None):
+    payload = json.dumps(body).encode() if body is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(payload)}\r\n"
+    if token is not None:
+        head += f"Authorization: Bearer {token}\r\n"
+    if body is not None:
+        head += "Content-Type: application/json\r\n"
+    return head.encode() + b"\r\n" + payload
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def call(host, port, method, path, token, body=None):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode(method, path, token, body))
+    status, payload = await read_response(reader)
+    writer.close()
+    return status, json.loads(payload)
+
+
+async def client(host, port, token, pipeline, deadline, rng, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    weights = [item[0] for item in WORKLOAD]
+    try:
+        while time.perf_counter() < deadline:
+            batch = rng.choices(WORKLOAD, weights, k=pipeline)
+            sent = time.perf_counter()
+            writer.write(b"".join(encode(method, path, token, body) for _, method, path, body in batch))
+            await writer.drain()
+            for _ in batch:
+                status, _ = await read_response(reader)
+                latencies.append(time.perf_counter() - sent)
+                statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def load(host, port, args):
+    rng = random.Random(args.seed)
+    users = [f"lansia{index}" for index in range(args.connections)]
+
+    # Persiapan (tidak diukur): daftar, masuk, dan isi profil untuk setiap pengguna virtual
+    started = time.perf_counter()
+    tokens = []
+    for user in users:
+        account = {"username": user, "password": "rahasia123", "confirm_password": "rahasia123",
+                   "email": f"{user}@example.com", "full_name": user.title()}
+        await call(host, port, "POST", "/auth/signup", None, account)
+        status, result = await call(host, port, "POST", "/auth/login", None,
+                                    {"username": user, "password": "rahasia123"})
+        assert status == 200 and result["views"][0]["success"], result
+        tokens.append(result["token"])
+        await call(host, port, "POST", "/auth/profile", result["token"],
+                   {"mode": "pertemanan", "hobbies": ["Yoga", "Membaca"], "story": "Halo!"})
+    print(f"Persiapan {len(users)} pengguna (daftar + masuk + profil): {time.perf_counter() - started:.1f} s")
+
+    latencies = []
+    statuses = Counter()
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, token, args.pipeline, deadline, random.Random(rng.random()), latencies, statuses)
+        for token in tokens
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    count = len(latencies)
+
+    def percentile(fraction):
+        return latencies[min(count - 1, int(fraction * count))] * 1e3
+
+    print(f"{args.connections} koneksi keep-alive, pipeline {args.pipeline}, {elapsed:.1f} s")
+    print(f"Request: {count:,} → {count / elapsed:,.0f} request/detik")
+    print(f"Latensi: p50 {percentile(0.50):.2f} ms  p90 {percentile(0.90):.2f} ms  p99 {percentile(0.99):.2f} ms  "
+          f"p99.9 {percentile(0.999):.2f} ms  maks {latencies[-1] * 1e3:.2f} ms")
+    print("Status: " + ", ".join(f"{status}×{total:,}" for status, total in sorted(statuses.items())))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji beban lokal gateway Silverconnect")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--pipeline", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = dict(os.environ, SILVERCONNECT_DATA=data_dir, PYTHONUNBUFFERED="1")
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(HERE, "main.py"), "--port", str(port), "--workers", str(args.workers)],
+            env=env, stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            print(server.stdout.readline().strip())
+            asyncio.run(load("127.0.0.1", port, args))
+        finally:
+            started = time.perf_counter()
+            server.send_signal(signal.SIGTERM)
+            code = server.wait(timeout=30)
+            print(f"Shutdown: kode keluar {code} dalam {(time.perf_counter() - started) * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
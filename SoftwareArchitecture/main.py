@@ -0,0 +1,634 @@
+# API Gateway HTTP/JSON Silverconnect di atas asyncio (hanya pustaka standar).
+# Endpoint diteruskan ke context layanan di DesignPattern/state; context per pengguna diambil dari
+# session manager sehingga state tiap pengguna bertahan antar request.
+#
+#   python SoftwareArchitecture/main.py [--host 127.0.0.1] [--port 8080] [--workers 8]
+#                                       [--no-metrics] [--metrics-file PATH] [--metrics-interval 15]
+#
+# POST /auth/login mengembalikan "token" sesi; request berikutnya mengirimnya lewat header
+# "Authorization: Bearer <token>" dan pengguna diambil dari token itu. Hanya /auth/signup, /auth/login
+# dan /auth/forgot-password yang memakai username dari body.
+# Prompt interaktif dijawab lewat "answers" di body JSON; bila jawaban kurang, respons berisi
+# "prompt" yang sedang ditanyakan dan klien cukup mengirim ulang dengan jawabannya.
+# GET /metrics mengembalikan metrik per state dalam format teks Prometheus (tanpa token).
+import argparse
+import asyncio
+import json
+import os
+import re
+import signal
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "DesignPattern", "state"))
+
+from activities_service.catalog import get_activity
+from activities_service.reminders import default_reminders
+from auth_service.tokens import default_session_tokens
+from community_service.catalog import get_community
+from metrics import default_metrics
+from search import default_search_index
+from services import create_context
+from sessions import SessionManager, state_name
+from settings_service.store import default_settings_store
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+PIPELINE_DEPTH = 16
+QUEUE_TIMEOUT = 5
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed",
+    408: "Request Timeout", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Request:
+    __slots__ = ("method", "path", "query", "headers", "body", "keep_alive")
+
+    def __init__(self, method, target, version, headers, body):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = parts.path
+        self.query = parse_qs(parts.query)
+        self.headers = headers
+        self.body = body
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            self.keep_alive = connection != "close"
+        else:
+            self.keep_alive = connection == "keep-alive"
+
+    def json(self):
+        if not self.body:
+            return {}
+        try:
+            body = json.loads(self.body)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HttpError(400, "Body harus berupa JSON yang valid.")
+        if not isinstance(body, dict):
+            raise HttpError(400, "Body JSON harus berupa objek.")
+        return body
+
+
+# --- Jembatan ke context ------------------------------------------------------------------------
+
+class PromptRequired(Exception):
+    def __init__(self, prompt):
+        super().__init__(prompt)
+        self.prompt = prompt
+
+
+class RequestInput:
+    # Jawaban prompt dari body request; kehabisan jawaban menghentikan state di prompt tersebut
+    def __init__(self, answers=()):
+        self.answers = list(answers)
+        self.prompts = []
+
+    def ask(self, prompt=""):
+        self.prompts.append(prompt.strip())
+        if not self.answers:
+            raise PromptRequired(prompt.strip())
+        return str(self.answers.pop(0))
+
+
+class ViewCollector:
+    # Renderer yang menyimpan view apa adanya untuk diserialisasi sebagai JSON
+    def __init__(self):
+        self.views = []
+
+    def render(self, view):
+        if view is not None:
+            self.views.append(view)
+
+    def flush(self):
+        pass
+
+
+def run(context, state=None, answers=(), **options):
+    collector = ViewCollector()
+    prompts = RequestInput(answers)
+    context.renderer = collector
+    if hasattr(context, "input_provider"):
+        context.input_provider = prompts
+    if state is not None:
+        context.set_state(getattr(context, state))
+    result = {"complete": True}
+    try:
+        context.request(**options)
+    except PromptRequired as pending:
+        result.update(complete=False, prompt=pending.prompt)
+    result["state"] = state_name(context)
+    result["views"] = [view.to_dict() for view in collector.views]
+    return result
+
+
+def answers_from(body, default=()):
+    answers = body.get("answers", default)
+    if not isinstance(answers, (list, tuple)):
+        raise HttpError(400, "'answers' harus berupa daftar.")
+    return answers
+
+
+def query_value(query, name, convert=str, default=None):
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        return convert(values[-1])
+    except ValueError:
+        raise HttpError(400, f"Parameter '{name}' tidak valid.")
+
+
+def flag(value):
+    return value.lower() in ("1", "true", "ya", "y")
+
+
+def bearer_token(headers):
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    return token.strip() if scheme.lower() == "bearer" else None
+
+
+# --- Rute ----------------------------------------------------------------------------------------
+
+ROUTES = []
+
+# Field akun yang diisi LoginState dan disalin ke sesi setelah login berhasil
+LOGIN_FIELDS = ("email", "full_name", "mode", "hobbies", "story")
+
+
+def route(method, pattern, blocking=False, public=False, anonymous=False):
+    # blocking: dijalankan di worker pool (hash kata sandi, I/O berkas); public: pengguna dari body,
+    # tanpa token; anonymous: tanpa pengguna sama sekali (endpoint operasional)
+    def register(handler):
+        ROUTES.append((method, re.compile(f"^{pattern}$"), handler, blocking, public, anonymous))
+        return handler
+    return register
+
+
+@route("POST", "/auth/signup", blocking=True, public=True)
+def signup(gateway, user, params, query, body):
+    # Belum ada token: pakai context baru, bukan sesi milik username itu (bisa saja milik orang lain)
+    auth = create_context("auth", user)
+    auth.password = body.get("password")
+    auth.confirm_password = body.get("confirm_password")
+    auth.email = body.get("email")
+    auth.full_name = body.get("full_name")
+    return run(auth, "signup_state")
+
+
+@route("POST", "/auth/profile", blocking=True)
+def profile_setup(gateway, user, params, query, body):
+    auth = gateway.sessions.get(user, "auth")
+    default = ()
+    if "mode" in body:
+        default = [body["mode"], ", ".join(body.get("hobbies") or []), body.get("story", "")]
+    return run(auth, "profile_setup_state", answers_from(body, default))
+
+
+@route("POST", "/auth/login", blocking=True, public=True)
+def login(gateway, user, params, query, body):
+    # Dicoba di context baru; sesi milik username itu baru diubah setelah kata sandinya terbukti benar
+    auth = create_context("auth", user)
+    auth.password = body.get("password")
+    result = run(auth, "login_state")
+    if auth.state is auth.onboarding_state:
+        session = gateway.sessions.get(user, "auth")
+        for field in LOGIN_FIELDS:
+            setattr(session, field, getattr(auth, field))
+        session.state = auth.state
+        result["token"] = gateway.tokens.issue(user)
+    return result
+
+
+@route("POST", "/auth/forgot-password", blocking=True, public=True)
+def forgot_password(gateway, user, params, query, body):
+    # Kata sandi sementara tidak ada di respons (lihat ForgotPasswordView); dikirim ke email pemilik
+    auth = create_context("auth", user)
+    auth.email = body.get("email")
+    return run(auth, "forgot_password_state")
+
+
+@route("GET", "/dashboard")
+def dashboard(gateway, user, params, query, body):
+    return run(gateway.sessions.get(user, "dashboard"), "dashboard_state")
+
+
+@route("GET", "/dashboard/profile")
+def dashboard_profile(gateway, user, params, query, body):
+    return run(gateway.sessions.get(user, "dashboard"), "profile_state", ["n"])
+
+
+@route("POST", "/dashboard/profile")
+def update_dashboard_profile(gateway, user, params, query, body):
+    default = ["y", body.get("full_name", ""), body.get("dob", ""), body.get("photo_url", ""),
+               ", ".join(body.get("hobbies") or [])]
+    return run(gateway.sessions.get(user, "dashboard"), "profile_state", answers_from(body, default))
+
+
+@route("GET", "/settings")
+def settings(gateway, user, params, query, body):
+    # ?user=a&user=b: pengaturan banyak pengguna sekaligus (mis. untuk menampilkan daftar anggota).
+    # Sengaja terbuka untuk semua pengguna yang login: isinya hanya preferensi tampilan (ukuran
+    # font dan tema) yang dibutuhkan untuk merender pengguna lain, bukan data pribadi.
+    store = default_settings_store()
+    users = query.get("user")
+    if users:
+        return {"complete": True, "users": {name: dict(values) for name, values in store.get_many(users).items()}}
+    return {"complete": True, "settings": dict(store.settings(user))}
+
+
+@route("PUT", "/settings/(?P<name>font|theme)", blocking=True)
+def update_settings(gateway, user, params, query, body):
+    state = "font_state" if params["name"] == "font" else "theme_state"
+    default = [body["value"]] if "value" in body else ()
+    return run(gateway.sessions.get(user, "settings"), state, answers_from(body, default))
+
+
+@route("GET", "/friends")
+def search_friends(gateway, user, params, query, body):
+    return run(
+        gateway.sessions.get(user, "friends"), "search_friends_state",
+        interest_filter=query.get("interest", []),
+        match=query_value(query, "match", default="all"),
+        min_age=query_value(query, "min_age", int),
+        max_age=query_value(query, "max_age", int),
+        page=query_value(query, "page", int, 1),
+        page_size=query_value(query, "page_size", int, 20),
+    )
+
+
+@route("GET", "/friends/recommendations")
+def recommend_friends(gateway, user, params, query, body):
+    return run(gateway.sessions.get(user, "friends"), "recommend_friends_state",
+               limit=query_value(query, "limit", int, 10))
+
+
+@route("GET", "/friends/(?P<name>[^/]+)")
+def friend_detail(gateway, user, params, query, body):
+    return run(gateway.sessions.get(user, "friends"), "friend_detail_state", friend_name=params["name"])
+
+
+@route("POST", "/friends/(?P<name>[^/]+)/(?P<action>add|like|chat)")
+def friend_action(gateway, user, params, query, body):
+    return run(gateway.sessions.get(user, "friends"), "friend_detail_state",
+               friend_name=params["name"], action=params["action"])
+
+
+@route("GET", "/chat/(?P<friend>[^/]+)", blocking=True)
+def open_chat(gateway, user, params, query, body):
+    return run(gateway.sessions.get(user, "chat"), "start_state", friend_name=params["friend"])
+
+
+@route("POST", "/chat/(?P<friend>[^/]+)", blocking=True)
+def send_chat(gateway, user, params, query, body):
+    chat = gateway.sessions.get(user, "chat")
+    chat.message = None
+    return run(chat, "send_message_state", friend_name=params["friend"], message=body.get("text"))
+
+
+@route("GET", "/communities")
+def browse_communities(gateway, user, params, query, body):
+    return run(
+        gateway.sessions.get(user, "community"), "browse_community_state",
+        answers_from(body, query.get("answer", [])),
+        nearby=query_value(query, "nearby", flag, False),
+        radius_km=query_value(query, "radius_km", float, 5),
+        query=query_value(query, "q"),
+    )
+
+
+@route("POST", "/communities/(?P<id>\\d+)/join")
+def join_community(gateway, user, params, query, body):
+    community = get_community(int(params["id"]))
+    if community is None:
+        raise HttpError(404, "Komunitas tidak ditemukan.")
+    context = gateway.sessions.get(user, "community")
+    context.selected_community = community
+    return run(context, "join_community_state", answers_from(body, ["y"]))
+
+
+@route("GET", "/activities")
+def find_activities(gateway, user, params, query, body):
+    return run(
+        gateway.sessions.get(user, "activities"), "find_activity_state",
+        answers_from(body, query.get("answer", [])),
+        nearby=query_value(query, "nearby", flag, False),
+        radius_km=query_value(query, "radius_km", float, 5),
+        query=query_value(query, "q"),
+    )
+
+
+@route("POST", "/activities/(?P<id>\\d+)/(?P<action>book|cancel)")
+def activity_booking(gateway, user, params, query, body):
+    activity = get_activity(int(params["id"]))
+    if activity is None:
+        raise HttpError(404, "Kegiatan tidak ditemukan.")
+    context = gateway.sessions.get(user, "activities")
+    context.selected_activity = activity
+    if params["action"] == "cancel":
+        return run(context, "cancel_booking_state")
+    return run(context, "book_activity_state", answers_from(body, ["y"]))
+
+
+@route("GET", "/notifications")
+def notifications(gateway, user, params, query, body):
+    categories = query_value(query, "categories")
+    return run(gateway.sessions.get(user, "notifications"), "check_notification_state",
+               categories=categories.split(",") if categories else None)
+
+
+@route("GET", "/search")
+def search(gateway, user, params, query, body):
+    text = query_value(query, "q", default="")
+    hits = default_search_index().search(text, limit=query_value(query, "limit", int, 10),
+                                         kind=query_value(query, "kind"))
+    return {"complete": True, "query": text,
+            "results": [{"kind": kind, "id": key, "score": round(score, 4)} for score, (kind, key) in hits]}
+
+
+@route("GET", "/search/complete")
+def complete(gateway, user, params, query, body):
+    prefix = query_value(query, "prefix", default="")
+    return {"complete": True, "prefix": prefix,
+            "suggestions": default_search_index().complete(prefix, query_value(query, "limit", int, 8))}
+
+
+@route("GET", "/metrics", anonymous=True)
+def export_metrics(gateway, user, params, query, body):
+    return PlainText(default_metrics().render(), "text/plain; version=0.0.4; charset=utf-8")
+
+
+# --- Server --------------------------------------------------------------------------------------
+
+class PlainText:
+    __slots__ = ("text", "content_type")
+
+    def __init__(self, text, content_type="text/plain; charset=utf-8"):
+        self.text = text
+        self.content_type = content_type
+
+
+class Connection:
+    __slots__ = ("task", "writer", "idle")
+
+    def __init__(self, task, writer):
+        self.task = task
+        self.writer = writer
+        self.idle = True
+
+
+class Gateway:
+    def __init__(self, host="127.0.0.1", port=8080, workers=8, backlog=64, sessions=None, tokens=None):
+        self.host = host
+        self.port = port
+        self.sessions = sessions if sessions is not None else SessionManager()
+        self.tokens = tokens if tokens is not None else default_session_tokens()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gateway")
+        self.worker_slots = None      # dibuat di event loop: batas pekerjaan blocking (berjalan + antre)
+        self.capacity = workers + backlog
+        self.user_locks = {}
+        self.connections = {}
+        self.closing = False
+        self.server = None
+
+    async def start(self):
+        self.worker_slots = asyncio.Semaphore(self.capacity)
+        self.server = await asyncio.start_server(self._accept, self.host, self.port, limit=MAX_HEADER_BYTES)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self, grace=10):
+        # Berhenti menerima koneksi, selesaikan request yang sedang berjalan, lalu simpan sesi
+        self.closing = True
+        self.server.close()
+        for connection in list(self.connections.values()):
+            if connection.idle:
+                connection.task.cancel()
+        tasks = [connection.task for connection in self.connections.values()]
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=grace)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.server.wait_closed()
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        self.sessions.close()
+
+    async def _accept(self, reader, writer):
+        task = asyncio.current_task()
+        self.connections[task] = connection = Connection(task, writer)
+        try:
+            await self._serve(reader, writer, connection)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            del self.connections[task]
+
+    async def _serve(self, reader, writer, connection):
+        # Pipelining: request dibaca dan diproses berurutan tanpa menunggu respons sebelumnya,
+        # respons dikirim dengan urutan yang sama oleh task pengirim
+        responses = asyncio.Queue(PIPELINE_DEPTH)
+        sender = asyncio.create_task(self._send(responses, writer))
+        try:
+            while not self.closing:
+                connection.idle = responses.empty()
+                try:
+                    request = await asyncio.wait_for(self._read(reader), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                except HttpError as error:
+                    await responses.put(self._respond(error.status, {"error": error.message}, False))
+                    break
+                finally:
+                    connection.idle = False
+                if request is None:
+                    break
+                keep_alive = request.keep_alive and not self.closing
+                await responses.put(asyncio.create_task(self._dispatch(request, keep_alive)))
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await responses.put(None)
+            await asyncio.shield(sender)
+            writer.close()
+
+    async def _send(self, responses, writer):
+        try:
+            while True:
+                item = await responses.get()
+                if item is None:
+                    return
+                writer.write(await item if isinstance(item, asyncio.Task) else item)
+                # Gabungkan respons yang sudah siap dalam satu drain
+                if responses.empty():
+                    await writer.drain()
+        except ConnectionError:
+            while not responses.empty():
+                item = responses.get_nowait()
+                if isinstance(item, asyncio.Task):
+                    item.cancel()
+
+    @staticmethod
+    async def _read(reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as error:
+            if error.partial.strip():
+                raise HttpError(400, "Request tidak lengkap.")
+            return None
+        except asyncio.LimitOverrunError:
+            raise HttpError(431, "Header terlalu besar.")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "Baris request tidak valid.")
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(400, "Transfer-Encoding chunked tidak didukung.")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HttpError(400, "Content-Length tidak valid.")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "Body terlalu besar.")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method, target, version, headers, body)
+
+    async def _dispatch(self, request, keep_alive):
+        try:
+            status, payload = 200, await self._route(request)
+        except HttpError as error:
+            status, payload = error.status, {"error": error.message}
+        except Exception:
+            traceback.print_exc()
+            status, payload = 500, {"error": "Terjadi kesalahan di server."}
+        return self._respond(status, payload, keep_alive)
+
+    async def _route(self, request):
+        allowed = False
+        for method, pattern, handler, blocking, public, anonymous in ROUTES:
+            match = pattern.match(request.path)
+            if not match:
+                continue
+            allowed = True
+            if method == request.method:
+                break
+        else:
+            raise HttpError(405 if allowed else 404, "Endpoint tidak ditemukan.")
+
+        params = {name: unquote(value) for name, value in match.groupdict().items()}
+        if anonymous:
+            return handler(self, None, params, request.query, {})
+        body = request.json()
+        if public:
+            user = body.get("username") or body.get("email")
+            if not user:
+                raise HttpError(401, "Pengguna tidak diketahui (username di body).")
+        else:
+            user = self.tokens.resolve(bearer_token(request.headers))
+            if not user:
+                raise HttpError(401, "Token sesi tidak valid atau kedaluwarsa, silakan login lagi.")
+
+        # Request milik pengguna yang sama diproses berurutan (asyncio.Lock adil/FIFO);
+        # lock dihapus setelah request terakhir pengguna itu selesai
+        entry = self.user_locks.get(user)
+        if entry is None:
+            entry = self.user_locks[user] = [asyncio.Lock(), 0]
+        lock = entry[0]
+        entry[1] += 1
+        try:
+            # Sesi disematkan selama request berjalan supaya tidak dikeluarkan (LRU) di tengah jalan
+            async with lock:
+                with self.sessions.pinned(user):
+                    if not blocking:
+                        return handler(self, user, params, request.query, body)
+                    try:
+                        await asyncio.wait_for(self.worker_slots.acquire(), QUEUE_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        raise HttpError(503, "Server sedang sibuk, coba lagi.")
+                    try:
+                        return await asyncio.get_running_loop().run_in_executor(
+                            self.executor, handler, self, user, params, request.query, body
+                        )
+                    finally:
+                        self.worker_slots.release()
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self.user_locks[user]
+
+    @staticmethod
+    def _respond(status, payload, keep_alive):
+        if isinstance(payload, PlainText):
+            body, content_type = payload.text.encode("utf-8"), payload.content_type
+        else:
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
+
+
+async def serve(host, port, workers, metrics=True, metrics_file=None, metrics_interval=15):
+    registry = default_metrics()
+    if metrics:
+        registry.expect(PromptRequired)
+        registry.enable()
+        if metrics_file:
+            registry.start_dump(metrics_file, metrics_interval)
+    # Pengingat kegiatan dikirim dari thread latar, tidak menunggu pengguna membuka notifikasi
+    reminders = default_reminders()
+    reminders.start()
+    gateway = await Gateway(host, port, workers).start()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    print(f"🌐 Gateway Silverconnect berjalan di http://{gateway.host}:{gateway.port}", flush=True)
+    await stop.wait()
+    print("⏳ Menghentikan gateway, menyelesaikan request yang tersisa...", flush=True)
+    await gateway.stop()
+    registry.stop_dump()
+    reminders.close()
+    print("👋 Gateway berhenti.", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API Gateway HTTP/JSON Silverconnect")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--no-metrics", dest="metrics", action="store_false", help="matikan metrik per state")
+    parser.add_argument("--metrics-file", default=None, help="tulis metrik Prometheus ke berkas secara berkala")
+    parser.add_argument("--metrics-interval", type=float, default=15)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.workers, args.metrics, args.metrics_file, args.metrics_interval))
+
+
+if __name__ == "__main__":
+    main()